@@ -0,0 +1,291 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from http_cache import CachingFetcher
+from page_fetchers import DEFAULT_USER_AGENT, REVIEW_MARKER, FetchedPage, create_fetcher
+from proxy_pool import ProxiedFetcher
+
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """
+    Async per-host rate limiter
+
+    Spaces out request start times so that no host sees more than
+    requests_per_second requests, independent of how many workers are running.
+    """
+
+    def __init__(self, requests_per_second=None):
+        """
+        Args:
+            requests_per_second (float): Maximum request rate per host (None = unlimited)
+        """
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_slot = {}
+        self._locks = {}
+
+    async def wait(self, url):
+        if not self.interval:
+            return
+
+        host = urlsplit(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class StopCrawl:
+    """
+    Marker returned by a handle_page callback to stop fetching later pages
+    """
+
+    def __init__(self, value=None):
+        self.value = value
+
+
+class AsyncPageFetcher:
+    """
+    Fetch many pages concurrently with a bounded pool of asyncio workers
+
+    Uses httpx.AsyncClient for the 'httpx' backend; the 'requests' backend runs
+    the pooled requests.Session in worker threads instead. With a proxy_pool,
+    each worker is pinned to its own proxy session and fetches through a
+    ProxiedFetcher in a worker thread.
+    """
+
+    def __init__(self, backend='httpx', concurrency=8, requests_per_second=None,
+                 user_agent=DEFAULT_USER_AGENT, proxy_url=None, timeout=30, proxy_pool=None, http_cache=None,
+                 domain_limiter=None, fetch_controller=None, review_marker=REVIEW_MARKER):
+        """
+        Args:
+            backend (str): 'httpx' or 'requests'
+            concurrency (int): Number of pages in flight at once
+            requests_per_second (float): Per-host rate limit (None = unlimited)
+            user_agent (str): User agent header sent with each request
+            proxy_url (str): Optional http(s) proxy URL
+            timeout (float): Per-request timeout in seconds
+            proxy_pool (ProxyPool): Rotate through sticky proxy sessions instead
+                of sending everything through proxy_url
+            http_cache (HttpCache): Serve and revalidate pages through this cache
+                (fetches then run in worker threads)
+            domain_limiter: Shared thread-safe limiter whose wait(url) is also
+                honoured, for politeness across several crawls of one domain
+            fetch_controller (FetchController): Pace, classify and retry every
+                request through it (fetches then run in worker threads; it
+                replaces domain_limiter, which it paces with if so built)
+            review_marker (str): Review markup of the site, which rules out
+                a block page (see review_fields.Locator.marker)
+        """
+        self.backend = backend
+        self.concurrency = max(1, int(concurrency))
+        self.rate_limiter = HostRateLimiter(requests_per_second)
+        self.user_agent = user_agent
+        self.proxy_url = proxy_url
+        self.timeout = timeout
+        self.proxy_pool = proxy_pool
+        self.http_cache = http_cache
+        self.domain_limiter = domain_limiter
+        self.fetch_controller = fetch_controller
+        self.review_marker = review_marker
+        self.use_async_client = (backend == 'httpx' and proxy_pool is None and http_cache is None
+                                 and fetch_controller is None)
+
+    def _open_client(self):
+        if self.use_async_client:
+            return self._open_async_client()
+        client = self._open_sync_client()
+        if self.fetch_controller is not None:
+            client = self.fetch_controller.wrap(client, self.review_marker)
+        return CachingFetcher(client, self.http_cache) if self.http_cache is not None else client
+
+    def _open_sync_client(self):
+        if self.proxy_pool is not None:
+            return ProxiedFetcher(self.proxy_pool, self.backend, review_marker=self.review_marker,
+                                  user_agent=self.user_agent,
+                                  timeout=self.timeout, pool_size=self.concurrency)
+        return create_fetcher(self.backend, user_agent=self.user_agent, proxy_url=self.proxy_url,
+                              timeout=self.timeout, pool_size=self.concurrency)
+
+    def _open_async_client(self):
+        import httpx
+        return httpx.AsyncClient(
+            headers={
+                'User-Agent': self.user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9',
+            },
+            proxy=self.proxy_url,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency,
+                                max_keepalive_connections=self.concurrency),
+        )
+
+    async def _fetch(self, client, url, worker_id=0):
+        await self.rate_limiter.wait(url)
+        if self.domain_limiter is not None and self.fetch_controller is None:
+            await asyncio.to_thread(self.domain_limiter.wait, url)
+
+        if self.proxy_pool is not None:
+            return await asyncio.to_thread(client.fetch, url, None, worker_id)
+        if not self.use_async_client:
+            return await asyncio.to_thread(client.fetch, url)
+
+        import httpx
+        started = time.perf_counter()
+        try:
+            response = await client.get(url)
+        except httpx.HTTPError as e:
+            logger.error(f"❌ Error fetching {url}: {e}")
+            return None
+
+        return FetchedPage(
+            url=str(response.url),
+            html=response.text,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            elapsed=time.perf_counter() - started,
+            backend=self.backend,
+        )
+
+    async def fetch_pages(self, urls, handle_page=None, emit_page=None):
+        """
+        Fetch all URLs and return the results in the same order as urls
+
+        Args:
+            urls (list): URLs to fetch
+            handle_page (callable): Optional handle_page(index, page) run as soon
+                as a page arrives; its return value is stored instead of the
+                page. Returning StopCrawl(value) stores value and cancels every
+                URL after this one that has not started yet. Calls run one at
+                a time in a separate thread, so parsing in handle_page does not
+                hold up the fetches in flight.
+            emit_page (callable): Optional emit_page(index, result) called in URL
+                order (in the same thread) as soon as every earlier page has
+                been emitted; results are then passed on instead of collected,
+                and only pages waiting for an earlier one are held. Returning
+                StopCrawl() ends the crawl after this page.
+
+        Returns:
+            list: One entry per URL (None for URLs that were skipped or failed).
+                An exception raised while fetching or handling a page is stored
+                as that page's result and stops the crawl after it. With
+                emit_page, nothing is returned: such an exception (or one
+                raised by emit_page) is raised once the pages before it have
+                been emitted.
+        """
+        results = [None] * len(urls) if emit_page is None else None
+        pending = {}
+        next_emit = 0
+        emit_error = None
+        queue = asyncio.Queue()
+        for index, url in enumerate(urls):
+            queue.put_nowait((index, url))
+
+        stop_index = len(urls)
+        loop = asyncio.get_running_loop()
+        handler = None
+        if handle_page or emit_page:
+            handler = ThreadPoolExecutor(max_workers=1, thread_name_prefix='handle-page')
+        client = self._open_client()
+
+        def emit_in_order(index, result):
+            # Runs in the handler thread; returns the index to stop after, if any
+            nonlocal next_emit, emit_error
+            if next_emit > len(urls):
+                return index
+            pending[index] = result
+            stop_at = index if isinstance(result, StopCrawl) else None
+            while next_emit in pending:
+                emit_index = next_emit
+                result = pending.pop(emit_index)
+                next_emit += 1
+                stopped = isinstance(result, StopCrawl)
+                value = result.value if stopped else result
+                if isinstance(value, Exception):
+                    emit_error = value
+                else:
+                    try:
+                        stopped = isinstance(emit_page(emit_index, value), StopCrawl) or stopped
+                    except Exception as e:
+                        emit_error = e
+                if stopped or emit_error is not None:
+                    next_emit = len(urls) + 1
+                    pending.clear()
+                    return emit_index
+            return stop_at
+
+        def process(index, page, error):
+            if error is None and handle_page:
+                try:
+                    page = handle_page(index, page)
+                except Exception as e:
+                    error = e
+            # Keep the pages before a failed one; the caller decides what to do with the error
+            result = StopCrawl(error) if error is not None else page
+            return result if emit_page is None else emit_in_order(index, result)
+
+        async def worker(worker_id):
+            nonlocal stop_index
+            while True:
+                try:
+                    index, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                if index > stop_index:
+                    continue
+
+                page, error = None, None
+                try:
+                    page = await self._fetch(client, url, worker_id)
+                except Exception as e:
+                    error = e
+                if handler is not None:
+                    result = await loop.run_in_executor(handler, process, index, page, error)
+                else:
+                    result = process(index, page, error)
+
+                if emit_page is not None:
+                    # The page was emitted or is waiting for an earlier one;
+                    # result is the index the crawl stops after, if any
+                    if result is not None:
+                        stop_index = min(stop_index, result)
+                    continue
+                if isinstance(result, StopCrawl):
+                    stop_index = min(stop_index, index)
+                    result = result.value
+                results[index] = result
+
+        try:
+            await asyncio.gather(*(worker(worker_id) for worker_id in range(min(self.concurrency, len(urls)))))
+        finally:
+            if handler is not None:
+                handler.shutdown()
+            if self.use_async_client:
+                await client.aclose()
+            else:
+                client.close()
+
+        if emit_page is not None:
+            if emit_error is not None:
+                raise emit_error
+            return None
+
+        # Anything past the stop point was fetched speculatively; drop it
+        for index in range(stop_index + 1, len(urls)):
+            results[index] = None
+        return results
+
+    def fetch_all(self, urls, handle_page=None, emit_page=None):
+        """
+        Synchronous wrapper around fetch_pages
+        """
+        return asyncio.run(self.fetch_pages(urls, handle_page, emit_page))
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the Levi's reviews scraper
+
+Runs scrape_all_reviews end to end against a LocalReviewServer (recorded
+fixtures or synthetic pages) and micro-benchmarks the parsing hot paths over
+thousands of review elements. Every benchmark runs in a fresh process so its
+peak RSS is its own. Examples:
+
+    python benchmark_scraper.py
+    python benchmark_scraper.py --backends requests selenium --parsers bs4 lxml --pages 50
+    python benchmark_scraper.py --fixtures recorded_pages/ --json bench.json
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from local_review_server import LocalReviewServer, generate_review_page
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_end_to_end(base_url, pages, backend, parser, concurrency):
+    """
+    Time scrape_all_reviews against the local server, writing CSV and JSON
+    """
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+    scraper = LevisReviewsScraperMultiPage(fetch_backend=backend, concurrency=concurrency,
+                                           parser_backend=parser, base_url=base_url)
+    with tempfile.TemporaryDirectory() as output_dir:
+        started = time.perf_counter()
+        scraper.scrape_all_reviews(max_pages=pages, output_file=os.path.join(output_dir, 'bench.csv'),
+                                   keep_reviews=False)
+        seconds = time.perf_counter() - started
+
+    report = scraper.metrics.report()
+    return {
+        'benchmark': f"end_to_end[{backend}, {parser}, concurrency={concurrency}]",
+        'seconds': seconds,
+        'pages': report['pages'],
+        'reviews': report['reviews'],
+        'pages_per_second': report['pages'] / seconds if seconds else None,
+        'reviews_per_second': report['reviews'] / seconds if seconds else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': {name: stats['total_seconds'] for name, stats in report['stages'].items()},
+        'webdriver_calls': report['webdriver_calls']['total'],
+        'error': str(scraper.crawl_error) if scraper.crawl_error else None,
+    }
+
+
+def _micro_setup(reviews):
+    from bs4 import BeautifulSoup
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+    html = generate_review_page(1, reviews_per_page=reviews, total_pages=1)
+    scraper = LevisReviewsScraperMultiPage()
+    return html, BeautifulSoup(html, 'html.parser'), scraper
+
+
+def bench_find_reviews(reviews, repeat):
+    """
+    find_reviews_on_page over one page holding `reviews` review elements
+    """
+    html, soup, scraper = _micro_setup(reviews)
+    found = len(scraper.find_reviews_on_page(soup))
+    seconds = _best_of(repeat, lambda: scraper.find_reviews_on_page(soup))
+    return {
+        'benchmark': 'find_reviews_on_page',
+        'seconds': seconds,
+        'reviews': found,
+        'reviews_per_second': found / seconds,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def bench_parse_review(reviews, repeat):
+    """
+    parse_review over `reviews` pre-located review elements
+    """
+    html, soup, scraper = _micro_setup(reviews)
+    elements = scraper.find_reviews_on_page(soup)
+    seconds = _best_of(repeat, lambda: [scraper.parse_review(element) for element in elements])
+    return {
+        'benchmark': 'parse_review',
+        'seconds': seconds,
+        'reviews': len(elements),
+        'reviews_per_second': len(elements) / seconds,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def legacy_parse_review(review_element):
+    """
+    The find()-per-field parse_review that review_fields.REVIEW_FIELDS replaced,
+    kept as the baseline for bench_parse_review_legacy and check_field_parity
+    """
+    import re
+
+    review_data = {}
+
+    review_text_elem = review_element.find('div', class_='f-component-text review_text_container review-track')
+    if review_text_elem:
+        paragraphs = review_text_elem.find_all('p')
+        if paragraphs:
+            review_data['review_text'] = ' '.join([p.get_text(strip=True) for p in paragraphs])
+        else:
+            review_data['review_text'] = review_text_elem.get_text(strip=True)
+    else:
+        review_data['review_text'] = "N/A"
+
+    date_rating_elem = review_element.find('div', class_='row-inline mb24px-desktop')
+    if date_rating_elem:
+        date_rating_text = date_rating_elem.get_text(strip=True)
+        date_match = re.search(r'([A-Za-z]{3} \d{1,2}, \d{4})', date_rating_text)
+        review_data['review_date'] = date_match.group(1) if date_match else "N/A"
+        rating_match = re.search(r'(\d{4})(\d+\.\d+)', date_rating_text)
+        if rating_match:
+            review_data['rating'] = float(rating_match.group(2))
+        else:
+            for num in re.findall(r'\d+\.\d+', date_rating_text):
+                if 1.0 <= float(num) <= 5.0:
+                    review_data['rating'] = float(num)
+                    break
+            else:
+                review_data['rating'] = "N/A"
+    else:
+        review_data['review_date'] = "N/A"
+        review_data['rating'] = "N/A"
+
+    name_elem = review_element.find('span', class_='avatar-name')
+    if not name_elem:
+        name_elem = review_element.find('span', class_=lambda x: x and 'author' in x if x else False)
+    review_data['reviewer_name'] = name_elem.get_text(strip=True) if name_elem else "Anonymous"
+
+    title_elem = review_element.find('div', class_='f-component-info-header')
+    review_data['review_title'] = title_elem.get_text(strip=True)[:100] if title_elem else "N/A"
+
+    recommendation_elem = review_element.find('p', class_='word-break-break-word')
+    review_data['user_recommendation'] = "N/A"
+    if recommendation_elem:
+        rec_text = recommendation_elem.get_text(strip=True)
+        if 'recommendation' in rec_text.lower():
+            review_data['user_recommendation'] = rec_text
+
+    return review_data
+
+
+def bench_parse_review_legacy(reviews, repeat):
+    """
+    legacy_parse_review over the same elements as bench_parse_review
+    """
+    html, soup, scraper = _micro_setup(reviews)
+    elements = scraper.find_reviews_on_page(soup)
+    seconds = _best_of(repeat, lambda: [legacy_parse_review(element) for element in elements])
+    return {
+        'benchmark': 'parse_review[legacy find() per field]',
+        'seconds': seconds,
+        'reviews': len(elements),
+        'reviews_per_second': len(elements) / seconds,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def check_field_parity(page_source, scraper=None):
+    """
+    Compare parse_review against legacy_parse_review for every review element on a page
+
+    Returns:
+        list: (index, legacy_review, review) tuples for every review that differs
+    """
+    from bs4 import BeautifulSoup
+
+    if scraper is None:
+        from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+        scraper = LevisReviewsScraperMultiPage()
+
+    soup = BeautifulSoup(page_source, 'html.parser')
+    mismatches = []
+    for index, element in enumerate(soup.find_all('div', class_='review-item')):
+        expected = legacy_parse_review(element)
+        actual = scraper.parse_review(element)
+        if expected != actual or list(expected) != list(actual):
+            mismatches.append((index, expected, actual))
+    return mismatches
+
+
+def bench_parse_page(reviews, repeat, parser):
+    """
+    parse_page (HTML to review dicts) with the given parser backend
+    """
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+    html = generate_review_page(1, reviews_per_page=reviews, total_pages=1)
+    scraper = LevisReviewsScraperMultiPage(parser_backend=parser)
+    parsed = len(scraper.parse_page(html, 1, 'bench'))
+    seconds = _best_of(repeat, lambda: scraper.parse_page(html, 1, 'bench'))
+    return {
+        'benchmark': f"parse_page[{parser}]",
+        'seconds': seconds,
+        'reviews': parsed,
+        'reviews_per_second': parsed / seconds,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def bench_review_memory(reviews, record_type):
+    """
+    Memory held by `reviews` parsed reviews kept as dicts or Review records
+    """
+    import tracemalloc
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+    from review_records import to_records
+
+    scraper = LevisReviewsScraperMultiPage()
+    pages = max(1, reviews // 100)
+    parsed = [scraper.parse_page(generate_review_page(page, 100, pages), page, f"/RT-P.html?page={page}")
+              for page in range(1, pages + 1)]
+    serialized = json.dumps(parsed)
+    parsed = None
+
+    def keep(pages):
+        kept = []
+        for page_reviews in pages:
+            kept.extend(to_records(page_reviews) if record_type == 'review' else page_reviews)
+        return kept
+
+    # Time the conversion untraced, then load the reviews again while tracing
+    # so their strings count towards what is kept
+    pages_loaded = json.loads(serialized)
+    started = time.perf_counter()
+    keep(pages_loaded)
+    seconds = time.perf_counter() - started
+    pages_loaded = None
+
+    tracemalloc.start()
+    kept = keep(json.loads(serialized))
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {
+        'benchmark': f"kept_reviews[{record_type}]",
+        'seconds': seconds,
+        'reviews': len(kept),
+        'reviews_per_second': len(kept) / seconds if seconds else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'held_mb': round(held / (1024 * 1024), 2),
+    }
+
+
+def run_isolated(func, *args):
+    """
+    Run one benchmark in a fresh interpreter so timings and peak RSS are independent
+    """
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(func, *args).result()
+
+
+def format_result(result):
+    parts = [f"{result['benchmark']:<48}", f"{result['seconds']:8.3f}s"]
+    if result.get('pages_per_second') is not None:
+        parts.append(f"{result['pages_per_second']:9.1f} pages/s")
+    parts.append(f"{result['reviews_per_second']:10.0f} reviews/s" if result.get('reviews_per_second') else " " * 20)
+    if result.get('peak_rss_mb') is not None:
+        parts.append(f"peak RSS {result['peak_rss_mb']:7.1f} MB")
+    if result.get('held_mb') is not None:
+        parts.append(f"held {result['held_mb']:7.2f} MB")
+    if result.get('error'):
+        parts.append(f"ERROR: {result['error']}")
+    return '  '.join(parts)
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Benchmark the scraper offline against a local review server")
+    parser.add_argument('--fixtures', default=None, help="Directory of recorded page_N.html fixtures")
+    parser.add_argument('--pages', type=int, default=20, help="Pages served and scraped end to end")
+    parser.add_argument('--reviews-per-page', type=int, default=20, help="Reviews per synthetic page")
+    parser.add_argument('--backends', nargs='+', default=['requests'], choices=['selenium', 'requests', 'httpx'])
+    parser.add_argument('--parsers', nargs='+', default=['bs4', 'lxml'], choices=['bs4', 'lxml'])
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1],
+                        help="Concurrency levels for the HTTP backends")
+    parser.add_argument('--micro-reviews', type=int, default=5000, help="Review elements for the micro benchmarks")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetitions per micro benchmark (best is kept)")
+    parser.add_argument('--skip-end-to-end', action='store_true')
+    parser.add_argument('--skip-micro', action='store_true')
+    parser.add_argument('--check-parity', action='store_true',
+                        help="Check parse_review against the legacy find() version before benchmarking")
+    parser.add_argument('--json', dest='json_file', default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+
+    results = []
+
+    def run(func, *func_args):
+        try:
+            result = run_isolated(func, *func_args)
+        except Exception as e:
+            print(f"❌ {func.__name__}{func_args}: {e}")
+            return
+        results.append(result)
+        print(format_result(result))
+
+    if args.check_parity:
+        pages = [generate_review_page(page, args.reviews_per_page, args.pages) for page in range(1, args.pages + 1)]
+        if args.fixtures:
+            server = LocalReviewServer(args.fixtures)
+            pages = [server.page_html(page).decode('utf-8') for page in sorted(server.fixtures)]
+            server.server.server_close()
+        differing = sum(len(check_field_parity(page)) for page in pages)
+        print(f"{'✅' if not differing else '❌'} parse_review parity over {len(pages)} pages: {differing} reviews differ")
+        if differing:
+            sys.exit(1)
+
+    if not args.skip_end_to_end:
+        with LocalReviewServer(args.fixtures, args.pages, args.reviews_per_page) as server:
+            print(f"End to end against {server.start_url} ({server.total_pages} pages)")
+            for backend in args.backends:
+                for parser_backend in args.parsers:
+                    levels = [1] if backend == 'selenium' else args.concurrency
+                    for concurrency in levels:
+                        run(bench_end_to_end, server.base_url, server.total_pages, backend, parser_backend, concurrency)
+
+    if not args.skip_micro:
+        print(f"\nMicro benchmarks over {args.micro_reviews} review elements (best of {args.repeat})")
+        run(bench_find_reviews, args.micro_reviews, args.repeat)
+        run(bench_parse_review_legacy, args.micro_reviews, args.repeat)
+        run(bench_parse_review, args.micro_reviews, args.repeat)
+        if len(results) >= 2 and [result['benchmark'] for result in results[-2:]] == \
+                ['parse_review[legacy find() per field]', 'parse_review']:
+            print(f"{'':<48}  parse_review speedup: {results[-1]['reviews_per_second'] / results[-2]['reviews_per_second']:.2f}x")
+        for parser_backend in args.parsers:
+            run(bench_parse_page, args.micro_reviews, args.repeat, parser_backend)
+        for record_type in ('dict', 'review'):
+            run(bench_review_memory, args.micro_reviews, record_type)
+
+    if args.json_file:
+        with open(args.json_file, 'w', encoding='utf-8') as f:
+            json.dump({'results': results, 'python': sys.version.split()[0]}, f, indent=2)
+        print(f"\nResults saved to {args.json_file}")
+
+
+if __name__ == "__main__":
+    main()
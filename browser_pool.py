@@ -0,0 +1,216 @@
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class PooledDriver:
+    """
+    A WebDriver leased from a BrowserPool, with its usage counters
+
+    Code holding a lease from BrowserPool.driver() calls note_page() for
+    every page it loads, so the pool recycles the driver on time.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.lease_pages = 0
+        self.leases = 0
+        self.created_at = time.monotonic()
+
+    def note_page(self, count=1):
+        """Count pages loaded during the current lease"""
+        self.lease_pages += count
+
+
+class BrowserPool:
+    """
+    Pool of warm Chrome WebDrivers shared across scrape_all_reviews calls
+
+    Drivers are health-checked when leased and recycled after
+    max_pages_per_driver pages to cap Chrome's memory growth, so a job that
+    scrapes many targets pays Chrome startup once per driver instead of once
+    per target.
+
+    Usage:
+        with BrowserPool(scraper.create_driver, size=2) as pool:
+            for slug in targets:
+                LevisReviewsScraperMultiPage(browser_pool=pool).scrape_all_reviews(...)
+    """
+
+    def __init__(self, driver_factory, size=2, max_pages_per_driver=200, warm=True):
+        """
+        Args:
+            driver_factory (callable): Returns a new WebDriver (e.g. scraper.create_driver)
+            size (int): Maximum number of drivers alive at once
+            max_pages_per_driver (int): Recycle a driver after this many pages
+            warm (bool): Start all drivers up front instead of on first use
+        """
+        self.driver_factory = driver_factory
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        # Idle drivers (newest last) and the capacity count, both guarded by
+        # _cond so a waiting acquire() wakes on a release *or* a discard
+        self._idle = []
+        self._cond = threading.Condition()
+        self._alive = 0
+        self._closed = False
+
+        self.created = 0
+        self.recycled = 0
+        self.unhealthy = 0
+
+        if warm:
+            for _ in range(size):
+                pooled = self._create()
+                if pooled:
+                    with self._cond:
+                        self._idle.append(pooled)
+
+    def _create(self):
+        with self._cond:
+            if self._alive >= self.size:
+                return None
+            self._alive += 1
+        return self._start()
+
+    def _start(self):
+        """Start a driver for capacity already reserved in _alive"""
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            with self._cond:
+                self._alive -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.created += 1
+            logger.info(f"Browser pool: started driver {self.created} ({self._alive}/{self.size} alive)")
+        return PooledDriver(driver)
+
+    def _discard(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._alive -= 1
+            # The freed slot lets a waiter start a replacement driver
+            self._cond.notify()
+
+    @staticmethod
+    def is_healthy(pooled):
+        """Cheap round-trip to check the browser is still responsive"""
+        try:
+            pooled.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def acquire(self, timeout=None):
+        """
+        Lease a healthy driver, starting one if the pool has spare capacity
+
+        Raises:
+            queue.Empty: If no driver became free within timeout seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Browser pool is closed")
+                    if self._idle:
+                        pooled, start = self._idle.pop(), False
+                        break
+                    if self._alive < self.size:
+                        self._alive += 1
+                        pooled, start = None, True
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Empty
+                    self._cond.wait(remaining)
+
+            if start:
+                pooled = self._start()
+            if self.is_healthy(pooled):
+                pooled.leases += 1
+                pooled.lease_pages = 0
+                return pooled
+
+            logger.warning("Browser pool: discarding unresponsive driver")
+            self.unhealthy += 1
+            self._discard(pooled)
+
+    def release(self, pooled, pages=0):
+        """
+        Return a leased driver, recycling it once it has served too many pages
+        """
+        pooled.pages += pages
+        if self._closed:
+            self._discard(pooled)
+            return
+        if pooled.pages >= self.max_pages_per_driver:
+            logger.info(f"Browser pool: recycling driver after {pooled.pages} pages")
+            self.recycled += 1
+            self._discard(pooled)
+            return
+
+        try:
+            # Don't leak one target's session state into the next
+            pooled.driver.delete_all_cookies()
+        except Exception:
+            pass
+        with self._cond:
+            if not self._closed:
+                self._idle.append(pooled)
+                self._cond.notify()
+                return
+        self._discard(pooled)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """
+        Context manager yielding a leased PooledDriver
+
+        The driver is released with the pages counted by its note_page().
+        """
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled, pages=pooled.lease_pages)
+
+    def stats(self):
+        return {
+            'size': self.size,
+            'alive': self._alive,
+            'idle': len(self._idle),
+            'created': self.created,
+            'recycled': self.recycled,
+            'unhealthy': self.unhealthy,
+        }
+
+    def close(self):
+        """
+        Quit every idle driver; drivers still leased are quit when released
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            # Waiters raise instead of blocking on a pool that will never refill
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+        logger.info("Browser pool closed")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
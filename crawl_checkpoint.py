@@ -0,0 +1,72 @@
+import json
+import logging
+import os
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlCheckpoint:
+    """
+    Progress file for long crawls, rewritten atomically after every completed page
+
+    Records the last completed page URL and page_number, how many reviews have
+    been written and the byte offset of every output file at that point, so a
+    resumed run can truncate partial output and carry on from the next page.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Checkpoint JSON file
+        """
+        self.path = path
+
+    @staticmethod
+    def path_for(output_file):
+        """Default checkpoint path for a crawl writing to output_file"""
+        return os.path.splitext(output_file)[0] + '.checkpoint.json'
+
+    def load(self):
+        """
+        Return the saved checkpoint state, or None if there is none
+        """
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+    def save(self, page_number, page_url, reviews_written, output_offsets, completed=False):
+        """
+        Atomically record progress after a completed page
+        """
+        state = {
+            'page_number': page_number,
+            'page_url': page_url,
+            'reviews_written': reviews_written,
+            'output_offsets': output_offsets,
+            'completed': completed,
+            'updated_at': datetime.now(timezone.utc).isoformat(),
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        return state
+
+    def mark_completed(self):
+        state = self.load()
+        if state and not state.get('completed'):
+            state['completed'] = True
+            self.save(state['page_number'], state['page_url'], state['reviews_written'],
+                      state['output_offsets'], completed=True)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
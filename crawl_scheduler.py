@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Crawl many review listings from site specs on shared capacity
+
+Every site in the spec file becomes one job. Jobs run on a fixed pool of
+worker threads, Selenium jobs (and HTTP jobs that fall back to Chrome) lease
+drivers from one shared BrowserPool, and all requests to the same domain go
+through one politeness queue, however many jobs target it. Example:
+
+    python crawl_scheduler.py sites.yaml --workers 16 --browsers 4 --output-dir nightly/
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from site_specs import load_site_specs, registrable_domain
+
+logger = logging.getLogger(__name__)
+
+
+class DomainRateLimiter:
+    """
+    Thread-safe per-domain politeness queue
+
+    Each domain has a minimum interval between requests. Callers reserve the
+    next free slot for the URL's domain under a lock and sleep outside it, so
+    concurrent jobs on one domain are served in arrival order while jobs on
+    other domains are never held up.
+    """
+
+    def __init__(self, default_rate=None, rates=None):
+        """
+        Args:
+            default_rate (float): Requests per second for domains without their
+                own rate (None = unlimited)
+            rates (dict): Domain -> requests per second
+        """
+        self.default_rate = default_rate
+        self.rates = dict(rates or {})
+        self._next_slot = {}
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.waited = {}
+
+    def set_rate(self, domain, requests_per_second):
+        """
+        Set a domain's rate, keeping the stricter one if it is already set
+        """
+        with self._lock:
+            current = self.rates.get(domain)
+            if current is None or (requests_per_second is not None and requests_per_second < current):
+                self.rates[domain] = requests_per_second
+
+    def wait(self, url):
+        """
+        Block until a request to url's domain is allowed
+        """
+        domain = registrable_domain(url)
+        with self._lock:
+            rate = self.rates.get(domain, self.default_rate)
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(domain, now))
+            if rate:
+                self._next_slot[domain] = slot + 1.0 / rate
+            self.requests[domain] = self.requests.get(domain, 0) + 1
+            self.waited[domain] = self.waited.get(domain, 0.0) + (slot - now)
+        if slot > now:
+            time.sleep(slot - now)
+
+    def stats(self):
+        with self._lock:
+            return {
+                domain: {'requests': count, 'waited_seconds': round(self.waited.get(domain, 0.0), 3),
+                         'rate': self.rates.get(domain, self.default_rate)}
+                for domain, count in self.requests.items()
+            }
+
+
+def interleave_by_domain(specs):
+    """
+    Order specs round-robin across domains so early workers spread over sites
+    """
+    queues = {}
+    for spec in specs:
+        queues.setdefault(spec.domain, []).append(spec)
+    ordered = []
+    while queues:
+        for domain in list(queues):
+            ordered.append(queues[domain].pop(0))
+            if not queues[domain]:
+                del queues[domain]
+    return ordered
+
+
+class CrawlScheduler:
+    """
+    Run a list of SiteSpec jobs concurrently on shared workers and browsers
+
+    Usage:
+        scheduler = CrawlScheduler(load_site_specs('sites.yaml'), workers=8, browsers=2)
+        results = scheduler.run()
+    """
+
+    def __init__(self, specs, workers=4, browsers=2, output_dir='.', default_rate=1.0, http_cache=None,
+                 use_brightdata=False, resource_blocking=True, fetch_control=False):
+        """
+        Args:
+            specs (list): SiteSpec jobs
+            workers (int): Jobs running at once
+            browsers (int): Chrome drivers shared by all jobs
+            output_dir (str): Each job writes <output_dir>/<name>.<format>
+            default_rate (float): Requests per second per domain when no spec
+                for that domain sets one (None = unlimited)
+            http_cache (HttpCache): Cache shared by the HTTP jobs
+            use_brightdata (bool): Route jobs through BrightData sessions
+            resource_blocking (bool): Block images/fonts/CSS in pooled Chrome
+            fetch_control (bool): Retry throttled, blocked and failed requests
+                with backoff and adapt each domain's rate (AIMD, starting at
+                default_rate and capped by the spec rates); one FetchController
+                is shared by all jobs, so jobs on one domain slow down together
+        """
+        self.specs = list(specs)
+        self.workers = max(1, workers)
+        self.browsers = max(1, browsers)
+        self.output_dir = output_dir
+        self.http_cache = http_cache
+        self.use_brightdata = use_brightdata
+        self.resource_blocking = resource_blocking
+        self.fetch_controller = None
+        if fetch_control:
+            from fetch_control import AdaptiveRateLimiter, FetchController
+            self.limiter = AdaptiveRateLimiter(initial_rate=default_rate or 1.0)
+            self.fetch_controller = FetchController(rate_limiter=self.limiter)
+        else:
+            self.limiter = DomainRateLimiter(default_rate)
+        for spec in self.specs:
+            if spec.requests_per_second:
+                self.limiter.set_rate(spec.domain, spec.requests_per_second)
+        self.browser_pool = None
+        self.results = []
+
+    def _create_browser_pool(self):
+        from browser_pool import BrowserPool
+        from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+        # Drivers are only started when a job first needs Chrome
+        template = LevisReviewsScraperMultiPage(use_brightdata=self.use_brightdata,
+                                                resource_blocking=self.resource_blocking or None)
+        return BrowserPool(template.create_driver, size=self.browsers, warm=False)
+
+    def run_job(self, spec):
+        """
+        Crawl one site; returns its summary (never raises)
+        """
+        from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+        started = time.perf_counter()
+        output_file = os.path.join(self.output_dir, f"{spec.name}.csv")
+        result = {'name': spec.name, 'domain': spec.domain, 'output': output_file, 'reviews': 0}
+        try:
+            scraper = LevisReviewsScraperMultiPage(
+                use_brightdata=self.use_brightdata,
+                browser_pool=self.browser_pool,
+                http_cache=self.http_cache if spec.fetch_backend != 'selenium' else None,
+                domain_limiter=self.limiter,
+                fetch_controller=self.fetch_controller,
+                **spec.scraper_kwargs()
+            )
+            scraper.scrape_all_reviews(max_pages=spec.max_pages, output_file=output_file, keep_reviews=False,
+                                       start_page=spec.start_page)
+            result['reviews'] = scraper.reviews_emitted
+            result['pages'] = scraper.metrics.pages_completed
+            result['error'] = str(scraper.crawl_error) if scraper.crawl_error else None
+        except Exception as e:
+            logger.error(f"❌ Job {spec.name} failed: {e}")
+            result['error'] = str(e)
+        result['elapsed'] = time.perf_counter() - started
+        return result
+
+    def run(self):
+        """
+        Run every job and return their summaries in completion order
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.browser_pool = self._create_browser_pool()
+        self.results = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='crawl') as executor:
+                futures = {executor.submit(self.run_job, spec): spec for spec in interleave_by_domain(self.specs)}
+                for future in as_completed(futures):
+                    result = future.result()
+                    self.results.append(result)
+                    status = f"❌ {result['error']}" if result['error'] else "✅"
+                    logger.info(f"{status} {result['name']}: {result['reviews']} reviews in {result['elapsed']:.1f}s")
+        finally:
+            self.browser_pool.close()
+        return self.results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl every site in a YAML/JSON spec file on shared capacity")
+    parser.add_argument('specs', help="Site spec file (.yaml, .yml or .json)")
+    parser.add_argument('--only', nargs='+', default=None, help="Only run the named sites")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help="Jobs running at once")
+    parser.add_argument('--browsers', type=int, default=2, help="Chrome drivers shared by all jobs")
+    parser.add_argument('--output-dir', default='crawl_output', help="Directory for the per-site outputs")
+    parser.add_argument('--default-rate', type=float, default=1.0,
+                        help="Requests per second per domain without a spec rate (0 = unlimited)")
+    parser.add_argument('--http-cache', default=None, metavar='PATH', help="SQLite HTTP cache shared by all jobs")
+    parser.add_argument('--fetch-control', action='store_true',
+                        help="Retry with backoff, adapt per-domain rates and pause failing domains")
+    parser.add_argument('--brightdata', action='store_true', help="Use BRIGHTDATA_API_KEY sessions")
+    parser.add_argument('--summary', default=None, help="Write the job summaries to this JSON file")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level, format='[%(threadName)s] %(message)s')
+
+    specs = load_site_specs(args.specs)
+    if args.only:
+        missing = set(args.only) - {spec.name for spec in specs}
+        if missing:
+            parser.error(f"Unknown sites: {sorted(missing)}")
+        specs = [spec for spec in specs if spec.name in args.only]
+
+    http_cache = None
+    if args.http_cache:
+        from http_cache import HttpCache
+        http_cache = HttpCache(args.http_cache)
+
+    scheduler = CrawlScheduler(specs, workers=args.workers, browsers=args.browsers, output_dir=args.output_dir,
+                               default_rate=args.default_rate or None, http_cache=http_cache,
+                               use_brightdata=args.brightdata, fetch_control=args.fetch_control)
+    print(f"🚀 Crawling {len(specs)} sites on {scheduler.workers} workers and {scheduler.browsers} browsers")
+    started = time.perf_counter()
+    results = scheduler.run()
+
+    failed = sorted(result['name'] for result in results if result['error'])
+    total = sum(result['reviews'] for result in results)
+    print(f"\n🎉 {total} reviews from {len(results)} sites in {time.perf_counter() - started:.1f}s")
+    for domain, stats in sorted(scheduler.limiter.stats().items()):
+        print(f"   • {domain}: {stats['requests']} requests, {stats['waited_seconds']:.1f}s politeness wait")
+    if failed:
+        print(f"⚠️  Sites with errors: {failed}")
+
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump({'sites': results, 'domains': scheduler.limiter.stats()}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import logging
+import sys
+
+from review_fields import parse_date_rating
+
+logger = logging.getLogger(__name__)
+
+
+def _has_class(class_name):
+    """XPath predicate matching one token of the class attribute (BeautifulSoup class_ semantics)"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def _has_classes(class_string):
+    """XPath predicate matching the whole class attribute, like class_='a b' in BeautifulSoup"""
+    return f"normalize-space(@class)='{class_string}'"
+
+
+# Text nodes BeautifulSoup's get_text() returns (it skips script/style/template strings)
+TEXT_NODES_XPATH = ".//text()[not(parent::script or parent::style or parent::template)]"
+
+REVIEW_ITEM_XPATH = f"//div[{_has_class('review-item')}]"
+REVIEW_TEXT_XPATH = f".//div[{_has_classes('f-component-text review_text_container review-track')}]"
+DATE_RATING_XPATH = f".//div[{_has_classes('row-inline mb24px-desktop')}]"
+AVATAR_NAME_XPATH = f".//span[{_has_class('avatar-name')}]"
+AUTHOR_FALLBACK_XPATH = ".//span[contains(@class, 'author')]"
+TITLE_XPATH = f".//div[{_has_class('f-component-info-header')}]"
+RECOMMENDATION_XPATH = f".//p[{_has_class('word-break-break-word')}]"
+
+
+
+class FastReviewParser:
+    """
+    lxml-based review extraction with precompiled XPath selectors
+
+    Produces the same dicts as LevisReviewsScraperMultiPage.parse_review, but
+    parses with libxml2 and looks each field up with a compiled XPath instead of
+    repeated BeautifulSoup find() calls.
+    """
+
+    def __init__(self):
+        try:
+            from lxml import etree, html
+        except ImportError:
+            raise ImportError("lxml is required for the lxml parser backend. Please install: pip install lxml")
+
+        self._html = html
+        self._review_items = etree.XPath(REVIEW_ITEM_XPATH)
+        self._review_text = etree.XPath(REVIEW_TEXT_XPATH)
+        self._date_rating = etree.XPath(DATE_RATING_XPATH)
+        self._avatar_name = etree.XPath(AVATAR_NAME_XPATH)
+        self._author_fallback = etree.XPath(AUTHOR_FALLBACK_XPATH)
+        self._title = etree.XPath(TITLE_XPATH)
+        self._recommendation = etree.XPath(RECOMMENDATION_XPATH)
+        self._paragraphs = etree.XPath(".//p")
+        self._text_nodes = etree.XPath(TEXT_NODES_XPATH)
+
+    def _get_text(self, element):
+        """Equivalent of BeautifulSoup's get_text(strip=True)"""
+        return ''.join(text.strip() for text in self._text_nodes(element) if text.strip())
+
+    def parse_html(self, page_source):
+        """
+        Parse every valid review on a page
+
+        Returns:
+            list: Review dicts, in page order, for reviews with review text
+        """
+        if not page_source or not page_source.strip():
+            return []
+
+        root = self._html.fromstring(page_source)
+        reviews = []
+        for review_element in self._review_items(root):
+            # Same validity filter as find_reviews_on_page, reusing the container lookup
+            text_containers = self._review_text(review_element)
+            if not text_containers or not self._get_text(text_containers[0]):
+                continue
+
+            review_data = self.parse_review(review_element, text_containers[0])
+            if review_data and review_data['review_text'] != "N/A":
+                reviews.append(review_data)
+        return reviews
+
+    def parse_review(self, review_element, review_text_elem=None):
+        """
+        Parse a single review-item element into the parse_review dict format
+        """
+        try:
+            review_data = {}
+
+            if review_text_elem is None:
+                matches = self._review_text(review_element)
+                review_text_elem = matches[0] if matches else None
+
+            if review_text_elem is not None:
+                paragraphs = self._paragraphs(review_text_elem)
+                if paragraphs:
+                    review_data['review_text'] = ' '.join([self._get_text(p) for p in paragraphs])
+                else:
+                    review_data['review_text'] = self._get_text(review_text_elem)
+            else:
+                review_data['review_text'] = "N/A"
+
+            date_rating_elems = self._date_rating(review_element)
+            if date_rating_elems:
+                review_date, rating = parse_date_rating(self._get_text(date_rating_elems[0]))
+                review_data['review_date'] = review_date
+                review_data['rating'] = rating
+            else:
+                review_data['review_date'] = "N/A"
+                review_data['rating'] = "N/A"
+
+            name_elems = self._avatar_name(review_element) or self._author_fallback(review_element)
+            review_data['reviewer_name'] = self._get_text(name_elems[0]) if name_elems else "Anonymous"
+
+            title_elems = self._title(review_element)
+            review_data['review_title'] = self._get_text(title_elems[0])[:100] if title_elems else "N/A"
+
+            recommendation_elems = self._recommendation(review_element)
+            review_data['user_recommendation'] = "N/A"
+            if recommendation_elems:
+                rec_text = self._get_text(recommendation_elems[0])
+                if 'recommendation' in rec_text.lower():
+                    review_data['user_recommendation'] = rec_text
+
+            return review_data
+
+        except Exception as e:
+            logger.warning(f"Error parsing review: {e}")
+            return None
+
+
+def check_parser_parity(page_source, scraper=None, fast_parser=None):
+    """
+    Compare the lxml parser against the BeautifulSoup parse_review path on one page
+
+    Returns:
+        list: (index, bs4_review, lxml_review) tuples for every review that differs
+    """
+    from bs4 import BeautifulSoup
+
+    if scraper is None:
+        from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+        scraper = LevisReviewsScraperMultiPage()
+    fast_parser = fast_parser or FastReviewParser()
+
+    soup = BeautifulSoup(page_source, 'html.parser')
+    expected = []
+    for review_elem in scraper.find_reviews_on_page(soup):
+        review_data = scraper.parse_review(review_elem)
+        if review_data and review_data['review_text'] != "N/A":
+            expected.append(review_data)
+    actual = fast_parser.parse_html(page_source)
+
+    mismatches = []
+    for index in range(max(len(expected), len(actual))):
+        bs4_review = expected[index] if index < len(expected) else None
+        lxml_review = actual[index] if index < len(actual) else None
+        if bs4_review != lxml_review:
+            mismatches.append((index, bs4_review, lxml_review))
+    return mismatches
+
+
+def main():
+    """
+    Check lxml/BeautifulSoup parity over saved HTML pages: python fast_review_parser.py page1.html ...
+    """
+    paths = sys.argv[1:]
+    if not paths:
+        print("Usage: python fast_review_parser.py saved_page.html [more_pages.html ...]")
+        return 2
+
+    fast_parser = FastReviewParser()
+    failed = 0
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            mismatches = check_parser_parity(f.read(), fast_parser=fast_parser)
+        if mismatches:
+            failed += 1
+            print(f"❌ {path}: {len(mismatches)} reviews differ")
+            for index, bs4_review, lxml_review in mismatches[:5]:
+                print(f"  review {index}:\n    bs4:  {bs4_review}\n    lxml: {lxml_review}")
+        else:
+            print(f"✅ {path}: parsers agree")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
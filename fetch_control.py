@@ -0,0 +1,424 @@
+import email.utils
+import logging
+import random
+import threading
+import time
+
+from page_fetchers import REVIEW_MARKER, PageFetcher
+from proxy_pool import looks_blocked
+from site_specs import registrable_domain
+
+logger = logging.getLogger(__name__)
+
+
+# Outcomes of classify_response
+FETCH_OK = 'ok'
+END_OF_RESULTS = 'end'
+THROTTLED = 'throttled'
+BLOCKED = 'blocked'
+FAILED = 'failed'
+
+RETRYABLE = (THROTTLED, BLOCKED, FAILED)
+
+
+class FetchFailed(Exception):
+    """
+    A page could not be fetched (after any retries); the crawl must not treat it as the end of results
+    """
+
+    def __init__(self, url, outcome, status_code=None):
+        self.url = url
+        self.outcome = outcome
+        self.status_code = status_code
+        detail = f" (HTTP {status_code})" if status_code else ""
+        super().__init__(f"{outcome} fetching {url}{detail}")
+
+
+def retry_after_seconds(page):
+    """
+    Seconds asked for by a Retry-After header (delta-seconds or HTTP date), or None
+    """
+    if page is None:
+        return None
+    value = {name.lower(): value for name, value in page.headers.items()}.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_response(page, review_marker=REVIEW_MARKER):
+    """
+    Tell a usable page from the end of results, throttling, a block page or a failure
+
+    review_marker is the review markup (see review_fields.Locator.marker)
+    that marks a 200 page as a real listing rather than a challenge page.
+
+    Returns:
+        str: FETCH_OK, END_OF_RESULTS (404/410), THROTTLED (429, or 503 with
+            Retry-After), BLOCKED (block status or challenge page) or FAILED
+            (no response, other 5xx and unexpected statuses). A 200 without
+            reviews is FETCH_OK: the parser decides whether it is the last page.
+    """
+    if page is None:
+        return FAILED
+    status = page.status_code
+    if status in (404, 410):
+        return END_OF_RESULTS
+    if status == 429 or (status == 503 and retry_after_seconds(page) is not None):
+        return THROTTLED
+    if looks_blocked(page, review_marker):
+        return BLOCKED
+    if 200 <= status < 300 or status == 304:
+        return FETCH_OK
+    return FAILED
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter between attempts at one page
+    """
+
+    def __init__(self, max_attempts=5, base_delay=1.0, max_delay=60.0, jitter=True, seed=None):
+        """
+        Args:
+            max_attempts (int): Attempts per page, including the first
+            base_delay (float): Delay before the first retry, doubled every retry
+            max_delay (float): Upper bound on a single delay (and on Retry-After)
+            jitter (bool): Randomise each delay within [delay/2, delay] so
+                workers that failed together do not retry together
+            seed (int): Seed for the jitter, for reproducible runs
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._random = random.Random(seed)
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Seconds to wait after failed attempt number `attempt` (0-based)
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        if self.jitter:
+            delay = self._random.uniform(delay / 2, delay)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-domain request pacing with AIMD (additive increase, multiplicative decrease)
+
+    Every domain starts at initial_rate requests per second. Each successful
+    request raises its rate by additive_increase, up to the domain's ceiling;
+    each throttled or blocked response multiplies it by
+    multiplicative_decrease (and honours Retry-After), down to min_rate.
+    Throttles within a second (or one request interval) of the last decrease
+    answer requests sent before it, so they do not compound it. The rate
+    settles just under what the site tolerates, which keeps sustained
+    throughput high without repeatedly tripping its limits. Drop-in for
+    crawl_scheduler.DomainRateLimiter (same wait(url)/set_rate/stats).
+    """
+
+    def __init__(self, initial_rate=2.0, min_rate=0.1, max_rate=20.0, additive_increase=0.1,
+                 multiplicative_decrease=0.5):
+        """
+        Args:
+            initial_rate (float): Starting requests per second per domain
+            min_rate (float): Lowest rate a domain is slowed down to
+            max_rate (float): Default ceiling per domain (see set_rate)
+            additive_increase (float): Requests per second added per success
+            multiplicative_decrease (float): Factor applied on throttling
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self._domains = {}
+        self._lock = threading.Lock()
+
+    def _state(self, domain):
+        state = self._domains.get(domain)
+        if state is None:
+            state = {'rate': min(self.initial_rate, self.max_rate), 'ceiling': self.max_rate,
+                     'next_slot': 0.0, 'decreased_at': None, 'requests': 0, 'throttled': 0, 'waited': 0.0}
+            self._domains[domain] = state
+        return state
+
+    def set_rate(self, domain, requests_per_second):
+        """
+        Cap a domain at requests_per_second (it also starts there if lower)
+        """
+        with self._lock:
+            state = self._state(domain)
+            state['ceiling'] = min(state['ceiling'], requests_per_second)
+            state['rate'] = min(state['rate'], state['ceiling'])
+
+    def rate(self, url):
+        with self._lock:
+            return self._state(registrable_domain(url))['rate']
+
+    def wait(self, url):
+        """
+        Block until a request to url's domain is allowed at the current rate
+        """
+        with self._lock:
+            state = self._state(registrable_domain(url))
+            now = time.monotonic()
+            slot = max(now, state['next_slot'])
+            state['next_slot'] = slot + 1.0 / state['rate']
+            state['requests'] += 1
+            state['waited'] += slot - now
+        if slot > now:
+            time.sleep(slot - now)
+
+    def on_success(self, url):
+        with self._lock:
+            state = self._state(registrable_domain(url))
+            state['rate'] = min(state['ceiling'], state['rate'] + self.additive_increase)
+
+    def on_throttle(self, url, retry_after=None):
+        domain = registrable_domain(url)
+        with self._lock:
+            state = self._state(domain)
+            now = time.monotonic()
+            state['throttled'] += 1
+            if retry_after:
+                state['next_slot'] = max(state['next_slot'], now + retry_after)
+            if state['decreased_at'] is not None and now - state['decreased_at'] < max(1.0, 1.0 / state['rate']):
+                return
+            state['rate'] = max(self.min_rate, state['rate'] * self.multiplicative_decrease)
+            state['decreased_at'] = now
+            rate = state['rate']
+        logger.info(f"Throttled by {domain}: slowing down to {rate:.2f} requests/s")
+
+    def stats(self):
+        with self._lock:
+            return {
+                domain: {'requests': state['requests'], 'throttled': state['throttled'],
+                         'rate': round(state['rate'], 3), 'waited_seconds': round(state['waited'], 3)}
+                for domain, state in self._domains.items()
+            }
+
+
+class CircuitBreaker:
+    """
+    Per-domain circuit breaker that pauses a domain after repeated failures
+
+    After failure_threshold consecutive failures the domain's circuit opens
+    and every request to it waits until reset_timeout has passed; exactly
+    one request is then let through as a trial (half-open) while the others
+    keep waiting for its outcome. A success closes the circuit, a failure
+    opens it again. A trial that reports nothing within reset_timeout is
+    given up on and the next waiting request becomes the trial.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds a domain stays paused once open
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._domains = {}
+        self._lock = threading.Lock()
+        self._outcome_recorded = threading.Condition(self._lock)
+
+    def _state(self, domain):
+        return self._domains.setdefault(domain, {'state': 'closed', 'failures': 0, 'opened_at': None, 'opened': 0,
+                                                 'trial_started': None})
+
+    def state(self, url):
+        with self._lock:
+            return self._state(registrable_domain(url))['state']
+
+    def wait(self, url, sleep=time.sleep):
+        """
+        Block while url's domain is paused or another request is its trial; returns the seconds waited
+
+        A request that returns while the circuit is half-open is the trial
+        and must report its outcome with record_success or record_failure.
+        """
+        domain = registrable_domain(url)
+        waited = 0.0
+        paused_for = None
+        while True:
+            with self._lock:
+                state = self._state(domain)
+                while state['state'] == 'half_open':
+                    remaining = state['trial_started'] + self.reset_timeout - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning(f"No outcome for the trial request to {domain}: trying again")
+                        break
+                    started = time.monotonic()
+                    self._outcome_recorded.wait(remaining)
+                    waited += time.monotonic() - started
+                if state['state'] == 'closed':
+                    return waited
+                remaining = 0.0
+                if state['state'] == 'open':
+                    remaining = state['opened_at'] + self.reset_timeout - time.monotonic()
+                # Once this request has sat out the pause it is due the trial
+                if remaining <= 0 or paused_for == state['opened_at']:
+                    state['state'] = 'half_open'
+                    state['trial_started'] = time.monotonic()
+                    return waited
+                paused_for = state['opened_at']
+            logger.warning(f"Circuit open for {domain}: pausing {remaining:.1f}s")
+            sleep(remaining)
+            waited += remaining
+
+    def record_success(self, url):
+        with self._lock:
+            state = self._state(registrable_domain(url))
+            state['state'] = 'closed'
+            state['failures'] = 0
+            self._outcome_recorded.notify_all()
+
+    def record_failure(self, url):
+        domain = registrable_domain(url)
+        with self._lock:
+            state = self._state(domain)
+            state['failures'] += 1
+            if state['state'] == 'open':
+                return
+            if state['state'] == 'half_open' or state['failures'] >= self.failure_threshold:
+                state['state'] = 'open'
+                state['opened_at'] = time.monotonic()
+                state['opened'] += 1
+                self._outcome_recorded.notify_all()
+                opened = True
+            else:
+                opened = False
+        if opened:
+            logger.warning(f"Circuit opened for {domain} after {state['failures']} consecutive failures")
+
+    def stats(self):
+        with self._lock:
+            return {domain: {'state': state['state'], 'failures': state['failures'], 'opened': state['opened']}
+                    for domain, state in self._domains.items()}
+
+
+class FetchController:
+    """
+    Shared fetch-control state: retry policy, adaptive per-domain rate and circuit breakers
+
+    One controller is shared by every fetcher (and crawl) that should see the
+    same domain state. wrap() turns any PageFetcher into a ControlledFetcher;
+    the Selenium crawl path uses before_request/record/backoff directly.
+    """
+
+    def __init__(self, retry_policy=None, rate_limiter=None, breaker=None, sleep=time.sleep):
+        """
+        Args:
+            retry_policy (RetryPolicy): Backoff between attempts (default RetryPolicy())
+            rate_limiter (AdaptiveRateLimiter): Per-domain pacing (default
+                AdaptiveRateLimiter()); any limiter with wait(url) works
+            breaker (CircuitBreaker): Per-domain circuit breaker (default CircuitBreaker())
+            sleep (callable): Used for backoff delays and circuit pauses
+        """
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.breaker = breaker or CircuitBreaker()
+        self.sleep = sleep
+        self.retries = 0
+        self.outcomes = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, fetcher, review_marker=REVIEW_MARKER):
+        return ControlledFetcher(fetcher, self, review_marker)
+
+    def before_request(self, url):
+        """
+        Wait out an open circuit and the domain's rate before a request
+        """
+        self.breaker.wait(url, self.sleep)
+        self.rate_limiter.wait(url)
+
+    def record(self, url, outcome, page=None):
+        """
+        Feed one request's outcome back into the rate limiter and circuit breaker
+        """
+        with self._lock:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        # A plain crawl_scheduler.DomainRateLimiter paces without adapting
+        if outcome in (FETCH_OK, END_OF_RESULTS):
+            if hasattr(self.rate_limiter, 'on_success'):
+                self.rate_limiter.on_success(url)
+            self.breaker.record_success(url)
+            return
+        if outcome in (THROTTLED, BLOCKED) and hasattr(self.rate_limiter, 'on_throttle'):
+            self.rate_limiter.on_throttle(url, retry_after_seconds(page))
+        self.breaker.record_failure(url)
+
+    def backoff(self, attempt, page=None):
+        """
+        Sleep before retry number attempt + 1
+        """
+        with self._lock:
+            self.retries += 1
+        delay = self.retry_policy.delay(attempt, retry_after_seconds(page))
+        logger.info(f"Retrying in {delay:.1f}s (attempt {attempt + 2} of {self.retry_policy.max_attempts})")
+        self.sleep(delay)
+
+    def stats(self):
+        with self._lock:
+            outcomes = dict(self.outcomes)
+        return {
+            'retries': self.retries,
+            'outcomes': outcomes,
+            'domains': self.rate_limiter.stats(),
+            'circuits': self.breaker.stats(),
+        }
+
+
+class ControlledFetcher(PageFetcher):
+    """
+    Fetcher wrapper that paces, classifies and retries every request
+
+    Returns the page once it is usable or the end of results (404/410); raises
+    FetchFailed when every attempt was throttled, blocked or failed, so a
+    crawl stops with an error (and can be resumed) instead of mistaking a
+    transient problem for the last page.
+    """
+    name = "controlled"
+
+    def __init__(self, fetcher, controller, review_marker=REVIEW_MARKER):
+        """
+        Args:
+            fetcher (PageFetcher): Fetcher doing the actual requests
+            controller (FetchController): Shared retry/rate/circuit state
+            review_marker (str): Review markup of the site (see classify_response)
+        """
+        self.fetcher = fetcher
+        self.controller = controller
+        self.review_marker = review_marker
+        self.name = f"controlled {fetcher.name}"
+
+    def fetch(self, url, headers=None, *args):
+        policy = self.controller.retry_policy
+        page, outcome = None, FAILED
+        for attempt in range(policy.max_attempts):
+            if attempt:
+                self.controller.backoff(attempt - 1, page)
+            self.controller.before_request(url)
+            page = self.fetcher.fetch(url, headers, *args)
+            outcome = classify_response(page, self.review_marker)
+            self.controller.record(url, outcome, page)
+            if outcome not in RETRYABLE:
+                return page
+            logger.warning(f"⚠️ {outcome} fetching {url}" + (f" (HTTP {page.status_code})" if page else ""))
+        raise FetchFailed(url, outcome, page.status_code if page else None)
+
+    def close(self):
+        self.fetcher.close()
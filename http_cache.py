@@ -0,0 +1,318 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+
+from page_fetchers import FetchedPage, PageFetcher
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when parse_page output changes so cached parse results are not reused
+PARSED_FORMAT = 1
+
+
+class HttpCache:
+    """
+    On-disk HTTP cache for review pages, with conditional revalidation
+
+    Responses are kept in one SQLite file: an entry per URL with its ETag,
+    Last-Modified and body hash, and each distinct body (zlib-compressed)
+    once, together with the reviews parsed from it by each parser
+    configuration (see parsed_reviews). Entries younger than ttl
+    are served without a request; older ones are revalidated with
+    If-None-Match/If-Modified-Since. The least recently used entries are
+    evicted once the stored bodies exceed max_bytes.
+    """
+
+    def __init__(self, path='levis_http_cache.sqlite', ttl=0, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            path (str): SQLite file holding the cache
+            ttl (float): Seconds a stored response is served without revalidating
+                (0 = always revalidate)
+            max_bytes (int): Upper bound on the stored (compressed) bodies
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.parse_hits = 0
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.executescript(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " url TEXT PRIMARY KEY,"
+            " body_hash TEXT NOT NULL,"
+            " final_url TEXT,"
+            " status_code INTEGER,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " stored_at REAL,"
+            " last_used REAL);"
+            "CREATE TABLE IF NOT EXISTS bodies ("
+            " body_hash TEXT PRIMARY KEY,"
+            " body BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " raw_size INTEGER NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS parsed ("
+            " body_hash TEXT NOT NULL,"
+            " parser_key TEXT NOT NULL,"
+            " reviews TEXT NOT NULL,"
+            " PRIMARY KEY (body_hash, parser_key));"
+            "CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);"
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def body_hash(html):
+        return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+    def lookup(self, url):
+        """
+        Return the cached entry for url as a dict (None if it is not cached)
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT e.body_hash, e.final_url, e.status_code, e.etag, e.last_modified, e.stored_at, b.body, b.raw_size"
+                " FROM entries e JOIN bodies b ON b.body_hash = e.body_hash WHERE e.url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body_hash, final_url, status_code, etag, last_modified, stored_at, body, raw_size = row
+        return {
+            'url': url,
+            'body_hash': body_hash,
+            'final_url': final_url or url,
+            'status_code': status_code,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': stored_at,
+            'body': body,
+            'raw_size': raw_size,
+        }
+
+    def record(self, counter, bytes_saved=0):
+        """
+        Count a 'hits', 'revalidated' or 'misses' outcome (fetchers share one cache across threads)
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            self.bytes_saved += bytes_saved
+
+    def is_fresh(self, entry):
+        return self.ttl > 0 and time.time() - entry['stored_at'] < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        Revalidation headers for a cached entry
+        """
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def page_from_entry(self, entry, cache_status, elapsed=0.0, backend=None):
+        """
+        Rebuild a FetchedPage from a cached entry
+        """
+        return FetchedPage(
+            url=entry['final_url'],
+            html=zlib.decompress(entry['body']).decode('utf-8'),
+            status_code=entry['status_code'],
+            elapsed=elapsed,
+            backend=backend,
+            body_hash=entry['body_hash'],
+            cache_status=cache_status,
+        )
+
+    def touch(self, url, revalidated=False):
+        """
+        Mark an entry as used (and, after a 304, as freshly validated)
+        """
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self.connection.execute("UPDATE entries SET last_used = ?, stored_at = ? WHERE url = ?", (now, now, url))
+            else:
+                self.connection.execute("UPDATE entries SET last_used = ? WHERE url = ?", (now, url))
+            self.connection.commit()
+
+    def store(self, url, page):
+        """
+        Store a 200 response and set page.body_hash
+
+        Returns:
+            bool: True if the body differs from what was cached for url before
+        """
+        body_hash = self.body_hash(page.html)
+        page.body_hash = body_hash
+        headers = {name.lower(): value for name, value in page.headers.items()}
+        now = time.time()
+        with self._lock:
+            previous = self.connection.execute("SELECT body_hash FROM entries WHERE url = ?", (url,)).fetchone()
+            if not self.connection.execute("SELECT 1 FROM bodies WHERE body_hash = ?", (body_hash,)).fetchone():
+                raw = page.html.encode('utf-8')
+                body = zlib.compress(raw, 6)
+                self.connection.execute(
+                    "INSERT INTO bodies (body_hash, body, size, raw_size) VALUES (?, ?, ?, ?)",
+                    (body_hash, body, len(body), len(raw))
+                )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO entries (url, body_hash, final_url, status_code, etag, last_modified, stored_at, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body_hash, page.url, page.status_code, headers.get('etag'), headers.get('last-modified'), now, now)
+            )
+            if previous and previous[0] != body_hash:
+                self._drop_unreferenced_bodies()
+            self.connection.commit()
+            self._evict()
+        return previous is None or previous[0] != body_hash
+
+    def parsed_reviews(self, body_hash, parser_key):
+        """
+        Reviews previously parsed from this body by the same parser configuration (None if there are none)
+
+        Args:
+            body_hash (str): Hash of the page body (FetchedPage.body_hash)
+            parser_key (str): Identifies the parser backend and review
+                selectors, e.g. review_fields.schema_fingerprint; a cache
+                shared by crawls with other selectors never returns their reviews
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT reviews FROM parsed WHERE body_hash = ? AND parser_key = ?",
+                (body_hash, f"{PARSED_FORMAT}:{parser_key}")
+            ).fetchone()
+            if row is None:
+                return None
+            self.parse_hits += 1
+        return json.loads(row[0])
+
+    def store_parsed(self, body_hash, parser_key, reviews):
+        """
+        Remember the reviews parsed from a body (without page_number/source_url)
+        """
+        parsed = json.dumps(reviews, ensure_ascii=False)
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO parsed (body_hash, parser_key, reviews) VALUES (?, ?, ?)",
+                (body_hash, f"{PARSED_FORMAT}:{parser_key}", parsed)
+            )
+            # Parse results count towards max_bytes with their body
+            self.connection.execute(
+                "UPDATE bodies SET size = length(body) + (SELECT COALESCE(SUM(length(CAST(reviews AS BLOB))), 0)"
+                " FROM parsed WHERE parsed.body_hash = bodies.body_hash) WHERE body_hash = ?", (body_hash,)
+            )
+            self.connection.commit()
+
+    def _drop_unreferenced_bodies(self):
+        self.connection.execute("DELETE FROM bodies WHERE body_hash NOT IN (SELECT body_hash FROM entries)")
+        self.connection.execute("DELETE FROM parsed WHERE body_hash NOT IN (SELECT body_hash FROM bodies)")
+
+    def total_bytes(self):
+        with self._lock:
+            return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()[0]
+
+    def _evict(self):
+        # Called with the lock held
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM bodies").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.connection.execute(
+            "SELECT e.url, e.body_hash, b.size FROM entries e JOIN bodies b ON b.body_hash = e.body_hash"
+            " ORDER BY e.last_used"
+        ).fetchall()
+        references = {}
+        for _, body_hash, _ in rows:
+            references[body_hash] = references.get(body_hash, 0) + 1
+
+        evicted = 0
+        for url, body_hash, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.connection.execute("DELETE FROM entries WHERE url = ?", (url,))
+            references[body_hash] -= 1
+            if not references[body_hash]:
+                total -= size
+            evicted += 1
+        self._drop_unreferenced_bodies()
+        self.connection.commit()
+        logger.debug(f"HTTP cache evicted {evicted} entries (now {total / 1024:.0f} KB)")
+
+    def stats(self):
+        with self._lock:
+            entries = self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {
+            'entries': entries,
+            'bytes': self.total_bytes(),
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'bytes_saved': self.bytes_saved,
+            'parse_hits': self.parse_hits,
+        }
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+class CachingFetcher(PageFetcher):
+    """
+    Wrap a fetcher with an HttpCache
+
+    Fresh entries are returned without a request, stale ones are revalidated
+    with conditional headers and a 304 is answered from the cache. Every page
+    it returns carries body_hash, so callers can skip re-parsing unchanged
+    bodies, and cache_status ('hit', 'revalidated' or 'miss').
+    """
+    name = "cached"
+
+    def __init__(self, fetcher, cache):
+        """
+        Args:
+            fetcher (PageFetcher): Fetcher used on cache misses and revalidation
+            cache (HttpCache): Cache to read from and store into
+        """
+        self.fetcher = fetcher
+        self.cache = cache
+        self.name = f"cached {fetcher.name}"
+
+    def fetch(self, url, headers=None, *args):
+        entry = self.cache.lookup(url)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record('hits', entry['raw_size'])
+            self.cache.touch(url)
+            return self.cache.page_from_entry(entry, 'hit', backend=self.name)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(self.cache.conditional_headers(entry))
+        page = self.fetcher.fetch(url, request_headers or None, *args)
+        if page is None:
+            return None
+
+        if page.status_code == 304 and entry is not None:
+            self.cache.record('revalidated', entry['raw_size'])
+            self.cache.touch(url, revalidated=True)
+            logger.debug(f"Not modified: {url}")
+            return self.cache.page_from_entry(entry, 'revalidated', page.elapsed, self.name)
+
+        self.cache.record('misses')
+        page.cache_status = 'miss'
+        if page.status_code == 200 and page.html:
+            self.cache.store(url, page)
+        return page
+
+    def close(self):
+        self.fetcher.close()
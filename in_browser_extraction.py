@@ -0,0 +1,208 @@
+import argparse
+import logging
+import os
+import sys
+
+from review_fields import parse_date_rating
+
+logger = logging.getLogger(__name__)
+
+
+# Runs inside the page via execute_script and mirrors find_reviews_on_page and
+# parse_review: BeautifulSoup class_ matching, get_text(strip=True) (Python's
+# whitespace set, script/style/template strings skipped) and first-match-wins
+# lookups in document order. It only returns the raw field texts; date/rating
+# parsing, the title cut-off and the recommendation check run in Python
+# (review_from_fields) so they stay byte-identical to the Python parser.
+EXTRACT_REVIEWS_SCRIPT = r"""
+var WHITESPACE = /^[\t\n\v\f\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+|[\t\n\v\f\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+$/g;
+var SKIPPED_PARENTS = {SCRIPT: true, STYLE: true, TEMPLATE: true};
+
+function getText(element) {
+    var parts = [];
+    var stack = [element];
+    while (stack.length) {
+        var node = stack.pop();
+        if (node.nodeType === 3 || node.nodeType === 4) {
+            if (!SKIPPED_PARENTS[node.parentNode.nodeName.toUpperCase()]) {
+                var text = node.data.replace(WHITESPACE, '');
+                if (text) {
+                    parts.push(text);
+                }
+            }
+        } else if (node.nodeType === 1) {
+            for (var i = node.childNodes.length - 1; i >= 0; i--) {
+                stack.push(node.childNodes[i]);
+            }
+        }
+    }
+    return parts.join('');
+}
+
+function classesOf(element) {
+    var value = element.getAttribute('class');
+    return value ? value.split(/[\t\n\f\r ]+/).filter(function (name) { return name; }) : [];
+}
+
+function wholeClass(value) {
+    return function (classes) { return classes.length > 0 && classes.join(' ') === value; };
+}
+
+function anyClass(value) {
+    return function (classes) { return classes.indexOf(value) !== -1; };
+}
+
+function classContaining(value) {
+    return function (classes) {
+        return classes.some(function (name) { return name.indexOf(value) !== -1; });
+    };
+}
+
+function first(root, tag, test) {
+    var elements = root.getElementsByTagName(tag);
+    for (var i = 0; i < elements.length; i++) {
+        if (test(classesOf(elements[i]))) {
+            return elements[i];
+        }
+    }
+    return null;
+}
+
+function textOf(element) {
+    return element ? getText(element) : null;
+}
+
+var isReviewItem = anyClass('review-item');
+var isTextContainer = wholeClass('f-component-text review_text_container review-track');
+var reviews = [];
+var items = document.getElementsByTagName('div');
+for (var i = 0; i < items.length; i++) {
+    var item = items[i];
+    if (!isReviewItem(classesOf(item))) {
+        continue;
+    }
+    var container = first(item, 'div', isTextContainer);
+    if (!container || !getText(container)) {
+        continue;
+    }
+
+    var paragraphs = container.getElementsByTagName('p');
+    var reviewText;
+    if (paragraphs.length) {
+        var texts = [];
+        for (var j = 0; j < paragraphs.length; j++) {
+            texts.push(getText(paragraphs[j]));
+        }
+        reviewText = texts.join(' ');
+    } else {
+        reviewText = getText(container);
+    }
+
+    reviews.push({
+        review_text: reviewText,
+        date_rating: textOf(first(item, 'div', wholeClass('row-inline mb24px-desktop'))),
+        reviewer_name: textOf(first(item, 'span', anyClass('avatar-name')) ||
+                              first(item, 'span', classContaining('author'))),
+        review_title: textOf(first(item, 'div', anyClass('f-component-info-header'))),
+        recommendation: textOf(first(item, 'p', anyClass('word-break-break-word')))
+    });
+}
+return reviews;
+"""
+
+
+def review_from_fields(fields):
+    """
+    Build the parse_review dict from the raw texts returned by EXTRACT_REVIEWS_SCRIPT
+    """
+    if fields['date_rating'] is not None:
+        review_date, rating = parse_date_rating(fields['date_rating'])
+    else:
+        review_date, rating = "N/A", "N/A"
+
+    recommendation = fields['recommendation']
+    if recommendation is None or 'recommendation' not in recommendation.lower():
+        recommendation = "N/A"
+
+    return {
+        'review_text': fields['review_text'],
+        'review_date': review_date,
+        'rating': rating,
+        'reviewer_name': fields['reviewer_name'] if fields['reviewer_name'] is not None else "Anonymous",
+        'review_title': fields['review_title'][:100] if fields['review_title'] is not None else "N/A",
+        'user_recommendation': recommendation,
+    }
+
+
+def extract_reviews(driver):
+    """
+    Extract every valid review on the driver's current page in one execute_script round-trip
+
+    Returns:
+        list: Review dicts in page order, as parse_page returns them before
+            page_number/source_url are added
+    """
+    return [review_from_fields(fields) for fields in driver.execute_script(EXTRACT_REVIEWS_SCRIPT) or []]
+
+
+def check_browser_parity(driver, scraper=None):
+    """
+    Compare in-browser extraction against the Python parser on the driver's current page
+
+    Returns:
+        list: (index, python_review, browser_review) tuples for every review that differs
+    """
+    if scraper is None:
+        from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+        scraper = LevisReviewsScraperMultiPage()
+
+    expected = scraper.parse_page(driver.page_source, None, None)
+    for review in expected:
+        del review['page_number'], review['source_url']
+    actual = extract_reviews(driver)
+
+    mismatches = []
+    for index in range(max(len(expected), len(actual))):
+        python_review = expected[index] if index < len(expected) else None
+        browser_review = actual[index] if index < len(actual) else None
+        if python_review != browser_review:
+            mismatches.append((index, python_review, browser_review))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check in-browser extraction against the Python parser in headless Chrome")
+    parser.add_argument('pages', nargs='+', help="Saved HTML files or page URLs")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+    scraper = LevisReviewsScraperMultiPage()
+    scraper.chrome_options.add_argument('--headless=new')
+    if not scraper.setup_driver():
+        print("❌ Chrome could not be started")
+        return 2
+
+    failed = 0
+    try:
+        for page in args.pages:
+            url = page if '://' in page else 'file://' + os.path.abspath(page)
+            scraper.driver.get(url)
+            mismatches = check_browser_parity(scraper.driver, scraper)
+            if mismatches:
+                failed += 1
+                print(f"❌ {page}: {len(mismatches)} reviews differ")
+                for index, python_review, browser_review in mismatches[:5]:
+                    print(f"  review {index}:\n    python:  {python_review}\n    browser: {browser_review}")
+            else:
+                print(f"✅ {page}: extraction agrees")
+    finally:
+        scraper.release_driver()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,434 +1,1054 @@
-import requests
+import argparse
 import json
+import logging
 import time
 import os
 import csv
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit
+from fast_review_parser import FastReviewParser
+from fetch_control import (BLOCKED, END_OF_RESULTS, FAILED, FETCH_OK, AdaptiveRateLimiter, FetchController, FetchFailed,
+                           classify_response)
+from http_cache import CachingFetcher, HttpCache
+from in_browser_extraction import extract_reviews
+from crawl_checkpoint import CrawlCheckpoint
+from page_archive import PageArchive
+from proxy_pool import BRIGHTDATA_ENDPOINT, ProxiedFetcher, ProxyPool, looks_blocked
+from resource_blocking import ResourceBlockingProfile, ResourceStats
+from review_fields import REVIEW_ITEM, ReviewFieldExtractor, schema_fingerprint, schema_selectors
+from review_records import RECORD_TYPES, as_dict, to_records
+from review_sinks import create_sinks
+from scrape_metrics import ScrapeMetrics, instrument_driver
+from seen_reviews import SeenReviewIndex
+from site_specs import registrable_domain
+from async_page_fetcher import AsyncPageFetcher, StopCrawl
+from page_fetchers import PAGE_URL_TEMPLATE, DEFAULT_USER_AGENT, FetchedPage, SeleniumFetcher, build_page_url, create_fetcher, needs_javascript, page_number_from_url, page_url_pattern
+
+logger = logging.getLogger(__name__)
+
+# Pagination search strategies, tried in this order by find_next_button
+PAGINATION_CONTAINER_SELECTORS = [
+    ".pagination",
+    ".paging",
+    ".page-navigation",
+    "[class*='pagination']",
+    "[class*='paging']",
+    "[class*='page-nav']"
+]
+
+NUMBERED_PAGE_XPATH = "//a[text()='{page}']"
+
+NEXT_BUTTON_XPATHS = [
+    "//a[contains(translate(text(), 'NEXT', 'next'), 'next')]",
+    "//a[text()='>']",
+    "//a[text()='›']",
+    "//a[text()='»']",
+    "//a[contains(@class, 'next')]",
+    "//a[contains(@title, 'next')]",
+    "//a[contains(@title, 'Next')]"
+]
+
+LOAD_MORE_XPATHS = [
+    "//button[contains(text(), 'Load')]",
+    "//button[contains(text(), 'More')]",
+    "//a[contains(text(), 'Load')]",
+    "//a[contains(text(), 'More')]",
+    "//*[contains(@class, 'load-more')]",
+    "//*[contains(@class, 'show-more')]"
+]
+
 
 class LevisReviewsScraperMultiPage:
-    def __init__(self, use_brightdata=False):
+    def __init__(self, use_brightdata=False, fetch_backend='selenium', concurrency=1, requests_per_second=None,
+                 parser_backend='bs4', archive_dir=None, seen_index_path=None, output_formats=('csv', 'json'),
+                 dedup=None, browser_pool=None, resource_blocking=None, proxy_pool=None,
+                 base_url="https://levis.pissedconsumer.com", start_url=None, record_type='dict',
+                 extraction_mode='html', http_cache=None, review_fields=None, review_item=None,
+                 page_url_template=PAGE_URL_TEMPLATE, domain_limiter=None, fetch_controller=None):
         """
         Initialize the scraper with optional BrightData proxy configuration
 
         Args:
             use_brightdata (bool): Whether to use BrightData proxy
+            fetch_backend (str): 'selenium' to click through pages in Chrome, or
+                'requests'/'httpx' to fetch RT-P.html?page=N pages directly over
+                HTTP (Chrome is then only started for pages that need JS)
+            concurrency (int): Pages fetched in parallel by the HTTP backends
+            requests_per_second (float): Per-host rate limit for concurrent fetching
+                (and the fetch controller's ceiling for the site, if one is used)
+            parser_backend (str): 'bs4' (BeautifulSoup + parse_review) or 'lxml'
+                (FastReviewParser with precompiled XPath, same output)
+            archive_dir (str): If set, every fetched page is stored in a PageArchive
+                there so it can be re-parsed offline with reparse.py
+            seen_index_path (str): If set, crawl incrementally: only reviews missing
+                from this SQLite seen-review index are emitted, and pagination
+                stops at the first page whose reviews are all already known
+            output_formats (tuple): Default streaming outputs written next to
+                output_file: any of 'csv', 'json', 'jsonl', 'parquet', plus
+                'postgres' to upsert into $DATABASE_URL
+            dedup (ReviewDeduplicator): Optional exact/near-duplicate filter run on
+                each page before it reaches the output sinks
+            browser_pool (BrowserPool): Lease warm drivers from this pool instead
+                of starting and quitting Chrome on every scrape_all_reviews call
+            resource_blocking (ResourceBlockingProfile): Skip images, fonts, CSS
+                and ad/tracker hosts in Chrome (True for the default profile);
+                network usage is then reported in resource_stats
+            proxy_pool (ProxyPool): Sticky proxy sessions rotated on failures and
+                blocks; built from BRIGHTDATA_API_KEY with one session per
+                worker when use_brightdata is set. Only the HTTP backends
+                rotate: Chrome keeps the session it started with, so a
+                blocked Selenium crawl needs a new scraper (and driver)
+            base_url (str): Site root; pagination links must point at this host
+            start_url (str): First review page (default: <base_url>/review.html),
+                e.g. a local_review_server URL for offline runs and benchmarks
+            record_type (str): 'dict' to collect reviews as plain dicts, or
+                'review' for compact review_records.Review records (typed date
+                and rating, interned names); outputs are identical either way
+            extraction_mode (str): In Selenium mode, 'html' pulls page_source and
+                parses it in Python; 'browser' runs EXTRACT_REVIEWS_SCRIPT in the
+                page and transfers only the review fields (page_source is still
+                pulled when archive_dir is set)
+            http_cache (HttpCache): On-disk cache for the HTTP backends (or a
+                path to one): unchanged pages are revalidated with
+                If-None-Match/If-Modified-Since instead of refetched, and
+                bodies seen before are not parsed again
+            review_fields (list): ReviewField entries replacing REVIEW_FIELDS for
+                sites with other markup (see review_fields.build_review_fields);
+                needs the bs4 parser and html extraction
+            review_item (Locator): Element wrapping each review (default
+                div.review-item)
+            page_url_template (str): Listing page URL relative to start_url
+                ('RT-P.html?page={page}' on PissedConsumer)
+            domain_limiter: Shared politeness limiter whose wait(url) is called
+                before every page request (see crawl_scheduler.DomainRateLimiter)
+            fetch_controller (FetchController): Retry throttled, blocked and
+                failed requests with backoff, adapt each domain's request rate
+                and pause domains that keep failing (True for a default
+                controller pacing with domain_limiter, if given). Without one,
+                such responses stop the crawl with crawl_error set instead of
+                being taken for the end of results
         """
-        self.base_url = "https://levis.pissedconsumer.com"
-        self.start_url = "https://levis.pissedconsumer.com/review.html"
+        if record_type not in RECORD_TYPES:
+            raise ValueError(f"Unknown record type: {record_type!r} (expected one of {list(RECORD_TYPES)})")
+        if extraction_mode not in ('html', 'browser'):
+            raise ValueError(f"Unknown extraction mode: {extraction_mode!r} (expected 'html' or 'browser')")
+        if (review_fields is not None or review_item is not None) and (parser_backend != 'bs4' or extraction_mode != 'html'):
+            raise ValueError("Custom review selectors need parser_backend='bs4' and extraction_mode='html'")
+        self.base_url = base_url.rstrip('/')
+        self.start_url = start_url or f"{self.base_url}/review.html"
+        self.site_host = urlsplit(self.base_url).netloc
         self.use_brightdata = use_brightdata
+        self.fetch_backend = fetch_backend
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.parser_backend = parser_backend
+        self.fast_parser = FastReviewParser() if parser_backend == 'lxml' else None
+        self.field_extractor = ReviewFieldExtractor(review_fields)
+        self.review_item = review_item or REVIEW_ITEM
+        self.review_marker = self.review_item.marker
+        self.schema_fingerprint = schema_fingerprint(self.field_extractor.fields, self.review_item)
+        # Cached parse results are only reused by scrapers with the same parser and selectors
+        self.parser_key = f"{parser_backend}:{self.schema_fingerprint}"
+        self.page_url_template = page_url_template
+        self.page_url_pattern = page_url_pattern(page_url_template)
+        self.domain_limiter = domain_limiter
+        if fetch_controller is True:
+            rate_limiter = domain_limiter
+            if rate_limiter is None and requests_per_second:
+                rate_limiter = AdaptiveRateLimiter(initial_rate=requests_per_second, max_rate=requests_per_second)
+            fetch_controller = FetchController(rate_limiter=rate_limiter)
+        if fetch_controller is not None and requests_per_second:
+            # The controller paces every request, so it must not outrun requests_per_second
+            fetch_controller.rate_limiter.set_rate(registrable_domain(self.start_url), requests_per_second)
+        self.fetch_controller = fetch_controller
+        self.archive = PageArchive(archive_dir) if archive_dir else None
+        if self.archive:
+            self.archive.store_schema(self.schema_fingerprint,
+                                      schema_selectors(self.field_extractor.fields, self.review_item))
+        self.seen_index = SeenReviewIndex(seen_index_path) if seen_index_path else None
+        self.output_formats = output_formats
+        self.dedup = dedup
+        self.record_type = record_type
+        self.extraction_mode = extraction_mode
+        if isinstance(http_cache, str):
+            http_cache = HttpCache(http_cache)
+        self.http_cache = http_cache
+
+        # Per-run output state, set up by scrape_all_reviews
+        self.sinks = []
+        self.all_reviews = []
+        self.keep_reviews = True
+        self.reviews_emitted = 0
+        self.checkpoint = None
+        self.resume_url = None
+        self.crawl_error = None
+        self.navigation_error = None
+        self.user_agent = DEFAULT_USER_AGENT
+        self.proxy_url = None
+        self.proxy_pool = proxy_pool
         self.driver = None
-
-        # Set up Chrome options
-        self.chrome_options = Options()
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
-        self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.chrome_options.add_experimental_option('useAutomationExtension', False)
-
-        # Add user agent
-        self.chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+        self.browser_pool = browser_pool
+        self.driver_lease = None
+        self.driver_pages = 0
+        self.waiter = None
+        self.wait_timings = []
+        self.metrics = ScrapeMetrics()
+
+        if resource_blocking is True:
+            resource_blocking = ResourceBlockingProfile()
+        self.resource_blocking = resource_blocking
+        self.resource_stats = ResourceStats()
+
+        # Pagination strategy that found the next button last time: (strategy, selector)
+        self.pagination_cache = None
+        self.pagination_cache_hits = 0
+        self.pagination_cache_misses = 0
+
+        # Chrome options are built on first use (see chrome_options)
+        self._chrome_options = None
 
         # Set up BrightData proxy if requested
-        if use_brightdata:
+        if use_brightdata and self.proxy_pool is None:
             api_key = os.getenv('BRIGHTDATA_API_KEY')
             if api_key:
-                # BrightData proxy configuration for Selenium
-                # Format: username-session-<random>:password@endpoint
-                proxy_endpoint = "brd.superproxy.io:22225"  # Default BrightData endpoint
-                proxy_user = f"brd-customer-{api_key}-session-{int(time.time())}"
-                proxy_pass = api_key
-
-                proxy_url = f"http://{proxy_user}:{proxy_pass}@{proxy_endpoint}"
-
-                # Configure Chrome with BrightData proxy
-                self.chrome_options.add_argument(f'--proxy-server={proxy_url}')
-                print(f"✅ BrightData proxy configured: {proxy_endpoint}")
+                # One sticky session per worker: username-session-<id>:password@endpoint
+                self.proxy_pool = ProxyPool.brightdata(api_key, size=max(1, concurrency))
+                logger.info(f"✅ BrightData proxy configured: {BRIGHTDATA_ENDPOINT} "
+                            f"({self.proxy_pool.size} sessions)")
             else:
-                print("No BrightData API key found")
+                logger.warning("No BrightData API key found")
+
+        if self.proxy_pool is not None:
+            # Chrome is pinned to one session for the lifetime of the driver: its
+            # --proxy-server is fixed at startup and drivers may be shared through
+            # a BrowserPool, so the Selenium path never reports to or rotates the pool
+            self.proxy_url = self.proxy_pool.assign('selenium').url
+
+    @property
+    def chrome_options(self):
+        """Chrome options for create_driver, built on first use so HTTP-only runs never import Selenium"""
+        if self._chrome_options is None:
+            from selenium.webdriver.chrome.options import Options
+
+            options = Options()
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            options.add_argument('--disable-blink-features=AutomationControlled')
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            options.add_experimental_option('useAutomationExtension', False)
+
+            # Add user agent
+            options.add_argument(f'--user-agent={self.user_agent}')
+
+            if self.resource_blocking:
+                self.resource_blocking.apply_to_options(options)
+
+            if self.proxy_pool is not None:
+                options.add_argument(f'--proxy-server={self.proxy_url}')
+            self._chrome_options = options
+        return self._chrome_options
+
+    def create_driver(self):
+        """Start a new Chrome WebDriver with this scraper's options (also used as a BrowserPool factory)"""
+        from selenium import webdriver
+
+        driver = webdriver.Chrome(options=self.chrome_options)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.resource_blocking:
+            self.resource_blocking.apply_to_driver(driver)
+        return driver
 
     def setup_driver(self):
-        """Initialize the Chrome WebDriver"""
+        """Initialize the Chrome WebDriver, leasing it from the browser pool if there is one"""
+        from selenium.webdriver.common.by import By
+        from page_waits import PageWaiter
+
         try:
-            self.driver = webdriver.Chrome(options=self.chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            print("Chrome driver initialized successfully")
+            if self.browser_pool:
+                self.driver_lease = self.browser_pool.acquire()
+                self.driver = self.driver_lease.driver
+                logger.info("Chrome driver leased from browser pool")
+            else:
+                self.driver = self.create_driver()
+                logger.info("Chrome driver initialized successfully")
+            self.driver_pages = 0
+            instrument_driver(self.driver, self.metrics)
+            self.waiter = PageWaiter(self.driver, metrics=self.metrics,
+                                     review_locator=(By.CSS_SELECTOR, self.review_item.css_selector()))
+            self.wait_timings = self.waiter.wait_timings
             return True
         except Exception as e:
-            print(f"Error setting up Chrome driver: {e}")
-            print("Make sure ChromeDriver is installed and in your PATH")
+            logger.error(f"Error setting up Chrome driver: {e}")
+            logger.error("Make sure ChromeDriver is installed and in your PATH")
             return False
 
+    def polite_wait(self, url):
+        """Block until the fetch controller or shared domain limiter (if any) allows another request to url"""
+        if self.fetch_controller is not None:
+            self.fetch_controller.before_request(url)
+        elif self.domain_limiter is not None:
+            self.domain_limiter.wait(url)
+
+    def note_driver_page(self):
+        """Count a page loaded in the current driver and collect its network usage"""
+        self.driver_pages += 1
+        if self.resource_blocking:
+            self.resource_stats.collect(self.driver)
+
+    def release_driver(self):
+        """Quit the Chrome WebDriver, or hand it back to the browser pool"""
+        if not self.driver:
+            return
+        if self.driver_lease:
+            self.browser_pool.release(self.driver_lease, pages=self.driver_pages)
+            self.driver_lease = None
+            logger.info("Browser returned to pool")
+        else:
+            self.driver.quit()
+            logger.info("Browser closed")
+        self.driver = None
+
     def parse_review(self, review_element):
         """
         Parse individual review data from BeautifulSoup review element
+
+        The fields are declared in review_fields.REVIEW_FIELDS and located in a
+        single pass over the element's descendants.
         """
         try:
-            review_data = {}
-
-            # Extract review text from the specific container
-            review_text_elem = review_element.find('div', class_='f-component-text review_text_container review-track')
-            if review_text_elem:
-                # Get all paragraph text within the container
-                paragraphs = review_text_elem.find_all('p')
-                if paragraphs:
-                    review_text = ' '.join([p.get_text(strip=True) for p in paragraphs])
-                else:
-                    review_text = review_text_elem.get_text(strip=True)
-                review_data['review_text'] = review_text
-            else:
-                review_data['review_text'] = "N/A"
-
-            # Extract rating and date from the mb24px-desktop row
-            date_rating_elem = review_element.find('div', class_='row-inline mb24px-desktop')
-            if date_rating_elem:
-                date_rating_text = date_rating_elem.get_text(strip=True)
-
-                # Extract date (format like "Aug 01, 2025")
-                import re
-                date_match = re.search(r'([A-Za-z]{3} \d{1,2}, \d{4})', date_rating_text)
-                review_data['review_date'] = date_match.group(1) if date_match else "N/A"
-
-                # Extract rating - the text is like "Aug 01, 20252.0Rating Details..."
-                # So we look for year followed by rating
-                rating_match = re.search(r'(\d{4})(\d+\.\d+)', date_rating_text)
-                if rating_match:
-                    review_data['rating'] = float(rating_match.group(2))
-                else:
-                    # Fallback: look for any decimal number that could be a rating (1.0-5.0)
-                    rating_numbers = re.findall(r'\d+\.\d+', date_rating_text)
-                    for num in rating_numbers:
-                        try:
-                            rating_val = float(num)
-                            # Ratings should be between 1.0 and 5.0
-                            if 1.0 <= rating_val <= 5.0:
-                                review_data['rating'] = rating_val
-                                break
-                        except ValueError:
-                            continue
-                    else:
-                        review_data['rating'] = "N/A"
-            else:
-                review_data['review_date'] = "N/A"
-                review_data['rating'] = "N/A"
-
-            # Extract reviewer name from avatar-name span
-            name_elem = review_element.find('span', class_='avatar-name')
-            if name_elem:
-                reviewer_name = name_elem.get_text(strip=True)
-            else:
-                # Fallback: look for other name patterns
-                name_elem = review_element.find('span', class_=lambda x: x and 'author' in x if x else False)
-                reviewer_name = name_elem.get_text(strip=True) if name_elem else "Anonymous"
-
-            review_data['reviewer_name'] = reviewer_name
-
-            # Extract title from f-component-info-header if available
-            title_elem = review_element.find('div', class_='f-component-info-header')
-            if title_elem:
-                review_data['review_title'] = title_elem.get_text(strip=True)[:100]  # Limit title length
-            else:
-                review_data['review_title'] = "N/A"
-
-            # Extract user recommendation if available
-            recommendation_elem = review_element.find('p', class_='word-break-break-word')
-            if recommendation_elem:
-                rec_text = recommendation_elem.get_text(strip=True)
-                if 'recommendation' in rec_text.lower():
-                    review_data['user_recommendation'] = rec_text
-                else:
-                    review_data['user_recommendation'] = "N/A"
-            else:
-                review_data['user_recommendation'] = "N/A"
-
-            return review_data
-
+            return self.field_extractor.extract(review_element)
         except Exception as e:
-            print(f"Error parsing review: {e}")
+            logger.warning(f"Error parsing review: {e}")
             return None
 
     def find_reviews_on_page(self, soup):
         """
         Find all review elements on the page using the correct selectors for PissedConsumer
         """
-        # Look for divs with class 'review-item' which contain the actual reviews
-        review_items = soup.find_all('div', class_='review-item')
+        # Look for the review-item divs which contain the actual reviews
+        review_items = self.review_item.find_all(soup)
+        text_locator = self.field_extractor.fields_by_name['review_text'].locator
 
         # Filter out any empty or invalid review items
         valid_reviews = []
         for review in review_items:
             # Check if it has a review text container
-            text_container = review.find('div', class_='f-component-text review_text_container review-track')
+            text_container = text_locator.find(review)
             if text_container and text_container.get_text(strip=True):
                 valid_reviews.append(review)
 
-        print(f"Found {len(valid_reviews)} valid review items on the page")
+        logger.debug(f"Found {len(valid_reviews)} valid review items on the page")
         return valid_reviews
 
-    def click_next_page(self):
-        """
-        Click the next page button and return True if successful, False if no more pages
-        """
-        try:
-            print("Looking for pagination elements...")
+    def _find_in_pagination_container(self, selectors, current_url):
+        """Strategy 1: Look for specific pagination containers"""
+        from selenium.common.exceptions import NoSuchElementException
+        from selenium.webdriver.common.by import By
 
-            # Wait a moment for page to fully load
-            time.sleep(1)
+        for container_selector in selectors:
+            try:
+                container = self.driver.find_element(By.CSS_SELECTOR, container_selector)
+                links = container.find_elements(By.TAG_NAME, "a")
 
-            # First, scroll down a bit to make sure pagination is visible
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.8);")
-            time.sleep(1)
+                logger.debug(f"Found pagination container with {len(links)} links")
 
-            next_button = None
-            current_url = self.driver.current_url
+                for link in links:
+                    text = link.get_attribute('textContent').strip().lower()
+                    href = link.get_attribute('href') or ""
 
-            # Strategy 1: Look for specific pagination containers
-            pagination_containers = [
-                ".pagination",
-                ".paging",
-                ".page-navigation",
-                "[class*='pagination']",
-                "[class*='paging']",
-                "[class*='page-nav']"
-            ]
-
-            for container_selector in pagination_containers:
-                try:
-                    container = self.driver.find_element(By.CSS_SELECTOR, container_selector)
-                    links = container.find_elements(By.TAG_NAME, "a")
-
-                    print(f"Found pagination container with {len(links)} links")
-
-                    for link in links:
-                        text = link.get_attribute('textContent').strip().lower()
-                        href = link.get_attribute('href') or ""
+                    # Skip unwanted links
+                    if any(skip in href.lower() for skip in ['customer-service', 'contact', 'help', 'about']):
+                        continue
 
-                        # Skip unwanted links
-                        if any(skip in href.lower() for skip in ['customer-service', 'contact', 'help', 'about']):
-                            continue
+                    # Look for next indicators
+                    if text in ['next', '>', '›', '»', 'more'] or 'next' in text:
+                        logger.debug(f"Found next button in container: '{text}' -> {href[:60]}...")
+                        return link, container_selector
 
-                        # Look for next indicators
-                        if text in ['next', '>', '›', '»', 'more'] or 'next' in text:
-                            print(f"Found next button in container: '{text}' -> {href[:60]}...")
-                            next_button = link
-                            break
+            except NoSuchElementException:
+                continue
 
-                    if next_button:
-                        break
+        return None, None
 
-                except NoSuchElementException:
-                    continue
+    def _find_numbered_link(self, selectors, current_url):
+        """Strategy 2: Look for numbered pagination and find the next number"""
+        from selenium.webdriver.common.by import By
 
-            # Strategy 2: Look for numbered pagination and find the next number
-            if not next_button:
-                print("Trying numbered pagination strategy...")
-
-                # Get current page number from URL
-                import re
-                current_page_match = re.search(r'RT-P\.html\?page=(\d+)', current_url)
-                if current_page_match:
-                    current_page = int(current_page_match.group(1))
-                    next_page = current_page + 1
-                    print(f"Current page: {current_page}, looking for page: {next_page}")
-                else:
-                    # If on first page, look for page 2
-                    next_page = 2
-                    print(f"On first page, looking for page: {next_page}")
+        # Get current page number from URL (the start page counts as page 1)
+        next_page = page_number_from_url(current_url, self.page_url_pattern) + 1
+        logger.debug(f"Looking for page: {next_page}")
 
-                # Look for link with next page number
-                page_links = self.driver.find_elements(By.XPATH, f"//a[text()='{next_page}']")
-                for link in page_links:
-                    href = link.get_attribute('href') or ""
-                    if 'levis.pissedconsumer.com' in href:
-                        print(f"Found numbered next page link: {next_page}")
-                        next_button = link
-                        break
+        for xpath_template in selectors:
+            # Look for link with next page number
+            page_links = self.driver.find_elements(By.XPATH, xpath_template.format(page=next_page))
+            for link in page_links:
+                href = link.get_attribute('href') or ""
+                if self.site_host in href:
+                    logger.debug(f"Found numbered next page link: {next_page}")
+                    return link, xpath_template
 
-            # Strategy 3: Look for any "next" text or arrows
-            if not next_button:
-                print("Trying broader next button search...")
-
-                xpath_selectors = [
-                    "//a[contains(translate(text(), 'NEXT', 'next'), 'next')]",
-                    "//a[text()='>']",
-                    "//a[text()='›']",
-                    "//a[text()='»']",
-                    "//a[contains(@class, 'next')]",
-                    "//a[contains(@title, 'next')]",
-                    "//a[contains(@title, 'Next')]"
-                ]
-
-                for xpath in xpath_selectors:
-                    try:
-                        buttons = self.driver.find_elements(By.XPATH, xpath)
-                        for button in buttons:
-                            href = button.get_attribute('href') or ""
-                            # Make sure it's a Levi's page and not an external link
-                            if ('levis.pissedconsumer.com' in href and
-                                not any(skip in href.lower() for skip in ['customer-service', 'contact', 'help'])):
-                                print(f"Found next button via XPath: {xpath}")
-                                next_button = button
-                                break
-                        if next_button:
-                            break
-                    except NoSuchElementException:
-                        continue
+        return None, None
 
-            # Strategy 4: Look for "Load More" or similar buttons
-            if not next_button:
-                print("Looking for load more buttons...")
-
-                load_more_selectors = [
-                    "//button[contains(text(), 'Load')]",
-                    "//button[contains(text(), 'More')]",
-                    "//a[contains(text(), 'Load')]",
-                    "//a[contains(text(), 'More')]",
-                    "//*[contains(@class, 'load-more')]",
-                    "//*[contains(@class, 'show-more')]"
-                ]
-
-                for selector in load_more_selectors:
-                    try:
-                        button = self.driver.find_element(By.XPATH, selector)
-                        if button.is_displayed() and button.is_enabled():
-                            print(f"Found load more button: {selector}")
-                            next_button = button
-                            break
-                    except NoSuchElementException:
-                        continue
+    def _find_next_by_xpath(self, selectors, current_url):
+        """Strategy 3: Look for any "next" text or arrows"""
+        from selenium.common.exceptions import NoSuchElementException
+        from selenium.webdriver.common.by import By
+
+        for xpath in selectors:
+            try:
+                buttons = self.driver.find_elements(By.XPATH, xpath)
+                for button in buttons:
+                    href = button.get_attribute('href') or ""
+                    # Make sure it's a Levi's page and not an external link
+                    if (self.site_host in href and
+                        not any(skip in href.lower() for skip in ['customer-service', 'contact', 'help'])):
+                        logger.debug(f"Found next button via XPath: {xpath}")
+                        return button, xpath
+            except NoSuchElementException:
+                continue
+
+        return None, None
+
+    def _find_load_more(self, selectors, current_url):
+        """Strategy 4: Look for "Load More" or similar buttons"""
+        from selenium.common.exceptions import NoSuchElementException
+        from selenium.webdriver.common.by import By
+
+        for selector in selectors:
+            try:
+                button = self.driver.find_element(By.XPATH, selector)
+                if button.is_displayed() and button.is_enabled():
+                    logger.debug(f"Found load more button: {selector}")
+                    return button, selector
+            except NoSuchElementException:
+                continue
+
+        return None, None
+
+    def _pagination_strategies(self):
+        return [
+            ('container', self._find_in_pagination_container, PAGINATION_CONTAINER_SELECTORS),
+            ('numbered', self._find_numbered_link, [NUMBERED_PAGE_XPATH]),
+            ('next_xpath', self._find_next_by_xpath, NEXT_BUTTON_XPATHS),
+            ('load_more', self._find_load_more, LOAD_MORE_XPATHS),
+        ]
+
+    def find_next_button(self, current_url):
+        """
+        Find the next page button, trying the strategy that worked last time first
+
+        The full four-strategy search only runs when there is no cached
+        strategy/selector or the cached one no longer finds a button.
+        """
+        strategies = self._pagination_strategies()
+
+        if self.pagination_cache:
+            cached_strategy, cached_selector = self.pagination_cache
+            finder = dict((name, finder) for name, finder, _ in strategies)[cached_strategy]
+            button, _ = finder([cached_selector], current_url)
+            if button:
+                self.pagination_cache_hits += 1
+                logger.debug(f"Pagination cache hit: {cached_strategy} -> {cached_selector}")
+                return button
+            logger.debug(f"Pagination cache miss: {cached_strategy} -> {cached_selector}")
+
+        self.pagination_cache_misses += 1
+        for name, finder, selectors in strategies:
+            logger.debug(f"Trying {name} pagination strategy...")
+            button, selector = finder(selectors, current_url)
+            if button:
+                self.pagination_cache = (name, selector)
+                return button
+
+        return None
+
+    def pagination_cache_stats(self):
+        """
+        Return pagination strategy cache counters and the currently cached strategy
+        """
+        strategy, selector = self.pagination_cache or (None, None)
+        return {
+            'hits': self.pagination_cache_hits,
+            'misses': self.pagination_cache_misses,
+            'strategy': strategy,
+            'selector': selector,
+        }
+
+    def click_next_page(self):
+        """
+        Click the next page button and return True if successful, False if no more pages
+
+        When it returns False because navigation failed rather than because
+        there is no next page, the failure is left in navigation_error.
+        """
+        from selenium.webdriver.common.by import By
+
+        self.navigation_error = None
+        try:
+            logger.debug("Looking for pagination elements...")
+
+            # Make sure the page has finished loading
+            self.waiter.wait_for_document_ready()
+
+            # First, scroll down a bit to make sure pagination is visible
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.8);")
+
+            current_url = self.driver.current_url
+            self.polite_wait(current_url)
+            navigation_started = time.perf_counter()
+            old_review = self.waiter.first_review()
+            next_button = self.find_next_button(current_url)
 
             if not next_button:
-                print("No next page button found after all strategies")
+                logger.info("No next page button found after all strategies")
 
-                # Debug: Show all visible links
-                all_links = self.driver.find_elements(By.TAG_NAME, "a")
-                visible_links = [link for link in all_links if link.is_displayed()]
-                print(f"Total visible links on page: {len(visible_links)}")
+                # Debug: Show all visible links (dozens of WebDriver calls, so only when debugging)
+                if logger.isEnabledFor(logging.DEBUG):
+                    all_links = self.driver.find_elements(By.TAG_NAME, "a")
+                    visible_links = [link for link in all_links if link.is_displayed()]
+                    logger.debug(f"Total visible links on page: {len(visible_links)}")
 
-                for i, link in enumerate(visible_links[:15]):  # Show first 15
-                    text = link.get_attribute('textContent').strip()[:40]
-                    href = link.get_attribute('href') or ""
-                    print(f"  {i+1}. '{text}' -> {href[:60]}...")
+                    for i, link in enumerate(visible_links[:15]):  # Show first 15
+                        text = link.get_attribute('textContent').strip()[:40]
+                        href = link.get_attribute('href') or ""
+                        logger.debug(f"  {i+1}. '{text}' -> {href[:60]}...")
 
                 return False
 
             # Check if button is disabled
             button_class = next_button.get_attribute('class') or ""
             if 'disabled' in button_class.lower():
-                print("Next button is disabled - reached last page")
+                logger.info("Next button is disabled - reached last page")
                 return False
 
             # Scroll to button and make sure it's visible
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-            time.sleep(1)
 
-            print(f"Attempting to click: '{next_button.get_attribute('textContent').strip()}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Attempting to click: '{next_button.get_attribute('textContent').strip()}'")
 
             # Try JavaScript click first (more reliable)
             try:
                 self.driver.execute_script("arguments[0].click();", next_button)
-                print("Used JavaScript click")
+                logger.debug("Used JavaScript click")
             except Exception as js_error:
-                print(f"JavaScript click failed: {js_error}, trying regular click")
+                logger.warning(f"JavaScript click failed: {js_error}, trying regular click")
                 next_button.click()
+            self.metrics.record('navigation', time.perf_counter() - navigation_started)
 
-            # Wait for navigation with longer timeout
-            try:
-                WebDriverWait(self.driver, 15).until(
-                    lambda driver: driver.current_url != current_url
-                )
-                print(f"✅ Successfully navigated to: {self.driver.current_url}")
-                time.sleep(2)  # Wait for content to load
+            # Wait for the old reviews to go stale and the new ones to load
+            if self.waiter.wait_for_page_change(current_url, old_review):
+                logger.info(f"✅ Successfully navigated to: {self.driver.current_url}")
                 return True
 
-            except TimeoutException:
-                print("❌ Page didn't change after click - might be end of results")
+            if self.driver.current_url != current_url:
+                # Navigation happened but no reviews came: an error or block page, not the end
+                self.navigation_error = FetchFailed(self.driver.current_url, self.browser_page_outcome())
+                logger.warning(f"❌ Next page did not load: {self.navigation_error}")
+                return False
+            if self.browser_page_outcome() == BLOCKED:
+                self.navigation_error = FetchFailed(current_url, BLOCKED)
+                logger.warning(f"❌ Blocked while paginating: {self.navigation_error}")
                 return False
 
+            logger.warning("❌ Page didn't change after click - might be end of results")
+            return False
+
         except Exception as e:
-            print(f"❌ Error during pagination: {e}")
+            logger.error(f"❌ Error during pagination: {e}")
+            self.navigation_error = e
             return False
 
-    def scrape_all_reviews(self, max_pages=10, output_file='levis_reviews_all_pages.csv'):
+    def browser_page_outcome(self):
         """
-        Scrape reviews from multiple pages using Selenium
+        Classify the page Chrome is showing after a failed navigation as BLOCKED or FAILED
         """
-        if not self.setup_driver():
-            return []
+        page = FetchedPage(url=self.driver.current_url, html=self.driver.page_source, status_code=200)
+        return BLOCKED if looks_blocked(page, self.review_marker) else FAILED
 
-        all_reviews = []
-        page_count = 0
+    def go_to_next_page(self):
+        """
+        Paginate with click_next_page, retrying failed navigation with the fetch controller
 
-        try:
-            print(f"Starting to scrape reviews from: {self.start_url}")
-            self.driver.get(self.start_url)
+        Returns False only when there is no next page. Navigation that still
+        fails after every attempt (one without a fetch controller) raises, so
+        the crawl stops with crawl_error set and can be resumed instead of
+        being cut short as if the results had ended.
+        """
+        controller = self.fetch_controller
+        attempts = controller.retry_policy.max_attempts if controller is not None else 1
+        previous_url = self.driver.current_url
+        for attempt in range(attempts):
+            if attempt:
+                controller.backoff(attempt - 1)
+                if self.driver.current_url != previous_url:
+                    # The click left the previous page but the next one failed to load: reload it
+                    url = self.driver.current_url
+                    self.polite_wait(url)
+                    with self.metrics.stage('navigation'):
+                        self.driver.refresh()
+                    outcome = FETCH_OK if self.waiter.wait_for_reviews(timeout=10) else self.browser_page_outcome()
+                    controller.record(url, outcome)
+                    if outcome == FETCH_OK:
+                        logger.info(f"✅ Reloaded: {url}")
+                        return True
+                    self.navigation_error = FetchFailed(url, outcome)
+                    continue
 
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "review-item"))
-            )
+            if self.click_next_page():
+                if controller is not None:
+                    controller.record(self.driver.current_url, FETCH_OK)
+                return True
+            if self.navigation_error is None:
+                return False
+            if controller is not None:
+                controller.record(previous_url, getattr(self.navigation_error, 'outcome', FAILED))
+        raise self.navigation_error
 
-            while page_count < max_pages:
-                print(f"\n=== Scraping page {page_count + 1} ===")
-                print(f"Current URL: {self.driver.current_url}")
+    def archive_page(self, page_source, page_number, source_url, status_code=200):
+        """
+        Store a fetched page in the raw HTML archive, if one is configured
+        """
+        if self.archive:
+            self.archive.store(source_url, page_source, page_number=page_number, status_code=status_code,
+                               schema=self.schema_fingerprint)
 
-                # Get page source and parse with BeautifulSoup
-                page_source = self.driver.page_source
+    def parse_page(self, page_source, page_number, source_url, body_hash=None):
+        """
+        Parse all reviews from a page's HTML and tag them with their page number and URL
+
+        With an HTTP cache, pass the page's body_hash: a body parsed before is
+        not parsed again.
+        """
+        cached_reviews = None
+        if body_hash and self.http_cache is not None:
+            cached_reviews = self.http_cache.parsed_reviews(body_hash, self.parser_key)
+
+        if cached_reviews is not None:
+            page_reviews = cached_reviews
+        elif self.fast_parser:
+            with self.metrics.stage('parse', page_number):
+                page_reviews = self.fast_parser.parse_html(page_source)
+        else:
+            from bs4 import BeautifulSoup
+
+            with self.metrics.stage('parse', page_number):
                 soup = BeautifulSoup(page_source, 'html.parser')
 
-                # Find reviews on current page
+            # Find reviews on current page
+            with self.metrics.stage('find_reviews', page_number):
                 review_elements = self.find_reviews_on_page(soup)
 
-                # Parse each review
-                page_reviews = []
-                for review_elem in review_elements:
+            # Parse each review
+            page_reviews = []
+            for review_elem in review_elements:
+                with self.metrics.stage('parse_review', page_number):
                     review_data = self.parse_review(review_elem)
-                    if review_data and review_data['review_text'] != "N/A":
-                        review_data['page_number'] = page_count + 1
-                        review_data['source_url'] = self.driver.current_url
-                        page_reviews.append(review_data)
+                if review_data and review_data['review_text'] != "N/A":
+                    page_reviews.append(review_data)
 
-                print(f"Successfully parsed {len(page_reviews)} reviews from page {page_count + 1}")
-                all_reviews.extend(page_reviews)
+        if body_hash and self.http_cache is not None and cached_reviews is None:
+            self.http_cache.store_parsed(body_hash, self.parser_key, page_reviews)
 
-                # Try to go to next page
-                if not self.click_next_page():
-                    print("No more pages or failed to navigate to next page")
+        for review_data in page_reviews:
+            review_data['page_number'] = page_number
+            review_data['source_url'] = source_url
+
+        logger.info(f"Successfully parsed {len(page_reviews)} reviews from page {page_number}")
+        return page_reviews
+
+    def extract_page_in_browser(self, page_number, source_url):
+        """
+        Extract the current page's reviews inside Chrome with one execute_script call
+
+        Returns the same dicts as parse_page on the page's HTML.
+        """
+        if self.archive:
+            with self.metrics.stage('page_source', page_number):
+                page_source = self.driver.page_source
+            self.archive_page(page_source, page_number, source_url)
+        self.note_driver_page()
+
+        with self.metrics.stage('browser_extract', page_number):
+            page_reviews = extract_reviews(self.driver)
+        for review_data in page_reviews:
+            review_data['page_number'] = page_number
+            review_data['source_url'] = source_url
+
+        logger.info(f"Successfully extracted {len(page_reviews)} reviews in the browser from page {page_number}")
+        return page_reviews
+
+    def filter_new_reviews(self, page_reviews):
+        """
+        Drop reviews already emitted by an earlier crawl when crawling incrementally
+
+        Returns:
+            tuple: (new_reviews, page_already_known) - the second value is True
+                when the page had reviews and every one of them was seen before
+        """
+        if self.seen_index is None or not page_reviews:
+            return page_reviews, False
+
+        new_reviews = self.seen_index.filter_new(page_reviews)
+        logger.debug(f"{len(new_reviews)} of {len(page_reviews)} reviews are new")
+        if not new_reviews:
+            logger.info("Every review on this page was already seen - stopping incremental crawl")
+            return new_reviews, True
+        return new_reviews, False
+
+    def emit_reviews(self, page_reviews):
+        """
+        Write one page of parsed reviews to every output sink as soon as it is parsed
+        """
+        for sink in self.sinks:
+            sink.write_page(page_reviews)
+        self.reviews_emitted += len(page_reviews)
+        if self.keep_reviews:
+            self.all_reviews.extend(to_records(page_reviews) if self.record_type == 'review' else page_reviews)
+
+    def complete_page(self, page_reviews, page_number, page_url):
+        """
+        Emit a finished page's reviews and checkpoint the crawl after it
+        """
+        with self.metrics.stage('output', page_number):
+            if self.dedup is not None:
+                page_reviews = self.dedup.process_page(page_reviews)
+            self.emit_reviews(page_reviews)
+            if self.checkpoint:
+                offsets = {sink.filename: sink.tell() for sink in self.sinks if sink.filename}
+                self.checkpoint.save(page_number, page_url, self.reviews_emitted, offsets)
+        self.metrics.page_done(page_number, len(page_reviews))
+
+    def _restore_checkpoint(self):
+        """
+        Load an unfinished checkpoint and rewind the sinks to it
+
+        Returns:
+            int: The page number to continue from (1 if there is nothing to resume)
+        """
+        state = self.checkpoint.load()
+        if not state or state.get('completed'):
+            logger.info("No unfinished checkpoint found - starting from page 1")
+            return 1
+
+        for sink in self.sinks:
+            sink.resume_from(state['output_offsets'].get(sink.filename))
+        self.reviews_emitted = state['reviews_written']
+        self.resume_url = state['page_url']
+        logger.info(f"Resuming after page {state['page_number']} ({state['page_url']}), "
+                    f"{state['reviews_written']} reviews already written")
+        return state['page_number'] + 1
+
+    def scrape_all_reviews(self, max_pages=10, output_file='levis_reviews_all_pages.csv', sinks=None, keep_reviews=True,
+                           resume=False, checkpoint_file=None, start_page=1, metrics_file=None,
+                           prometheus_file=None):
+        """
+        Scrape reviews from multiple pages
+
+        Uses Selenium to click through pagination by default, or fetches the
+        page URLs directly when an HTTP fetch backend is configured. Reviews are
+        streamed to the output sinks page by page, so a crashed run keeps
+        everything parsed before the crash.
+
+        Args:
+            max_pages (int): Maximum number of pages to scrape
+            output_file (str): Base output path for the default sinks
+            sinks (list): ReviewSink instances to write to (default: one per
+                format in output_formats, named after output_file)
+            keep_reviews (bool): Also collect reviews in memory and return them;
+                pass False to keep memory flat on very long crawls
+            resume (bool): Continue an interrupted crawl from its checkpoint,
+                appending to the existing output files (max_pages still counts
+                from page 1; only reviews from this run are returned)
+            checkpoint_file (str): Checkpoint path, kept and marked completed
+                when the crawl finishes (default: next to output_file, and
+                removed once the crawl finishes; only a crawl that stopped
+                early leaves it behind to resume from)
+            start_page (int): First page to scrape, for crawls split into page
+                ranges (max_pages is still the last page number, not a count)
+            metrics_file (str): Write the per-stage timing report here as JSON
+            prometheus_file (str): Also write the run totals in Prometheus text format
+        """
+        self.sinks = sinks if sinks is not None else create_sinks(output_file, self.output_formats)
+        self.all_reviews = []
+        self.keep_reviews = keep_reviews
+        self.reviews_emitted = 0
+        self.resume_url = None
+        self.crawl_error = None
+        self.metrics.reset()
+        self.checkpoint = CrawlCheckpoint(checkpoint_file or CrawlCheckpoint.path_for(output_file))
+        if resume:
+            start_page = max(start_page, self._restore_checkpoint())
+
+        try:
+            if start_page > max_pages:
+                logger.info(f"Already past page {max_pages} (starting at page {start_page}) - nothing left to scrape")
+                page_count = start_page - 1
+            elif self.fetch_backend == 'selenium':
+                page_count = self._scrape_with_selenium(max_pages, start_page)
+            elif self.concurrency > 1:
+                page_count = self._scrape_concurrently(max_pages, start_page)
+            else:
+                page_count = self._scrape_with_http(max_pages, start_page)
+        finally:
+            for sink in self.sinks:
+                sink.close()
+
+        if self.crawl_error is None:
+            if checkpoint_file:
+                # The caller owns this checkpoint (e.g. to skip finished shards on resume)
+                self.checkpoint.mark_completed()
+            else:
+                self.checkpoint.clear()
+        else:
+            logger.warning(f"Crawl stopped early - rerun with resume=True to continue from {self.checkpoint.path}")
+
+        logger.info(f"=== SCRAPING COMPLETE ===")
+        logger.info(f"Total reviews scraped: {self.reviews_emitted}")
+        logger.info(f"Total pages scraped: {page_count}")
+        self.metrics.finish()
+        for line in self.metrics.summary_lines():
+            logger.info(line)
+        if metrics_file:
+            self.metrics.write_report(metrics_file)
+            logger.info(f"Run metrics saved to {metrics_file}")
+        if prometheus_file:
+            self.metrics.write_prometheus(prometheus_file)
+        if self.http_cache is not None:
+            stats = self.http_cache.stats()
+            logger.info(f"HTTP cache: {stats['hits']} fresh hits, {stats['revalidated']} not modified, "
+                        f"{stats['misses']} fetched, ~{stats['bytes_saved'] / 1024:.0f} KB not transferred, "
+                        f"{stats['parse_hits']} pages not re-parsed")
+        if self.fetch_controller is not None:
+            stats = self.fetch_controller.stats()
+            logger.info(f"Fetch control: {stats['retries']} retries, outcomes {stats['outcomes']}")
+        if self.resource_blocking:
+            stats = self.resource_stats.summary()
+            logger.info(f"Browser requests: {stats['requests']} ({stats['blocked_requests']} blocked), "
+                        f"{stats['bytes_transferred'] / 1024:.0f} KB transferred, "
+                        f"~{stats['estimated_bytes_saved'] / 1024:.0f} KB saved by blocking")
+
+        return self.all_reviews
+
+    def _scrape_with_http(self, max_pages, start_page=1):
+        """
+        Fetch RT-P.html?page=N pages directly, falling back to Chrome for pages that need JS
+        """
+        page_count = start_page - 1
+        if self.proxy_pool is not None:
+            fetcher = ProxiedFetcher(self.proxy_pool, self.fetch_backend, review_marker=self.review_marker,
+                                     user_agent=self.user_agent)
+        else:
+            fetcher = create_fetcher(self.fetch_backend, user_agent=self.user_agent, proxy_url=self.proxy_url)
+        if self.fetch_controller is not None:
+            fetcher = self.fetch_controller.wrap(fetcher, self.review_marker)
+        if self.http_cache is not None:
+            fetcher = CachingFetcher(fetcher, self.http_cache)
+        fallback = SeleniumFetcher(self)
+
+        try:
+            logger.info(f"Starting to fetch reviews from: {self.start_url} ({fetcher.name} backend)")
+
+            while page_count < max_pages:
+                page_number = page_count + 1
+                url = build_page_url(self.start_url, page_number, self.page_url_template)
+                logger.info(f"=== Fetching page {page_number} ===")
+                logger.debug(f"URL: {url}")
+                self.metrics.current_page = page_number
+
+                if self.fetch_controller is None:
+                    # A ControlledFetcher paces its own requests
+                    self.polite_wait(url)
+                with self.metrics.stage('navigation'):
+                    page = fetcher.fetch(url)
+                outcome = classify_response(page, self.review_marker)
+                if outcome == END_OF_RESULTS:
+                    logger.info(f"No more pages (HTTP {page.status_code})")
+                    break
+                if outcome != FETCH_OK:
+                    raise FetchFailed(url, outcome, page.status_code if page else None)
+
+                if needs_javascript(page.html, self.review_marker):
+                    logger.warning("Page has no static review markup, falling back to Chrome")
+                    page = fallback.fetch(url)
+                    if page is None:
+                        raise FetchFailed(url, FAILED)
+
+                self.archive_page(page.html, page_number, page.url, page.status_code)
+                page_reviews = self.parse_page(page.html, page_number, page.url, page.body_hash)
+                if not page_reviews:
+                    logger.info("No reviews on page - reached end of results")
                     break
 
+                new_reviews, page_known = self.filter_new_reviews(page_reviews)
+                self.complete_page(new_reviews, page_number, page.url)
                 page_count += 1
+                if page_known:
+                    break
+
+        except Exception as e:
+            logger.error(f"Error during scraping: {e}")
+            self.crawl_error = e
+        finally:
+            fetcher.close()
+            fallback.close()
+
+        return page_count
+
+    def _scrape_concurrently(self, max_pages, start_page=1):
+        """
+        Fetch pages 1..max_pages with a bounded pool of async workers
+
+        Pages are written and checkpointed in page order as soon as every
+        earlier page is done, so only pages that finished ahead of an earlier
+        one are held in memory. The crawl ends at the first page that fails or
+        has no reviews, exactly like the sequential crawl.
+        """
+        page_count = start_page - 1
+        page_numbers = list(range(start_page, max_pages + 1))
+        urls = [build_page_url(self.start_url, page_number, self.page_url_template) for page_number in page_numbers]
+        fetcher = AsyncPageFetcher(
+            backend=self.fetch_backend,
+            concurrency=self.concurrency,
+            requests_per_second=self.requests_per_second,
+            user_agent=self.user_agent,
+            proxy_url=self.proxy_url,
+            proxy_pool=self.proxy_pool,
+            http_cache=self.http_cache,
+            domain_limiter=self.domain_limiter,
+            fetch_controller=self.fetch_controller,
+            review_marker=self.review_marker,
+        )
+        fallback = SeleniumFetcher(self)
+
+        def handle_page(index, page):
+            outcome = classify_response(page, self.review_marker)
+            if outcome == END_OF_RESULTS:
+                return StopCrawl(None)
+            if outcome != FETCH_OK:
+                raise FetchFailed(urls[index], outcome, page.status_code if page else None)
+            self.metrics.record('navigation', page.elapsed, page_numbers[index])
+            if needs_javascript(page.html, self.review_marker):
+                # Re-fetched in Chrome by emit_page, in page order
+                return page
+            self.archive_page(page.html, page_numbers[index], page.url, page.status_code)
+            page_reviews = self.parse_page(page.html, page_numbers[index], page.url, page.body_hash)
+            if not page_reviews:
+                return StopCrawl([])
+            if self.seen_index is not None and self.seen_index.all_seen(page_reviews):
+                # Nothing new past here; filter_new_reviews ends the crawl on this page
+                return StopCrawl(page_reviews)
+            return page_reviews
+
+        def emit_page(index, result):
+            # Called in page order as soon as every earlier page has been written
+            nonlocal page_count
+            page_number = page_numbers[index]
+            if isinstance(result, FetchedPage):
+                self.metrics.current_page = page_number
+                logger.warning(f"Page {page_number} has no static review markup, falling back to Chrome")
+                page = fallback.fetch(result.url)
+                if page is None:
+                    raise FetchFailed(result.url, FAILED)
+                self.archive_page(page.html, page_number, page.url, page.status_code)
+                result = self.parse_page(page.html, page_number, page.url, page.body_hash)
+
+            if not result:
+                logger.info("No more pages")
+                return StopCrawl()
+
+            new_reviews, page_known = self.filter_new_reviews(result)
+            self.complete_page(new_reviews, page_number, result[0]['source_url'])
+            page_count += 1
+            return StopCrawl() if page_known else None
 
+        try:
+            logger.info(f"Starting to fetch up to {max_pages} pages from: {self.start_url} "
+                        f"({self.fetch_backend} backend, concurrency {self.concurrency})")
+            fetcher.fetch_all(urls, handle_page, emit_page)
         except Exception as e:
-            print(f"Error during scraping: {e}")
+            logger.error(f"Error during scraping: {e}")
+            self.crawl_error = e
         finally:
-            if self.driver:
-                self.driver.quit()
-                print("Browser closed")
+            fallback.close()
+
+        return page_count
 
-        print(f"\n=== SCRAPING COMPLETE ===")
-        print(f"Total reviews scraped: {len(all_reviews)}")
-        print(f"Total pages scraped: {page_count}")
+    def _scrape_with_selenium(self, max_pages, start_page=1):
+        """
+        Click through pagination in Chrome
+        """
+        from selenium.common.exceptions import TimeoutException
 
-        # Save to files
-        if all_reviews:
-            self.save_to_csv(all_reviews, output_file)
-            self.save_to_json(all_reviews, output_file.replace('.csv', '.json'))
+        if not self.setup_driver():
+            self.crawl_error = RuntimeError("Chrome driver could not be started")
+            return start_page - 1
+
+        page_count = start_page - 1
+
+        try:
+            if start_page > 1 and self.resume_url:
+                # Reopen the last completed page and paginate past it
+                logger.info(f"Resuming from: {self.resume_url}")
+                self.metrics.current_page = start_page
+                self.polite_wait(self.resume_url)
+                with self.metrics.stage('navigation'):
+                    self.driver.get(self.resume_url)
+                if not self.waiter.wait_for_reviews(timeout=10) or not self.go_to_next_page():
+                    raise TimeoutException(f"Could not paginate past {self.resume_url}")
+            else:
+                first_url = build_page_url(self.start_url, start_page, self.page_url_template)
+                logger.info(f"Starting to scrape reviews from: {first_url}")
+                self.metrics.current_page = start_page
+                self.polite_wait(first_url)
+                with self.metrics.stage('navigation'):
+                    self.driver.get(first_url)
+
+                # Wait for page to load
+                if not self.waiter.wait_for_reviews(timeout=10):
+                    raise TimeoutException("No review items appeared on the start page")
+
+            while page_count < max_pages:
+                logger.info(f"=== Scraping page {page_count + 1} ===")
+                current_url = self.driver.current_url
+                logger.debug(f"Current URL: {current_url}")
+
+                if self.extraction_mode == 'browser':
+                    page_reviews = self.extract_page_in_browser(page_count + 1, current_url)
+                else:
+                    # Get page source, archive it and parse it
+                    with self.metrics.stage('page_source'):
+                        page_source = self.driver.page_source
+                    self.note_driver_page()
+                    self.archive_page(page_source, page_count + 1, current_url)
+                    page_reviews = self.parse_page(page_source, page_count + 1, current_url)
+                new_reviews, page_known = self.filter_new_reviews(page_reviews)
+                self.complete_page(new_reviews, page_count + 1, current_url)
+                if page_known:
+                    page_count += 1
+                    break
+
+                # Try to go to next page
+                self.metrics.current_page = page_count + 2
+                if not self.go_to_next_page():
+                    logger.info("No more pages")
+                    break
+
+                page_count += 1
+
+        except Exception as e:
+            logger.error(f"Error during scraping: {e}")
+            self.crawl_error = e
+        finally:
+            self.release_driver()
 
-        return all_reviews
+        return page_count
 
     def save_to_csv(self, reviews, filename):
         """
         Save reviews to CSV file
         """
         if not reviews:
-            print("No reviews to save")
+            logger.info("No reviews to save")
             return
 
         fieldnames = ['review_title', 'review_text', 'rating', 'reviewer_name', 'review_date', 'user_recommendation', 'page_number', 'source_url']
@@ -437,21 +1057,25 @@ class LevisReviewsScraperMultiPage:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             for review in reviews:
-                writer.writerow(review)
+                writer.writerow(as_dict(review))
 
-        print(f"Reviews saved to {filename}")
+        logger.info(f"Reviews saved to {filename}")
 
     def save_to_json(self, reviews, filename):
         """
         Save reviews to JSON file
         """
         with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(reviews, jsonfile, indent=2, ensure_ascii=False)
+            json.dump([as_dict(review) for review in reviews], jsonfile, indent=2, ensure_ascii=False)
 
-        print(f"Reviews saved to {filename}")
+        logger.info(f"Reviews saved to {filename}")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Scrape Levi's reviews with Chrome browser automation")
+    parser.add_argument('--pages', type=int, default=5, help="How many pages to scrape (default 5)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("Levi's Reviews Multi-Page Scraper (with Selenium)")
     print("=" * 60)
 
@@ -466,7 +1090,7 @@ def main():
     scraper = LevisReviewsScraperMultiPage(use_brightdata=use_brightdata)
 
     # Start scraping
-    max_pages = int(input("How many pages to scrape? (default 5): ") or "5")
+    max_pages = args.pages
 
     print(f"\nStarting to scrape up to {max_pages} pages...")
     print("This will use Chrome browser automation to navigate through pages.")
@@ -0,0 +1,331 @@
+import argparse
+import email.utils
+import hashlib
+import html
+import http.server
+import logging
+import os
+import random
+import re
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+WORDS = (
+    "jeans fit waist size order returned quality denim stitching color faded wash "
+    "customer service refund store online shipping late package wrong pair zipper "
+    "broke after week great comfortable love these again never buying disappointed "
+    "exchange manager receipt policy sale price button pocket hem length tight loose"
+).split()
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+FIXTURE_PATTERN = re.compile(r'page_(\d+)\.html$')
+
+BLOCK_PAGE = (b"<html><head><title>Access denied</title></head><body>"
+              b"<h1>Are you a robot?</h1><p>Please complete the captcha to continue.</p></body></html>")
+
+
+def _sentence(rng, words):
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def generate_review_item(rng, page_number, index):
+    """
+    HTML for one synthetic review-item, using the same markup as the live site
+    """
+    rating = rng.randint(1, 5)
+    paragraphs = ''.join(f"<p>{html.escape(_sentence(rng, rng.randint(8, 30)))}</p>"
+                         for _ in range(rng.randint(1, 3)))
+    recommendation = rng.choice(["User's recommendation: Don't buy.", "User's recommendation: Check the fit first.",
+                                 "Verified purchase"])
+    return (
+        f'<div class="review-item" data-review-id="{page_number}-{index}">'
+        f'<div class="f-component-info-header"><h3>{html.escape(_sentence(rng, rng.randint(3, 8)))}</h3></div>'
+        f'<div class="row-inline mb24px-desktop"><span class="review-date">{rng.choice(MONTHS)} '
+        f'{rng.randint(1, 28):02d}, {rng.randint(2015, 2025)}</span>'
+        f'<span class="rating-value">{rating}.0</span><a class="rating-details">Rating Details</a></div>'
+        f'<div class="avatar"><span class="avatar-name">Reviewer {page_number}-{index}</span></div>'
+        f'<div class="f-component-text review_text_container review-track">{paragraphs}</div>'
+        f'<p class="word-break-break-word">{recommendation}</p>'
+        f'</div>\n'
+    )
+
+
+def generate_review_page(page_number, reviews_per_page=20, total_pages=10, base_url='', seed=1):
+    """
+    Deterministic synthetic review listing page with pagination links
+
+    Includes the page furniture the parser has to skip (navigation, scripts,
+    an empty review-item placeholder) so parse timings are realistic.
+    """
+    rng = random.Random(seed * 1000003 + page_number)
+    items = ''.join(generate_review_item(rng, page_number, index) for index in range(reviews_per_page))
+
+    def page_href(number):
+        return f"{base_url}/review.html" if number == 1 else f"{base_url}/RT-P.html?page={number}"
+
+    links = []
+    if page_number > 1:
+        links.append(f'<a class="prev" href="{page_href(page_number - 1)}">Prev</a>')
+    for number in range(max(1, page_number - 2), min(total_pages, page_number + 2) + 1):
+        links.append(f'<a href="{page_href(number)}">{number}</a>')
+    if page_number < total_pages:
+        links.append(f'<a class="next" href="{page_href(page_number + 1)}">Next</a>')
+
+    return (
+        "<!DOCTYPE html><html><head><title>Levi's Reviews</title>"
+        "<script>window.dataLayer = window.dataLayer || [];</script>"
+        "<style>.review-item{margin:1em}</style></head><body>"
+        "<header><nav><a href='/customer-service'>Customer service</a> <a href='/contact'>Contact</a></nav></header>"
+        f"<main><h1>Levi's reviews - page {page_number}</h1>"
+        '<div class="review-item"><div class="f-component-text review_text_container review-track"></div></div>\n'
+        f"{items}"
+        f'<div class="pagination">{" ".join(links)}</div>'
+        "</main><footer><script>/* analytics */</script></footer></body></html>"
+    )
+
+
+class LocalReviewServer:
+    """
+    Local stand-in for the review site, for offline runs and benchmarks
+
+    Serves /review.html and /RT-P.html?page=N from a fixtures directory of
+    recorded pages (page_1.html, page_2.html, ...; see export_fixtures), or
+    from generate_review_page when no fixture exists. Pages past total_pages
+    return 404, like the end of results on the live site. Pages carry an ETag
+    and Last-Modified and conditional requests for unchanged pages get a 304.
+
+    For testing fetch control it can also misbehave like the live site: fail
+    a share of requests with a 500, answer some with a 200 captcha page, and
+    rate-limit with 429 + Retry-After above a request rate. Injected faults
+    are counted in faults.
+
+    Usage:
+        with LocalReviewServer(total_pages=20) as server:
+            scraper = LevisReviewsScraperMultiPage(base_url=server.base_url)
+    """
+
+    def __init__(self, fixtures_dir=None, total_pages=None, reviews_per_page=20, host='127.0.0.1', port=0, seed=1,
+                 error_rate=0.0, block_rate=0.0, rate_limit=None):
+        """
+        Args:
+            fixtures_dir (str): Directory of recorded page_N.html files
+            total_pages (int): Last page served (default: the highest fixture
+                page when fixtures are given)
+            reviews_per_page (int): Reviews on each synthetic page
+            host (str): Interface to listen on
+            port (int): Port to listen on (0 picks a free port)
+            seed (int): Seed for the synthetic pages (and the injected faults)
+            error_rate (float): Share of page requests answered with a 500
+            block_rate (float): Share of page requests answered with a block page
+            rate_limit (float): Page requests per second above which a 429
+                with Retry-After is returned (None = unlimited)
+        """
+        self.fixtures = {}
+        if fixtures_dir:
+            for name in os.listdir(fixtures_dir):
+                match = FIXTURE_PATTERN.match(name)
+                if match:
+                    self.fixtures[int(match.group(1))] = os.path.join(fixtures_dir, name)
+            if self.fixtures and total_pages is None:
+                total_pages = max(self.fixtures)
+        self.total_pages = total_pages or 10
+        self.reviews_per_page = reviews_per_page
+        self.seed = seed
+        self.requests_served = 0
+        self.not_modified = 0
+        self.bytes_served = 0
+        self.error_rate = error_rate
+        self.block_rate = block_rate
+        self.rate_limit = rate_limit
+        self.faults = {'error': 0, 'blocked': 0, 'throttled': 0}
+        self._fault_random = random.Random(seed)
+        self._recent_requests = []
+        self.last_modified = email.utils.formatdate(time.time(), usegmt=True)
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.server = http.server.ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.host, self.port = self.server.server_address[:2]
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def start_url(self):
+        return f"{self.base_url}/review.html"
+
+    def page_html(self, page_number):
+        """
+        HTML for a page number, or None if it is past the last page
+        """
+        if page_number < 1 or page_number > self.total_pages:
+            return None
+        with self._lock:
+            if page_number not in self._cache:
+                path = self.fixtures.get(page_number)
+                if path:
+                    with open(path, 'rb') as f:
+                        body = f.read()
+                else:
+                    body = generate_review_page(page_number, self.reviews_per_page, self.total_pages,
+                                                self.base_url, self.seed).encode('utf-8')
+                self._cache[page_number] = body
+            return self._cache[page_number]
+
+    def inject_fault(self):
+        """
+        Pick the fault (if any) for one page request: 'throttled', 'error', 'blocked' or None
+        """
+        with self._lock:
+            if self.rate_limit:
+                now = time.monotonic()
+                self._recent_requests = [t for t in self._recent_requests if now - t < 1.0]
+                if len(self._recent_requests) >= self.rate_limit:
+                    self.faults['throttled'] += 1
+                    return 'throttled'
+                self._recent_requests.append(now)
+            roll = self._fault_random.random()
+            if roll < self.error_rate:
+                self.faults['error'] += 1
+                return 'error'
+            if roll < self.error_rate + self.block_rate:
+                self.faults['blocked'] += 1
+                return 'blocked'
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                page_number = None
+                if url.path == '/review.html':
+                    page_number = 1
+                elif url.path == '/RT-P.html':
+                    try:
+                        page_number = int(parse_qs(url.query).get('page', ['1'])[0])
+                    except ValueError:
+                        page_number = None
+
+                body = server.page_html(page_number) if page_number is not None else None
+                server.requests_served += 1
+                if body is None:
+                    self._send(404, b"<html><body><h1>Page not found</h1></body></html>")
+                    return
+
+                fault = server.inject_fault()
+                if fault == 'throttled':
+                    self._send(429, b"<html><body><h1>Too many requests</h1></body></html>", {'Retry-After': '1'})
+                    return
+                if fault == 'error':
+                    self._send(500, b"<html><body><h1>Internal server error</h1></body></html>")
+                    return
+                if fault == 'blocked':
+                    self._send(200, BLOCK_PAGE)
+                    return
+
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                validators = {'ETag': etag, 'Last-Modified': server.last_modified}
+                if_none_match = self.headers.get('If-None-Match')
+                if (if_none_match == etag or
+                        (if_none_match is None and self.headers.get('If-Modified-Since') == server.last_modified)):
+                    server.not_modified += 1
+                    self._send(304, b"", validators)
+                    return
+                self._send(200, body, validators)
+
+            def _send(self, status, body, headers=None):
+                server.bytes_served += len(body)
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Local review server on {self.start_url} ({self.total_pages} pages)")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def export_fixtures(archive_dir, fixtures_dir):
+    """
+    Write the newest archived copy of each page as page_N.html fixtures
+
+    Returns:
+        int: Number of fixture files written
+    """
+    from page_archive import PageArchive
+
+    os.makedirs(fixtures_dir, exist_ok=True)
+    written = 0
+    archive = PageArchive(archive_dir)
+    for record, page_source in archive.iter_pages(latest_only=True):
+        if record.get('page_number') and record.get('status_code', 200) == 200:
+            with open(os.path.join(fixtures_dir, f"page_{record['page_number']}.html"), 'w', encoding='utf-8') as f:
+                f.write(page_source)
+            written += 1
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded or synthetic review pages locally")
+    parser.add_argument('--fixtures', default=None, help="Directory of page_N.html fixtures")
+    parser.add_argument('--export-from-archive', default=None, metavar='ARCHIVE_DIR',
+                        help="Write fixtures from a page archive into --fixtures and exit")
+    parser.add_argument('--pages', type=int, default=None, help="Number of pages to serve (default 10)")
+    parser.add_argument('--reviews-per-page', type=int, default=20)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with a 500")
+    parser.add_argument('--block-rate', type=float, default=0.0, help="Share of requests answered with a block page")
+    parser.add_argument('--rate-limit', type=float, default=None, help="Requests per second before 429s")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if args.export_from_archive:
+        if not args.fixtures:
+            parser.error("--export-from-archive needs --fixtures")
+        print(f"Wrote {export_fixtures(args.export_from_archive, args.fixtures)} fixtures to {args.fixtures}")
+        return
+
+    server = LocalReviewServer(args.fixtures, args.pages, args.reviews_per_page, port=args.port,
+                               error_rate=args.error_rate, block_rate=args.block_rate, rate_limit=args.rate_limit)
+    print(f"Serving {server.total_pages} pages at {server.start_url}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import argparse
+import base64
+import http.server
+import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+
+BLOCK_PAGE = b"<html><body><h1>Access denied</h1><p>Please complete the captcha to continue.</p></body></html>"
+
+
+def session_from_headers(headers):
+    """
+    Session id from a Proxy-Authorization header ('...-session-<id>:password')
+    """
+    auth = headers.get('Proxy-Authorization', '')
+    if not auth.lower().startswith('basic '):
+        return None
+    try:
+        username = base64.b64decode(auth.split(None, 1)[1]).decode('utf-8').split(':', 1)[0]
+    except ValueError:
+        return None
+    return username.rsplit('-session-', 1)[-1]
+
+
+class MockProxyServer:
+    """
+    Local forward HTTP proxy that imitates sticky proxy sessions
+
+    Sessions are identified by the Proxy-Authorization username (same format
+    as BrightData: '...-session-<id>'). A session is "blocked" after
+    block_after requests, or immediately if listed in blocked_sessions, and
+    then gets block_status with a captcha page, so ProxyPool rotation can be
+    exercised against the local review server without a real proxy.
+
+    Usage:
+        with MockProxyServer(block_after=5) as proxy:
+            pool = ProxyPool(proxy.url_template(), size=3)
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, block_after=None, blocked_sessions=(),
+                 block_status=429, latency=0.0):
+        """
+        Args:
+            host (str): Interface to listen on
+            port (int): Port to listen on (0 picks a free port)
+            block_after (int): Requests a session may make before it is blocked
+            blocked_sessions (iterable): Session ids that are blocked from the start
+            block_status (int): HTTP status returned to blocked sessions
+            latency (float): Extra seconds added to every forwarded request
+        """
+        self.block_after = block_after
+        self.blocked_sessions = set(blocked_sessions)
+        self.block_status = block_status
+        self.latency = latency
+        self.requests_by_session = {}
+        self._lock = threading.Lock()
+        self.server = http.server.ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.host, self.port = self.server.server_address[:2]
+        self._thread = None
+
+    def url_template(self):
+        """Proxy URL template for ProxyPool pointing at this server"""
+        return f"http://mock-session-{{session}}:secret@{self.host}:{self.port}"
+
+    def block(self, session_id):
+        with self._lock:
+            self.blocked_sessions.add(session_id)
+
+    def _is_blocked(self, session_id):
+        with self._lock:
+            count = self.requests_by_session.get(session_id, 0) + 1
+            self.requests_by_session[session_id] = count
+            if self.block_after is not None and count > self.block_after:
+                self.blocked_sessions.add(session_id)
+            return session_id in self.blocked_sessions
+
+    def _handler_class(self):
+        proxy = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def _send(self, status, body, content_type='text/html; charset=utf-8'):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                session_id = session_from_headers(self.headers)
+                if session_id is None:
+                    self._send(407, b"Proxy authentication required")
+                    return
+                if proxy._is_blocked(session_id):
+                    self._send(proxy.block_status, BLOCK_PAGE)
+                    return
+                if proxy.latency:
+                    time.sleep(proxy.latency)
+
+                headers = {key: value for key, value in self.headers.items()
+                           if key.lower() not in ('proxy-authorization', 'proxy-connection', 'connection', 'host')}
+                request = urllib.request.Request(self.path, headers=headers)
+                opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+                try:
+                    with opener.open(request, timeout=30) as response:
+                        self._send(response.status, response.read(),
+                                   response.headers.get('Content-Type', 'text/html'))
+                except urllib.error.HTTPError as e:
+                    self._send(e.code, e.read(), e.headers.get('Content-Type', 'text/html'))
+                except (urllib.error.URLError, OSError) as e:
+                    self._send(502, f"Bad gateway: {e}".encode('utf-8'), 'text/plain')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Mock proxy listening on {self.host}:{self.port}")
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local mock proxy with sticky, blockable sessions")
+    parser.add_argument('--port', type=int, default=8899)
+    parser.add_argument('--block-after', type=int, default=None,
+                        help="Block each session after this many requests")
+    parser.add_argument('--block-status', type=int, default=429)
+    parser.add_argument('--latency', type=float, default=0.0, help="Extra seconds per request")
+    args = parser.parse_args()
+
+    proxy = MockProxyServer(port=args.port, block_after=args.block_after,
+                            block_status=args.block_status, latency=args.latency)
+    print(f"Proxy URL template: {proxy.url_template()}")
+    try:
+        proxy.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
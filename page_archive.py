@@ -0,0 +1,170 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+class PageArchive:
+    """
+    Compressed, content-addressed store of raw fetched pages
+
+    Page bodies are stored once per unique content under
+    objects/<hash[:2]>/<hash>.html.zst (or .html.gz when zstandard is not
+    installed). Every fetch appends a line to index.jsonl keyed by URL plus
+    fetch time, pointing at the body it returned and the fingerprint of the
+    review schema it was crawled with; the schema's selectors are kept under
+    schemas/<fingerprint>.json so the pages can be re-parsed the same way.
+    """
+
+    def __init__(self, root_dir, compression=None, level=None):
+        """
+        Args:
+            root_dir (str): Directory holding the archive
+            compression (str): 'zstd' or 'gzip' (default: zstd when installed)
+            level (int): Compression level (default 10 for zstd, 6 for gzip)
+        """
+        self.root_dir = root_dir
+        self.objects_dir = os.path.join(root_dir, 'objects')
+        self.index_path = os.path.join(root_dir, 'index.jsonl')
+        self.schemas_dir = os.path.join(root_dir, 'schemas')
+
+        if compression is None:
+            compression = 'zstd' if _zstd() else 'gzip'
+        if compression == 'zstd' and not _zstd():
+            raise ImportError("zstandard is required for zstd compression. Please install: pip install zstandard")
+        if compression not in ('zstd', 'gzip'):
+            raise ValueError(f"Unknown compression: {compression!r}")
+        self.compression = compression
+        self.level = level if level is not None else (10 if compression == 'zstd' else 6)
+
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+    def _object_path(self, content_hash, compression):
+        extension = 'zst' if compression == 'zstd' else 'gz'
+        return os.path.join(self.objects_dir, content_hash[:2], f"{content_hash}.html.{extension}")
+
+    def _compress(self, data):
+        if self.compression == 'zstd':
+            return _zstd().ZstdCompressor(level=self.level).compress(data)
+        return gzip.compress(data, compresslevel=self.level)
+
+    def store_schema(self, fingerprint, selectors):
+        """
+        Record the selectors of a review schema (see review_fields.schema_selectors)
+        """
+        path = os.path.join(self.schemas_dir, f"{fingerprint}.json")
+        if os.path.exists(path):
+            return
+        os.makedirs(self.schemas_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(selectors, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def schemas(self):
+        """
+        Return every recorded schema as {fingerprint: selectors}
+        """
+        schemas = {}
+        if not os.path.isdir(self.schemas_dir):
+            return schemas
+        for name in os.listdir(self.schemas_dir):
+            if name.endswith('.json'):
+                with open(os.path.join(self.schemas_dir, name), encoding='utf-8') as f:
+                    schemas[name[:-len('.json')]] = json.load(f)
+        return schemas
+
+    def store(self, url, html, page_number=None, fetched_at=None, status_code=200, schema=None):
+        """
+        Store a fetched page and append it to the index
+
+        Args:
+            schema (str): Fingerprint of the review schema the page is parsed
+                with (see store_schema)
+
+        Returns:
+            dict: The index record for this fetch
+        """
+        fetched_at = fetched_at or datetime.now(timezone.utc).isoformat()
+        body = html.encode('utf-8')
+        content_hash = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(content_hash, self.compression)
+
+        # Identical bodies are only written once
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            tmp_path = f"{object_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(self._compress(body))
+            os.replace(tmp_path, object_path)
+
+        record = {
+            'key': hashlib.sha256(f"{url}\n{fetched_at}".encode('utf-8')).hexdigest(),
+            'url': url,
+            'fetched_at': fetched_at,
+            'page_number': page_number,
+            'status_code': status_code,
+            'content_hash': content_hash,
+            'compression': self.compression,
+            'size': len(body),
+            'schema': schema,
+        }
+        with self._lock:
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+        return record
+
+    def iter_records(self, latest_only=False):
+        """
+        Iterate over index records in fetch order
+
+        Args:
+            latest_only (bool): Only yield the most recent fetch of each URL
+        """
+        if not os.path.exists(self.index_path):
+            return
+
+        if latest_only:
+            latest = {}
+            for record in self.iter_records():
+                latest[record['url']] = record
+            yield from sorted(latest.values(), key=lambda r: (r['page_number'] or 0, r['fetched_at']))
+            return
+
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def read(self, record):
+        """
+        Return the HTML stored for an index record
+        """
+        with open(self._object_path(record['content_hash'], record['compression']), 'rb') as f:
+            data = f.read()
+        if record['compression'] == 'zstd':
+            zstandard = _zstd()
+            if zstandard is None:
+                raise ImportError("zstandard is required to read zstd archives. Please install: pip install zstandard")
+            data = zstandard.ZstdDecompressor().decompress(data, max_output_size=max(record['size'], 1))
+        else:
+            data = gzip.decompress(data)
+        return data.decode('utf-8')
+
+    def iter_pages(self, latest_only=False):
+        """
+        Iterate over (record, html) pairs
+        """
+        for record in self.iter_records(latest_only=latest_only):
+            yield record, self.read(record)
@@ -0,0 +1,262 @@
+import logging
+import re
+import time
+from urllib.parse import urljoin
+
+logger = logging.getLogger(__name__)
+
+
+# Paginated review pages follow the same pattern click_next_page looks for
+PAGE_URL_PATTERN = re.compile(r'RT-P\.html\?page=(\d+)')
+PAGE_URL_TEMPLATE = "RT-P.html?page={page}"
+
+# Class of the element wrapping each review on PissedConsumer (review_fields.REVIEW_ITEM.marker)
+REVIEW_MARKER = "review-item"
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+def build_page_url(start_url, page_number, page_url_template=PAGE_URL_TEMPLATE):
+    """
+    Build the URL of a review listing page
+
+    Page 1 is the start URL itself; later pages are resolved relative to it
+    using the RT-P.html?page=N pattern.
+    """
+    if page_number <= 1:
+        return start_url
+    return urljoin(start_url, page_url_template.format(page=page_number))
+
+
+def page_url_pattern(page_url_template):
+    """
+    Regex matching URLs built from a page URL template, capturing the page number
+    """
+    return re.compile(re.escape(page_url_template).replace(re.escape('{page}'), r'(\d+)'))
+
+
+def page_number_from_url(url, pattern=PAGE_URL_PATTERN):
+    """
+    Return the page number encoded in a review listing URL (1 for the start page)
+    """
+    match = pattern.search(url or "")
+    return int(match.group(1)) if match else 1
+
+
+def needs_javascript(html, review_marker=REVIEW_MARKER):
+    """
+    Heuristic check for pages that only render reviews client-side
+
+    A static fetch that comes back without any review markup (review_marker,
+    see review_fields.Locator.marker) is either a JS challenge page or a page
+    whose content is injected by scripts.
+    """
+    return not html or review_marker not in html
+
+
+class FetchedPage:
+    """
+    Result of fetching a single page through any fetcher backend
+    """
+
+    def __init__(self, url, html, status_code=200, headers=None, elapsed=0.0, backend=None,
+                 body_hash=None, cache_status=None):
+        self.url = url
+        self.html = html
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.elapsed = elapsed
+        self.backend = backend
+        # Set by http_cache.CachingFetcher: hash of html, and 'hit'/'revalidated'/'miss'
+        self.body_hash = body_hash
+        self.cache_status = cache_status
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 300 and bool(self.html)
+
+
+class PageFetcher:
+    """
+    Base class for page fetcher backends
+    """
+    name = "base"
+
+    def fetch(self, url, headers=None):
+        """
+        Fetch a URL and return a FetchedPage (or None if the fetch failed)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class RequestsFetcher(PageFetcher):
+    """
+    Fetch pages over a pooled requests.Session
+    """
+    name = "requests"
+
+    def __init__(self, user_agent=DEFAULT_USER_AGENT, proxy_url=None, timeout=30, pool_size=10):
+        """
+        Args:
+            user_agent (str): User agent header sent with each request
+            proxy_url (str): Optional http(s) proxy URL, e.g. a BrightData session
+            timeout (float): Per-request timeout in seconds
+            pool_size (int): Number of keep-alive connections to keep per host
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._requests = requests
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
+        if proxy_url:
+            self.session.proxies.update({'http': proxy_url, 'https': proxy_url})
+
+    def fetch(self, url, headers=None):
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except self._requests.RequestException as e:
+            logger.error(f"❌ Error fetching {url}: {e}")
+            return None
+
+        return FetchedPage(
+            url=response.url,
+            html=response.text,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            elapsed=time.perf_counter() - started,
+            backend=self.name,
+        )
+
+    def close(self):
+        self.session.close()
+
+
+class HttpxFetcher(PageFetcher):
+    """
+    Fetch pages over a pooled httpx.Client (HTTP/2 capable)
+    """
+    name = "httpx"
+
+    def __init__(self, user_agent=DEFAULT_USER_AGENT, proxy_url=None, timeout=30, pool_size=10):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("httpx is required for the httpx backend. Please install: pip install httpx")
+
+        self._httpx = httpx
+        self.client = httpx.Client(
+            headers={
+                'User-Agent': user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9',
+            },
+            proxy=proxy_url,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    def fetch(self, url, headers=None):
+        started = time.perf_counter()
+        try:
+            response = self.client.get(url, headers=headers)
+        except self._httpx.HTTPError as e:
+            logger.error(f"❌ Error fetching {url}: {e}")
+            return None
+
+        return FetchedPage(
+            url=str(response.url),
+            html=response.text,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            elapsed=time.perf_counter() - started,
+            backend=self.name,
+        )
+
+    def close(self):
+        self.client.close()
+
+
+class SeleniumFetcher(PageFetcher):
+    """
+    Fetch pages by loading them in a Chrome WebDriver
+
+    Used as the fallback for pages that need JavaScript to render reviews.
+    The driver is created lazily so HTTP-only crawls never start Chrome.
+    A page whose reviews never appear is a failed fetch (None), not an empty
+    page, so a slow or broken render stops the crawl with an error instead
+    of passing for the end of results.
+    """
+    name = "selenium"
+
+    def __init__(self, scraper, wait_timeout=10):
+        """
+        Args:
+            scraper: LevisReviewsScraperMultiPage instance that owns the driver setup
+            wait_timeout (int): Seconds to wait for review items to appear
+        """
+        self.scraper = scraper
+        self.wait_timeout = wait_timeout
+
+    def fetch(self, url, headers=None):
+        if self.scraper.driver is None and not self.scraper.setup_driver():
+            return None
+
+        started = time.perf_counter()
+        driver = self.scraper.driver
+        metrics = self.scraper.metrics
+        self.scraper.polite_wait(url)
+        with metrics.stage('navigation'):
+            driver.get(url)
+        self.scraper.note_driver_page()
+        if not self.scraper.waiter.wait_for_reviews(timeout=self.wait_timeout):
+            logger.warning(f"⚠️ No review items appeared on {url}")
+            return None
+        with metrics.stage('page_source'):
+            html = driver.page_source
+
+        return FetchedPage(
+            url=driver.current_url,
+            html=html,
+            elapsed=time.perf_counter() - started,
+            backend=self.name,
+        )
+
+    def close(self):
+        self.scraper.release_driver()
+
+
+FETCHER_BACKENDS = {
+    'requests': RequestsFetcher,
+    'httpx': HttpxFetcher,
+}
+
+
+def create_fetcher(backend, **kwargs):
+    """
+    Create an HTTP fetcher backend by name ('requests' or 'httpx')
+    """
+    try:
+        fetcher_class = FETCHER_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown fetch backend: {backend!r} (expected one of {sorted(FETCHER_BACKENDS)})")
+    return fetcher_class(**kwargs)
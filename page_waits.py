@@ -0,0 +1,106 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+REVIEW_ITEM_LOCATOR = (By.CLASS_NAME, "review-item")
+
+
+def document_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+class PageWaiter:
+    """
+    Event-driven waits for the review pages, with timing for every wait
+
+    Replaces fixed sleeps: each wait returns as soon as its condition holds and
+    records how long it actually took in wait_timings.
+    """
+
+    def __init__(self, driver, timeout=15, poll_frequency=0.1, metrics=None, review_locator=REVIEW_ITEM_LOCATOR):
+        """
+        Args:
+            driver: Selenium WebDriver to wait on
+            timeout (float): Default timeout in seconds for each wait
+            poll_frequency (float): Seconds between condition checks
+            metrics (ScrapeMetrics): Optional run metrics that also get every
+                wait's duration under the 'wait' stage
+            review_locator (tuple): Selenium locator of the element wrapping
+                each review (default: the review-item class)
+        """
+        self.driver = driver
+        self.metrics = metrics
+        self.review_locator = review_locator
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.wait_timings = []
+
+    def _wait(self, name, condition, timeout=None):
+        started = time.perf_counter()
+        try:
+            WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=self.poll_frequency).until(condition)
+            succeeded = True
+        except TimeoutException:
+            succeeded = False
+
+        seconds = time.perf_counter() - started
+        self.wait_timings.append({
+            'wait': name,
+            'seconds': round(seconds, 4),
+            'succeeded': succeeded,
+        })
+        if self.metrics is not None:
+            self.metrics.record('wait', seconds)
+        return succeeded
+
+    def wait_for_document_ready(self, timeout=None):
+        """Wait until document.readyState is 'complete'"""
+        return self._wait('document_ready', document_ready, timeout)
+
+    def wait_for_reviews(self, timeout=None):
+        """Wait until at least one review-item element is present"""
+        return self._wait('reviews_present', EC.presence_of_element_located(self.review_locator), timeout)
+
+    def first_review(self):
+        """Return the first review-item element on the page, or None"""
+        reviews = self.driver.find_elements(*self.review_locator)
+        return reviews[0] if reviews else None
+
+    def wait_for_page_change(self, old_url, old_review=None, timeout=None):
+        """
+        Wait for the page to move on after a pagination click
+
+        The page has changed once the URL differs or the old first review-item
+        has gone stale; then wait for the new document and its reviews.
+        """
+        staleness = EC.staleness_of(old_review) if old_review is not None else None
+
+        def page_changed(driver):
+            return driver.current_url != old_url or (staleness is not None and staleness(driver))
+
+        if not self._wait('navigation', page_changed, timeout):
+            return False
+
+        self.wait_for_document_ready(timeout)
+        return self.wait_for_reviews(timeout)
+
+    def summary(self):
+        """
+        Aggregate wait timings by wait name
+
+        Returns:
+            dict: name -> {'count', 'total_seconds', 'max_seconds', 'timeouts'}
+        """
+        summary = {}
+        for timing in self.wait_timings:
+            stats = summary.setdefault(timing['wait'], {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'timeouts': 0})
+            stats['count'] += 1
+            stats['total_seconds'] = round(stats['total_seconds'] + timing['seconds'], 4)
+            stats['max_seconds'] = max(stats['max_seconds'], timing['seconds'])
+            if not timing['succeeded']:
+                stats['timeouts'] += 1
+        return summary
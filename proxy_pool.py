@@ -0,0 +1,271 @@
+import logging
+import threading
+import time
+
+from page_fetchers import REVIEW_MARKER, PageFetcher, create_fetcher
+
+logger = logging.getLogger(__name__)
+
+
+BRIGHTDATA_ENDPOINT = "brd.superproxy.io:22225"
+
+# Responses that mean the proxy session (its exit IP) has been flagged
+BLOCK_STATUS_CODES = {403, 407, 429, 503}
+BLOCK_MARKERS = ('captcha', 'access denied', 'are you a robot', 'unusual traffic', 'cf-chl-')
+
+
+def brightdata_url_template(api_key, endpoint=BRIGHTDATA_ENDPOINT):
+    """
+    Proxy URL template for sticky BrightData sessions ('{session}' is replaced per session)
+    """
+    return f"http://brd-customer-{api_key}-session-{{session}}:{api_key}@{endpoint}"
+
+
+def looks_blocked(page, review_marker=REVIEW_MARKER):
+    """
+    Heuristic check for a block/challenge response served through a proxy
+
+    Pages containing review markup (review_marker) are never block pages.
+    """
+    if page is None:
+        return False
+    if page.status_code in BLOCK_STATUS_CODES:
+        return True
+    if review_marker in (page.html or ''):
+        return False
+    head = (page.html or '')[:5000].lower()
+    return any(marker in head for marker in BLOCK_MARKERS)
+
+
+class ProxySession:
+    """
+    One sticky proxy session (one exit IP) and its health counters
+    """
+
+    def __init__(self, session_id, url):
+        self.session_id = session_id
+        self.url = url
+        self.latency = None
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.blocks = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.retired = False
+
+    def available(self, now=None):
+        return not self.retired and (now or time.monotonic()) >= self.cooldown_until
+
+    def stats(self):
+        return {
+            'session_id': self.session_id,
+            'requests': self.requests,
+            'successes': self.successes,
+            'failures': self.failures,
+            'blocks': self.blocks,
+            'latency': round(self.latency, 3) if self.latency is not None else None,
+            'retired': self.retired,
+        }
+
+
+class ProxyPool:
+    """
+    Pool of sticky proxy sessions shared by parallel workers
+
+    Each worker keeps the same session (and so the same exit IP) while it is
+    healthy. A session that gets blocked is retired and replaced with a fresh
+    session id; one that keeps failing is put on cooldown and retired after
+    max_consecutive_failures. Latency is tracked as an EWMA so reassignment
+    prefers the fastest available session.
+
+    Usage:
+        pool = ProxyPool.brightdata(os.getenv('BRIGHTDATA_API_KEY'), size=8)
+        session = pool.assign(worker_id)
+        ...
+        pool.report_success(session, page.elapsed)
+    """
+
+    def __init__(self, url_template, size=4, max_consecutive_failures=3, cooldown=30.0, latency_alpha=0.3,
+                 session_prefix=None):
+        """
+        Args:
+            url_template (str): Proxy URL containing '{session}', replaced by each session id
+            size (int): Number of live sessions kept in the pool
+            max_consecutive_failures (int): Failures in a row before a session is retired
+            cooldown (float): Seconds a failing session is skipped before being reused
+            latency_alpha (float): EWMA smoothing factor for session latency
+            session_prefix (str): Prefix for generated session ids (default: the
+                current Unix time); give each process its own prefix so
+                parallel pools never share an exit IP
+        """
+        self.url_template = url_template
+        self.size = max(1, int(size))
+        self.max_consecutive_failures = max_consecutive_failures
+        self.cooldown = cooldown
+        self.latency_alpha = latency_alpha
+        self._lock = threading.Lock()
+        self._id_prefix = session_prefix if session_prefix is not None else int(time.time())
+        self._created = 0
+        self.sessions = [self._new_session() for _ in range(self.size)]
+        self.assignments = {}
+        self.rotations = 0
+        self.retired_sessions = []
+
+    @classmethod
+    def brightdata(cls, api_key, size=4, endpoint=BRIGHTDATA_ENDPOINT, **kwargs):
+        return cls(brightdata_url_template(api_key, endpoint), size=size, **kwargs)
+
+    def _new_session(self):
+        self._created += 1
+        session_id = f"{self._id_prefix}{self._created:04d}"
+        return ProxySession(session_id, self.url_template.replace('{session}', session_id))
+
+    def _best_available(self):
+        now = time.monotonic()
+        candidates = [session for session in self.sessions if session.available(now)]
+        if not candidates:
+            # Everything is cooling down: use whichever session recovers first
+            candidates = sorted((s for s in self.sessions if not s.retired), key=lambda s: s.cooldown_until)[:1]
+        # Prefer sessions no other worker holds, then the lowest latency
+        taken = set(id(session) for session in self.assignments.values())
+        return min(candidates, key=lambda s: (id(s) in taken, s.latency if s.latency is not None else 0.0))
+
+    def assign(self, worker_id=0):
+        """
+        Return the sticky session for a worker, reassigning it if that session is unhealthy
+        """
+        with self._lock:
+            session = self.assignments.get(worker_id)
+            if session is None or not session.available():
+                session = self._best_available()
+                self.assignments[worker_id] = session
+            session.requests += 1
+            return session
+
+    def report_success(self, session, elapsed=None):
+        with self._lock:
+            session.successes += 1
+            session.consecutive_failures = 0
+            if elapsed is not None:
+                if session.latency is None:
+                    session.latency = elapsed
+                else:
+                    session.latency += self.latency_alpha * (elapsed - session.latency)
+
+    def report_failure(self, session, blocked=False):
+        """
+        Record a failed request; blocked sessions are rotated out immediately
+        """
+        with self._lock:
+            session.failures += 1
+            session.consecutive_failures += 1
+            if blocked:
+                session.blocks += 1
+            if blocked or session.consecutive_failures >= self.max_consecutive_failures:
+                self._rotate(session)
+            else:
+                session.cooldown_until = time.monotonic() + self.cooldown
+
+    def _rotate(self, session):
+        if session.retired:
+            return
+        session.retired = True
+        self.retired_sessions.append(session)
+        replacement = self._new_session()
+        self.sessions[self.sessions.index(session)] = replacement
+        for worker_id, assigned in list(self.assignments.items()):
+            if assigned is session:
+                self.assignments[worker_id] = replacement
+        self.rotations += 1
+        logger.info(f"Proxy session {session.session_id} rotated out -> {replacement.session_id}")
+
+    def stats(self):
+        with self._lock:
+            return {
+                'sessions': [session.stats() for session in self.sessions],
+                'rotations': self.rotations,
+                'retired': len(self.retired_sessions),
+            }
+
+
+class ProxiedFetcher(PageFetcher):
+    """
+    Fetcher that routes each worker through its ProxyPool session
+
+    Keeps one pooled HTTP client per session, reports every response back to
+    the pool, and retries a failed or blocked fetch on a fresh session. A
+    rotated-out session's client is closed once no fetch is using it.
+    """
+    name = "proxied"
+
+    def __init__(self, pool, backend='requests', max_attempts=3, review_marker=REVIEW_MARKER, **fetcher_kwargs):
+        """
+        Args:
+            pool (ProxyPool): Sessions to route requests through
+            backend (str): Underlying fetcher backend ('requests' or 'httpx')
+            max_attempts (int): Sessions tried per URL before giving up
+            review_marker (str): Review markup that rules out a block page
+            **fetcher_kwargs: Passed to create_fetcher (user_agent, timeout, pool_size)
+        """
+        self.pool = pool
+        self.backend = backend
+        self.max_attempts = max_attempts
+        self.review_marker = review_marker
+        self.fetcher_kwargs = fetcher_kwargs
+        # session_id -> [session, fetcher, fetches in flight]
+        self._fetchers = {}
+        self._lock = threading.Lock()
+
+    def _lease(self, session):
+        """Client for a session, counted as in use until _release"""
+        with self._lock:
+            entry = self._fetchers.get(session.session_id)
+            if entry is None:
+                fetcher = create_fetcher(self.backend, proxy_url=session.url, **self.fetcher_kwargs)
+                entry = self._fetchers[session.session_id] = [session, fetcher, 0]
+            entry[2] += 1
+            idle_retired = self._pop_idle_retired()
+        self._close_all(idle_retired)
+        return entry[1]
+
+    def _release(self, session):
+        with self._lock:
+            self._fetchers[session.session_id][2] -= 1
+            idle_retired = self._pop_idle_retired()
+        self._close_all(idle_retired)
+
+    def _pop_idle_retired(self):
+        # Another worker may still be mid-request on a rotated-out session's client
+        retired = [key for key, (owner, _, in_use) in self._fetchers.items() if owner.retired and not in_use]
+        return [self._fetchers.pop(session_id)[1] for session_id in retired]
+
+    @staticmethod
+    def _close_all(fetchers):
+        for fetcher in fetchers:
+            fetcher.close()
+
+    def fetch(self, url, headers=None, worker_id=0):
+        page = None
+        for attempt in range(self.max_attempts):
+            session = self.pool.assign(worker_id)
+            fetcher = self._lease(session)
+            try:
+                page = fetcher.fetch(url, headers)
+            finally:
+                self._release(session)
+            if page is None:
+                self.pool.report_failure(session)
+            elif looks_blocked(page, self.review_marker):
+                logger.warning(f"Proxy session {session.session_id} blocked on {url} (HTTP {page.status_code})")
+                self.pool.report_failure(session, blocked=True)
+            else:
+                self.pool.report_success(session, page.elapsed)
+                return page
+        return page
+
+    def close(self):
+        with self._lock:
+            fetchers = [fetcher for _, fetcher, _ in self._fetchers.values()]
+            self._fetchers = {}
+        self._close_all(fetchers)
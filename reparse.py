@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Re-run review parsing over archived pages without touching the network
+"""
+
+import argparse
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from page_archive import PageArchive
+from review_fields import Locator, build_review_fields
+from review_sinks import SINK_FORMATS, create_sinks
+
+logger = logging.getLogger(__name__)
+
+_worker_archive = None
+_worker_parser_backend = None
+_worker_schemas = None
+_worker_scrapers = {}
+
+
+def _init_worker(archive_dir, parser_backend, schemas):
+    global _worker_archive, _worker_parser_backend, _worker_schemas
+    _worker_archive = PageArchive(archive_dir)
+    _worker_parser_backend = parser_backend
+    _worker_schemas = schemas
+    _worker_scrapers.clear()
+
+
+def _scraper_for(schema):
+    """
+    Scraper parsing with the review schema a page was archived with
+    """
+    if schema in _worker_scrapers:
+        return _worker_scrapers[schema]
+
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+    scraper = LevisReviewsScraperMultiPage(parser_backend=_worker_parser_backend)
+    if schema is not None and schema != scraper.schema_fingerprint:
+        if schema not in _worker_schemas:
+            raise ValueError(f"Archive has no selectors for review schema {schema!r}; refusing to re-parse")
+        selectors = dict(_worker_schemas[schema])
+        review_item = Locator.from_spec(selectors.pop('review_item'))
+        scraper = LevisReviewsScraperMultiPage(parser_backend=_worker_parser_backend,
+                                               review_fields=build_review_fields(selectors), review_item=review_item)
+        if scraper.schema_fingerprint != schema:
+            # Same selectors but other extract functions: the reviews would differ
+            raise ValueError(f"Review schema {schema!r} of the archive does not match this scraper's "
+                             f"({scraper.schema_fingerprint!r}); refusing to re-parse")
+    _worker_scrapers[schema] = scraper
+    return scraper
+
+
+def _reparse_record(record):
+    html = _worker_archive.read(record)
+    return _scraper_for(record.get('schema')).parse_page(html, record['page_number'], record['url'])
+
+
+def iter_reparsed_pages(archive_dir, workers=None, parser_backend='bs4', latest_only=True, chunksize=8):
+    """
+    Stream archived pages through parse_page across a process pool
+
+    Each worker process opens the archive and reads page bodies itself, so only
+    index records and parsed reviews cross process boundaries. Every page is
+    parsed with the review selectors it was crawled with (recorded in the
+    archive); a page whose schema cannot be rebuilt raises ValueError.
+
+    Yields:
+        (record, page_reviews) tuples in archive order
+    """
+    archive = PageArchive(archive_dir)
+    records = archive.iter_records(latest_only=latest_only)
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             initializer=_init_worker,
+                             initargs=(archive_dir, parser_backend, archive.schemas())) as executor:
+        # Keep records paired with results without materialising the whole index twice
+        pending = []
+        for record in records:
+            pending.append(record)
+            if len(pending) >= chunksize * (workers or os.cpu_count() or 1) * 4:
+                yield from zip(pending, executor.map(_reparse_record, pending, chunksize=chunksize))
+                pending = []
+        if pending:
+            yield from zip(pending, executor.map(_reparse_record, pending, chunksize=chunksize))
+
+
+def reparse_archive(archive_dir, output_file='levis_reviews_reparsed.csv', workers=None,
+                    parser_backend='bs4', latest_only=True, output_formats=('csv', 'json')):
+    """
+    Re-parse every archived page and stream the reviews to the output files
+
+    Args:
+        archive_dir (str): PageArchive directory written by a crawl
+        output_file (str): Base output path; each format is written next to it
+        workers (int): Number of parser processes (default: all cores)
+        parser_backend (str): 'bs4' or 'lxml'
+        latest_only (bool): Only re-parse the newest fetch of each URL
+        output_formats (tuple): Any of 'csv', 'json', 'jsonl', 'parquet', 'postgres'
+
+    Returns:
+        int: Number of reviews written
+    """
+    sinks = create_sinks(output_file, output_formats)
+    total_reviews = 0
+    pages = 0
+    try:
+        for record, page_reviews in iter_reparsed_pages(archive_dir, workers, parser_backend, latest_only):
+            for sink in sinks:
+                sink.write_page(page_reviews)
+            total_reviews += len(page_reviews)
+            pages += 1
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    logger.info(f"=== REPARSE COMPLETE ===")
+    logger.info(f"Pages re-parsed: {pages}")
+    logger.info(f"Total reviews: {total_reviews}")
+
+    return total_reviews
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-parse archived review pages offline")
+    parser.add_argument('archive_dir', help="Page archive directory written by a crawl")
+    parser.add_argument('--output', default='levis_reviews_reparsed.csv', help="CSV output file")
+    parser.add_argument('--workers', type=int, default=None, help="Parser processes (default: all cores)")
+    parser.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4', help="Parser backend")
+    parser.add_argument('--all-fetches', action='store_true', help="Re-parse every fetch, not just the newest per URL")
+    parser.add_argument('--format', dest='formats', action='append', choices=sorted(SINK_FORMATS) + ['postgres'],
+                        help="Output format (repeatable, default: csv and json)")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level, format='%(message)s')
+
+    reparse_archive(args.archive_dir, args.output, args.workers, args.parser,
+                    latest_only=not args.all_fetches, output_formats=args.formats or ('csv', 'json'))
+
+
+if __name__ == "__main__":
+    main()
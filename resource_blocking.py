@@ -0,0 +1,179 @@
+import json
+
+
+# Ad, analytics and tracking hosts that the review DOM never needs
+DEFAULT_BLOCKED_DOMAINS = [
+    'googletagmanager.com',
+    'google-analytics.com',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'adservice.google.com',
+    'doubleclick.net',
+    'facebook.net',
+    'connect.facebook.net',
+    'hotjar.com',
+    'criteo.com',
+    'criteo.net',
+    'taboola.com',
+    'outbrain.com',
+    'amazon-adsystem.com',
+    'scorecardresearch.com',
+    'quantserve.com',
+    'adnxs.com',
+    'pubmatic.com',
+    'rubiconproject.com',
+    'moatads.com',
+    'clarity.ms',
+    'bing.com',
+]
+
+# Domains whose scripts render the reviews; never added to the blocklist
+DEFAULT_ALLOWED_DOMAINS = ['pissedconsumer.com']
+
+IMAGE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico']
+FONT_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+CSS_PATTERNS = ['*.css']
+MEDIA_PATTERNS = ['*.mp4', '*.webm', '*.mp3', '*.m3u8']
+
+# Typical transfer sizes used to estimate bytes saved by blocked requests
+# (blocked requests are never downloaded, so their real size is unknown)
+AVERAGE_RESOURCE_BYTES = {
+    'Image': 45000,
+    'Font': 35000,
+    'Stylesheet': 30000,
+    'Script': 70000,
+    'Media': 500000,
+    'XHR': 5000,
+    'Fetch': 5000,
+    'Other': 10000,
+}
+
+
+class ResourceBlockingProfile:
+    """
+    Which resources Chrome should skip loading for the review pages
+
+    Images are disabled through blink settings and content-settings prefs
+    (they are then never requested at all); fonts, CSS, media and third-party
+    ad/tracker hosts are blocked with CDP Network.setBlockedURLs.
+    """
+
+    def __init__(self, block_images=True, block_fonts=True, block_css=True, block_media=True,
+                 block_third_party_scripts=True, blocked_domains=None, allowed_domains=None,
+                 extra_patterns=()):
+        """
+        Args:
+            block_images (bool): Disable image loading
+            block_fonts (bool): Block web fonts
+            block_css (bool): Block stylesheets (the review DOM doesn't need them)
+            block_media (bool): Block audio/video
+            block_third_party_scripts (bool): Block requests to blocked_domains
+            blocked_domains (list): Third-party hosts to block (default: common ad/analytics hosts)
+            allowed_domains (list): Hosts the review DOM needs; they are removed
+                from blocked_domains even if listed there
+            extra_patterns (iterable): Additional CDP URL patterns to block
+        """
+        self.block_images = block_images
+        self.block_fonts = block_fonts
+        self.block_css = block_css
+        self.block_media = block_media
+        self.block_third_party_scripts = block_third_party_scripts
+        self.blocked_domains = list(DEFAULT_BLOCKED_DOMAINS if blocked_domains is None else blocked_domains)
+        self.allowed_domains = list(DEFAULT_ALLOWED_DOMAINS if allowed_domains is None else allowed_domains)
+        self.extra_patterns = list(extra_patterns)
+
+    def _is_allowed(self, domain):
+        return any(domain == allowed or domain.endswith('.' + allowed) for allowed in self.allowed_domains)
+
+    def blocked_url_patterns(self):
+        """
+        URL patterns for CDP Network.setBlockedURLs
+        """
+        patterns = []
+        if self.block_images:
+            patterns.extend(IMAGE_PATTERNS)
+        if self.block_fonts:
+            patterns.extend(FONT_PATTERNS)
+        if self.block_css:
+            patterns.extend(CSS_PATTERNS)
+        if self.block_media:
+            patterns.extend(MEDIA_PATTERNS)
+        if self.block_third_party_scripts:
+            for domain in self.blocked_domains:
+                if not self._is_allowed(domain):
+                    patterns.extend([f"*://{domain}/*", f"*://*.{domain}/*"])
+        patterns.extend(self.extra_patterns)
+        return patterns
+
+    def apply_to_options(self, chrome_options):
+        """
+        Configure Chrome options before the driver starts
+        """
+        if self.block_images:
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+            })
+        # Performance logs let ResourceStats measure transferred and blocked requests
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    def apply_to_driver(self, driver):
+        """
+        Install the URL blocklist on a running driver through CDP
+        """
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_url_patterns()})
+
+
+class ResourceStats:
+    """
+    Network usage of a Chrome session, read from its performance log
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.blocked_requests = 0
+        self.blocked_by_type = {}
+        self.bytes_transferred = 0
+        self.estimated_bytes_saved = 0
+        self._request_types = {}
+
+    def collect(self, driver):
+        """
+        Drain the driver's performance log and update the counters
+        """
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return
+
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                self.requests += 1
+                self._request_types[params.get('requestId')] = params.get('type', 'Other')
+            elif method == 'Network.loadingFinished':
+                self.bytes_transferred += int(params.get('encodedDataLength', 0))
+                self._request_types.pop(params.get('requestId'), None)
+            elif method == 'Network.loadingFailed':
+                resource_type = params.get('type') or self._request_types.get(params.get('requestId'), 'Other')
+                self._request_types.pop(params.get('requestId'), None)
+                if params.get('blockedReason'):
+                    self.blocked_requests += 1
+                    self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+                    self.estimated_bytes_saved += AVERAGE_RESOURCE_BYTES.get(resource_type, AVERAGE_RESOURCE_BYTES['Other'])
+
+    def summary(self):
+        return {
+            'requests': self.requests,
+            'blocked_requests': self.blocked_requests,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'bytes_transferred': self.bytes_transferred,
+            'estimated_bytes_saved': self.estimated_bytes_saved,
+        }
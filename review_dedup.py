@@ -0,0 +1,166 @@
+import hashlib
+import logging
+import re
+import zlib
+
+from seen_reviews import review_key
+
+logger = logging.getLogger(__name__)
+
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Mersenne prime for the (a * x + b) mod p universal hash family; with a < 2**31
+# and 32-bit shingle hashes every intermediate value still fits in uint64
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+class ReviewDeduplicator:
+    """
+    Drop or link exact and near-duplicate reviews page by page
+
+    Exact duplicates are caught by hashing the normalised review text. Near
+    duplicates are found with MinHash signatures over word shingles and
+    locality-sensitive hashing: each signature is split into bands, and only
+    reviews sharing a band bucket are compared, so the cost per review stays
+    roughly constant instead of growing with the corpus.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=64, bands=16, shingle_size=3, mode='drop', seed=1):
+        """
+        Args:
+            threshold (float): Estimated Jaccard similarity at which two reviews
+                count as near duplicates
+            num_perm (int): MinHash signature length
+            bands (int): LSH bands (num_perm must be divisible by bands)
+            shingle_size (int): Words per shingle
+            mode (str): 'drop' to remove duplicates, 'link' to keep them with a
+                'duplicate_of' field holding the first copy's review key
+            seed (int): Seed for the MinHash permutations
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required for review deduplication. Please install: pip install numpy")
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        if mode not in ('drop', 'link'):
+            raise ValueError(f"Unknown dedup mode: {mode!r}")
+
+        self._np = numpy
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+        self.mode = mode
+
+        rng = numpy.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 31, size=(num_perm, 1), dtype=numpy.uint64)
+        self._b = rng.integers(0, 1 << 31, size=(num_perm, 1), dtype=numpy.uint64)
+
+        self.exact_index = {}
+        self.band_buckets = [{} for _ in range(bands)]
+        self.signatures = {}
+
+        self.exact_duplicates = 0
+        self.near_duplicates = 0
+        self.reviews_seen = 0
+
+    @staticmethod
+    def _normalise(text):
+        return ' '.join(WORD_PATTERN.findall(text.lower()))
+
+    def _shingle_hashes(self, normalised_text):
+        words = normalised_text.split()
+        if len(words) <= self.shingle_size:
+            shingles = [normalised_text]
+        else:
+            shingles = {' '.join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+        return [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+
+    def _signatures(self, texts):
+        """
+        MinHash signatures for a batch of texts in one vectorised pass
+
+        Returns:
+            ndarray: (len(texts), num_perm) uint32 signatures
+        """
+        np = self._np
+        shingle_lists = [self._shingle_hashes(text) for text in texts]
+        offsets = np.cumsum([0] + [len(shingles) for shingles in shingle_lists[:-1]])
+        shingles = np.fromiter((h for hashes in shingle_lists for h in hashes), dtype=np.uint64)
+
+        hashed = (self._a * shingles[None, :] + self._b) % np.uint64(MERSENNE_PRIME)
+        minimums = np.minimum.reduceat(hashed, offsets, axis=1)
+        return (minimums.T & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        rows = self.rows_per_band
+        return [signature[band * rows:(band + 1) * rows].tobytes() for band in range(self.bands)]
+
+    def _find_near_duplicate(self, signature, band_keys):
+        candidates = set()
+        for buckets, key in zip(self.band_buckets, band_keys):
+            candidates.update(buckets.get(key, ()))
+        best_key, best_score = None, 0.0
+        for candidate in candidates:
+            score = float((self.signatures[candidate] == signature).mean())
+            if score >= self.threshold and score > best_score:
+                best_key, best_score = candidate, score
+        return best_key
+
+    def process_page(self, reviews):
+        """
+        Deduplicate one page of reviews against everything seen so far
+
+        Returns:
+            list: The reviews to keep (with 'duplicate_of' set in link mode)
+        """
+        if not reviews:
+            return reviews
+
+        normalised = [self._normalise(str(review.get('review_text', ''))) for review in reviews]
+        signatures = self._signatures(normalised)
+
+        kept = []
+        for review, text, signature in zip(reviews, normalised, signatures):
+            self.reviews_seen += 1
+            exact_hash = hashlib.sha1(text.encode('utf-8')).digest()
+            original = self.exact_index.get(exact_hash)
+            band_keys = None
+
+            if original is not None:
+                self.exact_duplicates += 1
+            else:
+                band_keys = self._band_keys(signature)
+                original = self._find_near_duplicate(signature, band_keys)
+                if original is not None:
+                    self.near_duplicates += 1
+
+            if original is not None:
+                if self.mode == 'link':
+                    review['duplicate_of'] = original
+                    kept.append(review)
+                continue
+
+            key = review_key(review)
+            self.exact_index[exact_hash] = key
+            self.signatures[key] = signature
+            for buckets, band_key in zip(self.band_buckets, band_keys):
+                buckets.setdefault(band_key, []).append(key)
+            kept.append(review)
+
+        dropped = len(reviews) - len(kept)
+        if dropped or self.mode == 'link':
+            logger.info(f"Dedup: {dropped} duplicates dropped on this page "
+                        f"({self.exact_duplicates} exact / {self.near_duplicates} near so far)")
+        return kept
+
+    def stats(self):
+        return {
+            'reviews_seen': self.reviews_seen,
+            'unique_reviews': len(self.signatures),
+            'exact_duplicates': self.exact_duplicates,
+            'near_duplicates': self.near_duplicates,
+        }
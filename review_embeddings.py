@@ -0,0 +1,376 @@
+import hashlib
+import logging
+import math
+import os
+import re
+import sqlite3
+from array import array
+
+from review_sinks import ReviewSink
+from seen_reviews import review_key
+
+logger = logging.getLogger(__name__)
+
+
+METADATA_FIELDS = ['review_title', 'rating', 'reviewer_name', 'review_date', 'page_number', 'source_url']
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def text_hash(text):
+    """Cache key for a review text"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite cache of embeddings keyed by review_text hash and model name
+
+    Unchanged reviews are never sent to the embedding model twice, even across
+    crawls or when the same text shows up under a different page or reviewer.
+    """
+
+    def __init__(self, db_path='levis_review_embeddings.sqlite'):
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " text_hash TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " PRIMARY KEY (text_hash, model))"
+        )
+        self.connection.commit()
+
+    def get_many(self, hashes, model):
+        """
+        Return {text_hash: vector} for every hash that is cached for this model
+        """
+        found = {}
+        hashes = list(hashes)
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                [model] + chunk
+            )
+            for key, blob in rows:
+                found[key] = array('f', blob).tolist()
+        return found
+
+    def put_many(self, items, model):
+        """
+        Store (text_hash, vector) pairs for this model
+        """
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO embeddings (text_hash, model, vector) VALUES (?, ?, ?)",
+            [(key, model, array('f', vector).tobytes()) for key, vector in items]
+        )
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+
+class Embedder:
+    """
+    Base class for embedding models: embed() maps a batch of texts to vectors
+    """
+    name = "base"
+
+    def embed(self, texts):
+        raise NotImplementedError
+
+
+class HashingEmbedder(Embedder):
+    """
+    Deterministic feature-hashing embedder for offline runs and tests
+
+    No model download or API key needed; similar texts share tokens and land
+    close together, which is enough to exercise the pipeline end to end.
+    """
+
+    def __init__(self, dim=256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts):
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dim
+            for token in TOKEN_PATTERN.findall(text.lower()):
+                digest = hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], 'little') % self.dim
+                vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+            norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+            vectors.append([value / norm for value in vector])
+        return vectors
+
+
+class OpenAIEmbedder(Embedder):
+    """
+    Embed texts with the OpenAI embeddings API (one request per batch)
+    """
+
+    def __init__(self, model='text-embedding-3-small', api_key=None):
+        try:
+            from openai import OpenAI
+        except ImportError:
+            raise ImportError("openai is required for OpenAIEmbedder. Please install: pip install openai")
+
+        self.name = model
+        self.client = OpenAI(api_key=api_key or os.getenv('OPENAI_API_KEY'))
+
+    def embed(self, texts):
+        response = self.client.embeddings.create(model=self.name, input=list(texts))
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+class VectorStore:
+    """
+    Base class for vector indexes that receive batched upserts
+    """
+
+    def upsert(self, ids, vectors, metadata):
+        raise NotImplementedError
+
+    def query(self, vector, top_k=10):
+        """
+        Return [(id, score, metadata)] for the top_k most similar vectors
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+def dedupe_batch(ids, vectors, metadata):
+    """
+    Keep only the last vector and metadata for ids repeated within one batch
+
+    The same review can show up on several pages of one batch; an upsert
+    keeps its latest copy, like separate upserts would.
+    """
+    latest = {}
+    for index, vector_id in enumerate(ids):
+        latest[vector_id] = index
+    if len(latest) == len(ids):
+        return ids, vectors, metadata
+    keep = sorted(latest.values())
+    return [ids[i] for i in keep], [vectors[i] for i in keep], [metadata[i] for i in keep]
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    In-process cosine-similarity index backed by a NumPy matrix
+
+    Optionally persisted to a .npz file, so it works as an offline stand-in for
+    Pinecone in tests and local analysis.
+    """
+
+    def __init__(self, path=None):
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required for NumpyVectorStore. Please install: pip install numpy")
+
+        self._np = numpy
+        self.path = path
+        self.ids = []
+        self.positions = {}
+        self.metadata = []
+        self.matrix = None
+
+        if path and os.path.exists(path):
+            data = numpy.load(path, allow_pickle=True)
+            self.ids = data['ids'].tolist()
+            self.metadata = data['metadata'].tolist()
+            self.matrix = data['matrix']
+            self.positions = {vector_id: position for position, vector_id in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def upsert(self, ids, vectors, metadata):
+        np = self._np
+        ids, vectors, metadata = dedupe_batch(list(ids), list(vectors), list(metadata))
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+
+        new_rows = []
+        for vector_id, vector, meta in zip(ids, vectors, metadata):
+            position = self.positions.get(vector_id)
+            if position is not None:
+                self.matrix[position] = vector
+                self.metadata[position] = meta
+            else:
+                self.positions[vector_id] = len(self.ids)
+                self.ids.append(vector_id)
+                self.metadata.append(meta)
+                new_rows.append(vector)
+
+        if new_rows:
+            new_rows = np.vstack(new_rows)
+            self.matrix = new_rows if self.matrix is None else np.vstack([self.matrix, new_rows])
+
+    def query(self, vector, top_k=10):
+        np = self._np
+        if self.matrix is None:
+            return []
+        vector = np.asarray(vector, dtype=np.float32)
+        scores = self.matrix @ (vector / (np.linalg.norm(vector) or 1))
+        top = np.argsort(-scores)[:top_k]
+        return [(self.ids[i], float(scores[i]), self.metadata[i]) for i in top]
+
+    def close(self):
+        if self.path and self.matrix is not None:
+            self._np.savez(self.path, ids=self._np.array(self.ids, dtype=object),
+                           metadata=self._np.array(self.metadata, dtype=object), matrix=self.matrix)
+
+
+class FaissVectorStore(VectorStore):
+    """
+    Inner-product FAISS index over normalised vectors (cosine similarity)
+    """
+
+    def __init__(self, dim):
+        try:
+            import faiss
+            import numpy
+        except ImportError:
+            raise ImportError("faiss and numpy are required for FaissVectorStore. Please install: pip install faiss-cpu numpy")
+
+        self._np = numpy
+        self._faiss = faiss
+        self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(dim))
+        self.ids = {}
+        self.metadata = {}
+
+    def upsert(self, ids, vectors, metadata):
+        np = self._np
+        ids, vectors, metadata = dedupe_batch(list(ids), list(vectors), list(metadata))
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self._faiss.normalize_L2(vectors)
+        int_ids = np.array([int(vector_id[:15], 16) for vector_id in ids], dtype=np.int64)
+        self.index.remove_ids(int_ids)
+        self.index.add_with_ids(vectors, int_ids)
+        for int_id, vector_id, meta in zip(int_ids.tolist(), ids, metadata):
+            self.ids[int_id] = vector_id
+            self.metadata[int_id] = meta
+
+    def query(self, vector, top_k=10):
+        np = self._np
+        vector = np.asarray([vector], dtype=np.float32)
+        self._faiss.normalize_L2(vector)
+        scores, int_ids = self.index.search(vector, top_k)
+        return [(self.ids[i], float(score), self.metadata[i])
+                for score, i in zip(scores[0], int_ids[0]) if i != -1]
+
+
+class PineconeVectorStore(VectorStore):
+    """
+    Upsert vectors into a Pinecone index
+    """
+
+    def __init__(self, index_name, api_key=None, namespace=None):
+        try:
+            from pinecone import Pinecone
+        except ImportError:
+            raise ImportError("pinecone is required for PineconeVectorStore. Please install: pip install pinecone")
+
+        self.index = Pinecone(api_key=api_key or os.getenv('PINECONE_API_KEY')).Index(index_name)
+        self.namespace = namespace
+
+    def upsert(self, ids, vectors, metadata):
+        ids, vectors, metadata = dedupe_batch(list(ids), list(vectors), list(metadata))
+        # Pinecone metadata values must be strings, numbers, booleans or lists of strings
+        clean_metadata = [{key: value for key, value in meta.items() if value is not None} for meta in metadata]
+        self.index.upsert(
+            vectors=[{'id': vector_id, 'values': list(vector), 'metadata': meta}
+                     for vector_id, vector, meta in zip(ids, vectors, clean_metadata)],
+            namespace=self.namespace,
+        )
+
+    def query(self, vector, top_k=10):
+        response = self.index.query(vector=list(vector), top_k=top_k, include_metadata=True, namespace=self.namespace)
+        return [(match['id'], match['score'], match.get('metadata', {})) for match in response['matches']]
+
+
+class EmbeddingPipeline(ReviewSink):
+    """
+    Embed reviews in batches and upsert them into a vector store
+
+    Usable as an output sink for scrape_all_reviews: reviews are buffered until
+    batch_size texts are pending, embeddings already in the cache are reused,
+    and vectors go to the store upsert_batch_size at a time. Vector ids are the
+    review content hash, so re-upserting the same review overwrites it.
+    """
+
+    def __init__(self, embedder, store, cache=None, batch_size=64, upsert_batch_size=100):
+        """
+        Args:
+            embedder (Embedder): Model that turns texts into vectors
+            store (VectorStore): Destination index
+            cache (EmbeddingCache): Optional embedding cache keyed by review_text hash
+            batch_size (int): Texts sent to the embedder per call
+            upsert_batch_size (int): Vectors per upsert call
+        """
+        super().__init__(filename=None)
+        self.embedder = embedder
+        self.store = store
+        self.cache = cache
+        self.batch_size = batch_size
+        self.upsert_batch_size = upsert_batch_size
+        self.pending = []
+        self.embedded_count = 0
+        self.cache_hits = 0
+        self.upserted_count = 0
+        self.closed = False
+
+    def _write(self, reviews):
+        self.pending.extend(review for review in reviews if review.get('review_text', "N/A") != "N/A")
+        while len(self.pending) >= self.batch_size:
+            batch, self.pending = self.pending[:self.batch_size], self.pending[self.batch_size:]
+            self._process(batch)
+
+    def _embed(self, texts):
+        hashes = [text_hash(text) for text in texts]
+        vectors = self.cache.get_many(set(hashes), self.embedder.name) if self.cache else {}
+        self.cache_hits += sum(1 for key in hashes if key in vectors)
+
+        missing = {}
+        for key, text in zip(hashes, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+        if missing:
+            new_vectors = self.embedder.embed(list(missing.values()))
+            self.embedded_count += len(new_vectors)
+            vectors.update(zip(missing.keys(), new_vectors))
+            if self.cache:
+                self.cache.put_many(zip(missing.keys(), new_vectors), self.embedder.name)
+
+        return [vectors[key] for key in hashes]
+
+    def _process(self, reviews):
+        vectors = self._embed([review['review_text'] for review in reviews])
+        ids = [review_key(review) for review in reviews]
+        metadata = [{field: review.get(field) for field in METADATA_FIELDS} for review in reviews]
+
+        for start in range(0, len(ids), self.upsert_batch_size):
+            end = start + self.upsert_batch_size
+            self.store.upsert(ids[start:end], vectors[start:end], metadata[start:end])
+            self.upserted_count += len(ids[start:end])
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.pending:
+            self._process(self.pending)
+            self.pending = []
+        self.store.close()
+        if self.cache:
+            self.cache.close()
+        logger.info(f"Embedded {self.embedded_count} reviews ({self.cache_hits} cache hits), "
+                    f"upserted {self.upserted_count} vectors")
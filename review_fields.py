@@ -0,0 +1,320 @@
+import hashlib
+import json
+import re
+
+
+DATE_PATTERN = re.compile(r'([A-Za-z]{3} \d{1,2}, \d{4})')
+RATING_AFTER_YEAR_PATTERN = re.compile(r'(\d{4})(\d+\.\d+)')
+DECIMAL_PATTERN = re.compile(r'\d+\.\d+')
+
+# Date immediately followed by its rating ("Aug 01, 20252.0Rating Details..."),
+# the usual layout, so both fields come out of a single search
+DATE_RATING_PATTERN = re.compile(r'([A-Za-z]{3} \d{1,2}, \d{4})(\d+\.\d+)?')
+
+
+def parse_date_rating(text):
+    """
+    Extract (review_date, rating) from a review's date/rating row text
+
+    Returns the same values as searching DATE_PATTERN, then
+    RATING_AFTER_YEAR_PATTERN, then the first 1.0-5.0 decimal, but needs only
+    one search when the rating directly follows the date's year.
+    """
+    match = DATE_RATING_PATTERN.search(text)
+    if match is None:
+        return "N/A", _parse_rating(text)
+
+    # A rating-after-year match before the date would win in the slow path;
+    # it can only sit entirely before the date, which starts with letters
+    if match.group(2) is not None and not (match.start() and RATING_AFTER_YEAR_PATTERN.search(text, 0, match.start())):
+        return match.group(1), float(match.group(2))
+    return match.group(1), _parse_rating(text)
+
+
+def _parse_rating(text):
+    rating_match = RATING_AFTER_YEAR_PATTERN.search(text)
+    if rating_match:
+        return float(rating_match.group(2))
+    # Fallback: the first decimal that could be a rating (1.0-5.0)
+    for num in DECIMAL_PATTERN.findall(text):
+        rating_val = float(num)
+        if 1.0 <= rating_val <= 5.0:
+            return rating_val
+    return "N/A"
+
+
+class Locator:
+    """
+    Tag name plus class test, with BeautifulSoup find(name, class_=...) semantics
+
+    classes='a b' matches the whole class attribute, classes='a' matches any
+    single class, and class_contains='a' matches any class containing 'a'.
+    """
+
+    def __init__(self, tag, classes=None, class_contains=None):
+        self.tag = tag
+        self.classes = classes
+        self.class_contains = class_contains
+        self._whole_attribute = classes is not None and ' ' in classes
+
+    def matches(self, element):
+        classes = element.get('class')
+        if not classes:
+            return False
+        if self.class_contains is not None:
+            return any(self.class_contains in value for value in classes)
+        if self._whole_attribute:
+            return ' '.join(classes) == self.classes
+        return self.classes in classes
+
+    def _class_filter(self):
+        if self.class_contains is not None:
+            value = self.class_contains
+            return lambda name: bool(name) and value in name
+        return self.classes
+
+    @property
+    def marker(self):
+        """
+        Substring every static page containing a matching element has (its class attribute or class)
+        """
+        if self.class_contains is not None:
+            return self.class_contains
+        if self.classes is not None:
+            return self.classes
+        return f"<{self.tag}"
+
+    def css_selector(self):
+        """
+        The same test as a CSS selector, for Selenium and the browser
+        """
+        if self.class_contains is not None:
+            return f'{self.tag}[class*="{self.class_contains}"]'
+        if self._whole_attribute:
+            return f'{self.tag}[class="{self.classes}"]'
+        if self.classes is not None:
+            return f"{self.tag}.{self.classes}"
+        return self.tag
+
+    def find(self, element):
+        """
+        First matching descendant of element (BeautifulSoup find), or None
+        """
+        return element.find(self.tag, class_=self._class_filter())
+
+    def find_all(self, element):
+        """
+        Every matching descendant of element, in document order
+        """
+        return element.find_all(self.tag, class_=self._class_filter())
+
+    def spec(self):
+        """
+        Site spec dict for this locator (the inverse of from_spec)
+        """
+        return {'tag': self.tag, 'class': self.classes, 'class_contains': self.class_contains}
+
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Build a Locator from a site spec selector
+
+        Either a dict {'tag': 'div', 'class': 'a b'} / {'tag': 'span',
+        'class_contains': 'author'}, or the shorthand 'div.a.b' (the dotted
+        classes form the whole class attribute, as in class_='a b').
+        """
+        if isinstance(spec, Locator):
+            return spec
+        if isinstance(spec, str):
+            tag, _, classes = spec.partition('.')
+            return cls(tag, classes.replace('.', ' ') or None)
+        unknown = set(spec) - {'tag', 'class', 'class_contains', 'fallback'}
+        if unknown or 'tag' not in spec:
+            raise ValueError(f"Invalid selector {spec!r}: expected 'tag' plus 'class' or 'class_contains'")
+        return cls(spec['tag'], spec.get('class'), spec.get('class_contains'))
+
+
+class ReviewField:
+    """
+    One entry of the review schema: where to find it and how to read it
+    """
+
+    def __init__(self, name, locator, extract, missing, fallback=None):
+        """
+        Args:
+            name (str): Selector name used by site specs to override the locator
+            locator (Locator): First matching descendant holds the field
+            extract (callable): extract(element) -> dict of output values
+            missing (dict): Output values when no element matches
+            fallback (Locator): Tried when locator matches nothing
+        """
+        self.name = name
+        self.locator = locator
+        self.extract = extract
+        self.missing = missing
+        self.fallback = fallback
+
+
+def _extract_review_text(element):
+    paragraphs = element.find_all('p')
+    if paragraphs:
+        return {'review_text': ' '.join([p.get_text(strip=True) for p in paragraphs])}
+    return {'review_text': element.get_text(strip=True)}
+
+
+def _extract_date_rating(element):
+    review_date, rating = parse_date_rating(element.get_text(strip=True))
+    return {'review_date': review_date, 'rating': rating}
+
+
+def _extract_reviewer_name(element):
+    return {'reviewer_name': element.get_text(strip=True)}
+
+
+def _extract_title(element):
+    return {'review_title': element.get_text(strip=True)[:100]}
+
+
+def _extract_recommendation(element):
+    rec_text = element.get_text(strip=True)
+    return {'user_recommendation': rec_text if 'recommendation' in rec_text.lower() else "N/A"}
+
+
+# Output keys come out in schema order, which is also the JSON key order
+REVIEW_FIELDS = [
+    ReviewField('review_text', Locator('div', 'f-component-text review_text_container review-track'),
+                _extract_review_text, {'review_text': "N/A"}),
+    ReviewField('date_rating', Locator('div', 'row-inline mb24px-desktop'),
+                _extract_date_rating, {'review_date': "N/A", 'rating': "N/A"}),
+    ReviewField('reviewer_name', Locator('span', 'avatar-name'),
+                _extract_reviewer_name, {'reviewer_name': "Anonymous"},
+                fallback=Locator('span', class_contains='author')),
+    ReviewField('review_title', Locator('div', 'f-component-info-header'),
+                _extract_title, {'review_title': "N/A"}),
+    ReviewField('user_recommendation', Locator('p', 'word-break-break-word'),
+                _extract_recommendation, {'user_recommendation': "N/A"}),
+]
+
+# The element wrapping each review on a listing page
+REVIEW_ITEM = Locator('div', 'review-item')
+
+
+def build_review_fields(selectors):
+    """
+    REVIEW_FIELDS with some locators replaced, for sites with other markup
+
+    Args:
+        selectors (dict): Field name -> selector (see Locator.from_spec); a
+            dict selector may carry its own 'fallback' selector, otherwise the
+            field keeps its default fallback
+
+    Returns:
+        list: ReviewField entries, in REVIEW_FIELDS order
+    """
+    known = {field.name for field in REVIEW_FIELDS}
+    unknown = set(selectors) - known
+    if unknown:
+        raise ValueError(f"Unknown review fields: {sorted(unknown)} (expected some of {sorted(known)})")
+
+    fields = []
+    for field in REVIEW_FIELDS:
+        selector = selectors.get(field.name)
+        if selector is None:
+            fields.append(field)
+            continue
+        fallback = field.fallback
+        if isinstance(selector, dict) and 'fallback' in selector:
+            fallback = Locator.from_spec(selector['fallback']) if selector['fallback'] else None
+        fields.append(ReviewField(field.name, Locator.from_spec(selector), field.extract, field.missing, fallback))
+    return fields
+
+
+def schema_selectors(fields, review_item):
+    """
+    Selectors dict for a review schema (the inverse of build_review_fields)
+
+    Holds 'review_item' plus every field's locator and fallback, so a
+    scraper with the same schema can be rebuilt from it (see reparse).
+    """
+    selectors = {'review_item': review_item.spec()}
+    for field in fields:
+        selectors[field.name] = dict(field.locator.spec(), fallback=field.fallback.spec() if field.fallback else None)
+    return selectors
+
+
+def schema_fingerprint(fields, review_item):
+    """
+    Short hash of a review schema: every locator, fallback and extract function
+
+    Two scrapers produce the same reviews from a page only if their
+    fingerprints match, so cached parse results are keyed on it.
+    """
+    schema = {
+        'review_item': review_item.spec(),
+        'fields': [[field.name, field.locator.spec(), field.fallback.spec() if field.fallback else None,
+                    field.extract.__module__ + '.' + field.extract.__qualname__] for field in fields],
+    }
+    return hashlib.sha1(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+class ReviewFieldExtractor:
+    """
+    Extract a review's fields from a BeautifulSoup element in one traversal
+
+    Every locator of the schema is indexed by tag name, so a single walk over
+    the element's descendants finds the first match for each field (the same
+    element find() would return) and stops once every field has one. Adding
+    a field is one more ReviewField entry.
+    """
+
+    def __init__(self, fields=None):
+        self.fields = list(REVIEW_FIELDS if fields is None else fields)
+        self.fields_by_name = {field.name: field for field in self.fields}
+        self._locators_by_tag = {}
+        self._slots = []
+        slot = 0
+        for field in self.fields:
+            primary = slot
+            self._locators_by_tag.setdefault(field.locator.tag, []).append((slot, field.locator, True))
+            slot += 1
+            fallback = None
+            if field.fallback is not None:
+                fallback = slot
+                self._locators_by_tag.setdefault(field.fallback.tag, []).append((slot, field.fallback, False))
+                slot += 1
+            self._slots.append((primary, fallback))
+        self._slot_count = slot
+        self._primary_slots = len(self.fields)
+
+    def locate(self, review_element):
+        """
+        Return the first matching element (or None) for every locator slot
+        """
+        found = [None] * self._slot_count
+        remaining = self._primary_slots
+        locators_by_tag = self._locators_by_tag
+        for node in review_element.descendants:
+            candidates = locators_by_tag.get(node.name)
+            if candidates is None:
+                continue
+            for slot, locator, primary in candidates:
+                if found[slot] is None and locator.matches(node):
+                    found[slot] = node
+                    if primary:
+                        remaining -= 1
+            if not remaining:
+                break
+        return found
+
+    def extract(self, review_element):
+        """
+        Return the review dict for one review-item element
+        """
+        found = self.locate(review_element)
+        review = {}
+        for field, (primary, fallback) in zip(self.fields, self._slots):
+            element = found[primary]
+            if element is None and fallback is not None:
+                element = found[fallback]
+            review.update(field.extract(element) if element is not None else field.missing)
+        return review
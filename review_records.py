@@ -0,0 +1,134 @@
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional
+
+
+MISSING = "N/A"
+DATE_FORMAT = '%b %d, %Y'
+
+
+@lru_cache(maxsize=8192)
+def parse_review_date(text):
+    """
+    Parse a review date like 'Aug 01, 2025' (None if it is missing or unparseable)
+
+    Cached, so reviews from the same day share one date object.
+    """
+    if not text or text == MISSING:
+        return None
+    try:
+        return datetime.strptime(text, DATE_FORMAT).date()
+    except ValueError:
+        return None
+
+
+def _optional_text(value):
+    return None if value is None or value == MISSING else value
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class Review:
+    """
+    Compact, typed review record
+
+    Holds the same fields as the review dicts produced by parse_review and
+    parse_page, without a per-review dict: "N/A" becomes None, the rating is
+    a float, the date a datetime.date, and the repetitive strings (reviewer
+    names, recommendations, source URLs) are interned. to_dict() gives back
+    exactly the dict the CSV/JSON writers expect.
+    """
+
+    review_text: str
+    review_date: Optional[date] = None
+    rating: Optional[float] = None
+    reviewer_name: str = "Anonymous"
+    review_title: Optional[str] = None
+    user_recommendation: Optional[str] = None
+    page_number: Optional[int] = None
+    source_url: Optional[str] = None
+    duplicate_of: Optional[str] = None
+    # Scraped date text, kept only when it does not round-trip through DATE_FORMAT
+    review_date_text: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, review):
+        """
+        Build a Review from a parse_review/parse_page dict
+        """
+        date_text = _optional_text(review.get('review_date'))
+        review_date = parse_review_date(date_text)
+        if date_text is not None and (review_date is None or review_date.strftime(DATE_FORMAT) != date_text):
+            date_text = _intern(date_text)
+        else:
+            date_text = None
+
+        rating = review.get('rating')
+        return cls(
+            review_text=review.get('review_text', MISSING),
+            review_date=review_date,
+            rating=float(rating) if isinstance(rating, (int, float)) else None,
+            reviewer_name=_intern(review.get('reviewer_name', "Anonymous")),
+            review_title=_optional_text(review.get('review_title')),
+            user_recommendation=_intern(_optional_text(review.get('user_recommendation'))),
+            page_number=review.get('page_number'),
+            source_url=_intern(review.get('source_url')),
+            duplicate_of=review.get('duplicate_of'),
+            review_date_text=date_text,
+        )
+
+    def date_text(self):
+        """
+        The review date as the site shows it ("N/A" when missing)
+        """
+        if self.review_date_text is not None:
+            return self.review_date_text
+        return self.review_date.strftime(DATE_FORMAT) if self.review_date else MISSING
+
+    def to_dict(self):
+        """
+        The review as a dict with the scraper's keys, key order and "N/A" sentinels
+        """
+        review = {
+            'review_text': self.review_text,
+            'review_date': self.date_text(),
+            'rating': MISSING if self.rating is None else self.rating,
+            'reviewer_name': self.reviewer_name,
+            'review_title': MISSING if self.review_title is None else self.review_title,
+            'user_recommendation': MISSING if self.user_recommendation is None else self.user_recommendation,
+        }
+        if self.page_number is not None:
+            review['page_number'] = self.page_number
+        if self.source_url is not None:
+            review['source_url'] = self.source_url
+        if self.duplicate_of is not None:
+            review['duplicate_of'] = self.duplicate_of
+        return review
+
+    def get(self, key, default=None):
+        """
+        Dict-style field access, so code written against review dicts keeps working
+        """
+        return self.to_dict().get(key, default)
+
+
+RECORD_TYPES = ('dict', 'review')
+
+
+def to_records(reviews):
+    """
+    Convert review dicts to Review records (records are passed through)
+    """
+    return [review if isinstance(review, Review) else Review.from_dict(review) for review in reviews]
+
+
+def as_dict(review):
+    """
+    Dict form of a review dict or Review record, for writers that need dicts
+    """
+    return review.to_dict() if isinstance(review, Review) else review
@@ -0,0 +1,344 @@
+import csv
+import json
+import logging
+import os
+
+from review_records import as_dict
+
+logger = logging.getLogger(__name__)
+
+
+CSV_FIELDNAMES = ['review_title', 'review_text', 'rating', 'reviewer_name', 'review_date', 'user_recommendation', 'page_number', 'source_url']
+
+
+class ReviewSink:
+    """
+    Base class for outputs that receive reviews page by page as they are parsed
+    """
+
+    def __init__(self, filename=None, flush_every=1):
+        """
+        Args:
+            filename (str): Output file (created on the first non-empty page)
+            flush_every (int): Flush buffered output to disk every N pages
+        """
+        self.filename = filename
+        self.flush_every = max(1, int(flush_every))
+        self.reviews_written = 0
+        self.pages_written = 0
+
+    def write_page(self, reviews):
+        """
+        Append one page worth of reviews (dicts or review_records.Review records)
+        """
+        if not reviews:
+            return
+        reviews = [as_dict(review) for review in reviews]
+        self._write(reviews)
+        self.reviews_written += len(reviews)
+        self.pages_written += 1
+        if self.pages_written % self.flush_every == 0:
+            self.flush()
+
+    def _write(self, reviews):
+        raise NotImplementedError
+
+    def tell(self):
+        """
+        Byte offset of everything written so far (None if the sink has no offset)
+        """
+        return None
+
+    def resume_from(self, offset):
+        """
+        Continue an interrupted run, dropping anything written after offset
+        """
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _FileSink(ReviewSink):
+    """
+    Sink writing to a text file that is opened lazily on the first write
+    """
+
+    def __init__(self, filename, flush_every=1):
+        super().__init__(filename, flush_every)
+        self.file = None
+        self.resume_offset = 0
+
+    def _open(self):
+        self.file = open(self.filename, 'w', newline='', encoding='utf-8')
+
+    def _reopen(self, offset):
+        # Truncate a partial file back to the last checkpointed offset and append after it
+        self.file = open(self.filename, 'r+', newline='', encoding='utf-8')
+        self.file.truncate(offset)
+        self.file.seek(offset)
+
+    def _write(self, reviews):
+        if self.file is None:
+            if self.resume_offset:
+                self._reopen(self.resume_offset)
+            else:
+                self._open()
+        self._write_reviews(reviews)
+
+    def tell(self):
+        if self.file is None:
+            return self.resume_offset
+        self.file.flush()
+        return self.file.tell()
+
+    def resume_from(self, offset):
+        if offset and os.path.exists(self.filename):
+            self.resume_offset = offset
+
+    def _write_reviews(self, reviews):
+        raise NotImplementedError
+
+    def flush(self):
+        if self.file is not None:
+            self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            logger.info(f"Reviews saved to {self.filename}")
+
+
+class CsvSink(_FileSink):
+    """
+    Stream reviews to CSV (same columns as save_to_csv)
+    """
+
+    def __init__(self, filename, fieldnames=CSV_FIELDNAMES, flush_every=1):
+        super().__init__(filename, flush_every)
+        self.fieldnames = fieldnames
+        self.writer = None
+
+    def _open(self):
+        super()._open()
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, extrasaction='ignore')
+        self.writer.writeheader()
+
+    def _reopen(self, offset):
+        super()._reopen(offset)
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, extrasaction='ignore')
+
+    def _write_reviews(self, reviews):
+        self.writer.writerows(reviews)
+
+
+class JsonArraySink(_FileSink):
+    """
+    Stream reviews into a JSON array, formatted like save_to_json's indent=2 output
+    """
+
+    def _open(self):
+        super()._open()
+        self.file.write('[')
+        self.separator = '\n'
+
+    def _reopen(self, offset):
+        # The checkpointed offset is just past the last complete review
+        super()._reopen(offset)
+        self.separator = ',\n'
+
+    def _write_reviews(self, reviews):
+        for review in reviews:
+            item = json.dumps(review, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+            self.file.write(f"{self.separator}  {item}")
+            self.separator = ',\n'
+
+    def close(self):
+        if self.file is not None:
+            self.file.write('\n]')
+        super().close()
+
+
+class JsonlSink(_FileSink):
+    """
+    Stream reviews as JSON Lines (one review per line; usable after a crash)
+    """
+
+    def _write_reviews(self, reviews):
+        self.file.writelines(json.dumps(review, ensure_ascii=False) + '\n' for review in reviews)
+
+
+class ParquetSink(ReviewSink):
+    """
+    Stream reviews to a Parquet file in row groups (requires pyarrow)
+
+    Every flush (each flush_every pages) writes the buffered reviews as one
+    row group, so memory stays bounded by flush_every pages; raise
+    flush_every for fewer, larger row groups. The file footer is only
+    written on close, so the file is readable once the run ends.
+    "N/A" ratings are stored as nulls so the rating column stays numeric.
+    """
+
+    def __init__(self, filename, row_group_size=10000, flush_every=1):
+        """
+        Args:
+            filename (str): Output .parquet file
+            row_group_size (int): Write a row group early once this many reviews are buffered
+            flush_every (int): Write a row group every N pages
+        """
+        super().__init__(filename, flush_every)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet output. Please install: pip install pyarrow")
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.row_group_size = row_group_size
+        self.schema = pyarrow.schema([
+            (name, pyarrow.float64() if name == 'rating' else pyarrow.int32() if name == 'page_number' else pyarrow.string())
+            for name in CSV_FIELDNAMES
+        ])
+        self.buffer = []
+        self.writer = None
+
+    def _write(self, reviews):
+        self.buffer.extend(reviews)
+        if len(self.buffer) >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self):
+        if not self.buffer:
+            return
+        columns = {name: [review.get(name) for review in self.buffer] for name in CSV_FIELDNAMES}
+        columns['rating'] = [rating if isinstance(rating, (int, float)) else None for rating in columns['rating']]
+        table = self._pa.Table.from_pydict(columns, schema=self.schema)
+        if self.writer is None:
+            self.writer = self._pq.ParquetWriter(self.filename, self.schema)
+        self.writer.write_table(table)
+        self.buffer = []
+
+    def flush(self):
+        self._write_row_group()
+
+    def resume_from(self, offset):
+        # Parquet files cannot be appended to, so a resumed run writes a new part file
+        if not os.path.exists(self.filename):
+            return
+        base, extension = os.path.splitext(self.filename)
+        part = 1
+        while os.path.exists(f"{base}.part{part}{extension}"):
+            part += 1
+        self.filename = f"{base}.part{part}{extension}"
+
+    def close(self):
+        self._write_row_group()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            logger.info(f"Reviews saved to {self.filename}")
+
+
+SINK_FORMATS = {
+    'csv': (CsvSink, '.csv'),
+    'json': (JsonArraySink, '.json'),
+    'jsonl': (JsonlSink, '.jsonl'),
+    'parquet': (ParquetSink, '.parquet'),
+}
+
+
+def create_sinks(output_file, formats=('csv', 'json'), flush_every=1):
+    """
+    Build one sink per output format, all named after output_file
+
+    Args:
+        output_file (str): Base output path, e.g. 'levis_reviews_all_pages.csv'
+        formats (iterable): Any of 'csv', 'json', 'jsonl', 'parquet', or
+            'postgres' to also load into the database at $DATABASE_URL
+        flush_every (int): Flush each sink every N pages
+    """
+    base, _ = os.path.splitext(output_file)
+    sinks = []
+    for output_format in formats:
+        if output_format == 'postgres':
+            from postgres_sink import PostgresReviewSink
+            sinks.append(PostgresReviewSink())
+            continue
+        try:
+            sink_class, extension = SINK_FORMATS[output_format]
+        except KeyError:
+            raise ValueError(f"Unknown output format: {output_format!r} (expected one of {sorted(SINK_FORMATS)})")
+        sinks.append(sink_class(base + extension, flush_every=flush_every))
+    return sinks
+
+
+# Key order of the review dicts produced by parse_page
+REVIEW_KEYS = ['review_text', 'review_date', 'rating', 'reviewer_name', 'review_title', 'user_recommendation',
+               'page_number', 'source_url']
+
+
+def iter_review_file(path):
+    """
+    Stream reviews back from a .json, .jsonl or .csv output file
+
+    CSV values come back as strings, except rating (float) and page_number
+    (int); empty cells in those two become None.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding='utf-8', newline='' if extension == '.csv' else None) as f:
+        if extension == '.json':
+            yield from json.load(f)
+        elif extension == '.jsonl':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif extension == '.csv':
+            for row in csv.DictReader(f):
+                review = {key: row.get(key, '') for key in REVIEW_KEYS}
+                review['rating'] = float(review['rating']) if review['rating'] else None
+                review['page_number'] = int(review['page_number']) if review['page_number'] else None
+                yield review
+        else:
+            raise ValueError(f"Unknown review file type: {path!r} (expected .json, .jsonl or .csv)")
+
+
+def export_reviews(input_file, output_file, formats=('csv', 'json'), flush_every=1):
+    """
+    Write the reviews of an existing output file to other sinks (e.g. parquet or postgres)
+
+    Reviews are passed on page by page, in file order.
+
+    Returns:
+        int: Number of reviews written
+    """
+    sinks = create_sinks(output_file, formats, flush_every)
+    written = 0
+    page, page_number = [], None
+    try:
+        for review in iter_review_file(input_file):
+            if page and review.get('page_number') != page_number:
+                for sink in sinks:
+                    sink.write_page(page)
+                written += len(page)
+                page = []
+            page.append(review)
+            page_number = review.get('page_number')
+        if page:
+            for sink in sinks:
+                sink.write_page(page)
+            written += len(page)
+    finally:
+        for sink in sinks:
+            sink.close()
+    return written
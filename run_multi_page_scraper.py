@@ -2,12 +2,18 @@
 """
 Simple script to run the multi-page Levi's reviews scraper
 This version uses Selenium to automatically navigate through multiple pages
+(see scraper_cli.py for the HTTP backends and the other options)
 """
 
-from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+import argparse
+import logging
 import os
 
 def main():
+    parser = argparse.ArgumentParser(description="Scrape Levi's reviews with Chrome browser automation")
+    parser.add_argument('--pages', type=int, default=5, help="How many pages to scrape (default 5)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("🚀 Levi's Reviews Multi-Page Scraper")
     print("=" * 50)
     print("This scraper uses Chrome browser automation to navigate through multiple pages")
@@ -35,11 +41,7 @@ def main():
 
     print()
 
-    # Get user preferences
-    try:
-        max_pages = int(input("How many pages to scrape? (default 5): ") or "5")
-    except ValueError:
-        max_pages = 5
+    max_pages = args.pages
 
     print(f"\n🎯 Starting scraper with settings:")
     print(f"   • Max pages: {max_pages}")
@@ -48,6 +50,7 @@ def main():
     print()
 
     # Initialize and run scraper
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
     scraper = LevisReviewsScraperMultiPage(use_brightdata=use_brightdata)
 
     try:
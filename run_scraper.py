@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """
-Simple script to run the Levi's reviews scraper
-Update the config.py file with your BrightData credentials before running
+Simple script to run the Levi's reviews scraper over plain HTTP
+Set BRIGHTDATA_API_KEY to route requests through BrightData
+(see scraper_cli.py for the other backends and options)
 """
 
-from levis_reviews_scraper import LevisReviewsScraper
-import json
+import argparse
+import logging
 import os
 
 def main():
+    parser = argparse.ArgumentParser(description="Scrape Levi's reviews over HTTP")
+    parser.add_argument('--pages', type=int, default=10, help="How many pages to scrape (default 10)")
+    parser.add_argument('--output', default='levis_reviews.csv', help="CSV output file (JSON is written next to it)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print("Levi's Reviews Scraper")
     print("=" * 50)
 
@@ -18,21 +25,23 @@ def main():
         print("   export BRIGHTDATA_API_KEY=your_api_key")
         print()
 
-    # Initialize scraper
-    scraper = LevisReviewsScraper()
+    # Initialize scraper (Chrome is only started for pages that need JavaScript)
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+    scraper = LevisReviewsScraperMultiPage(use_brightdata=bool(os.getenv('BRIGHTDATA_API_KEY')),
+                                           fetch_backend='requests')
 
-    print(f"Starting to scrape up to 10 pages...")
+    print(f"Starting to scrape up to {args.pages} pages...")
 
     # Start scraping
-    reviews = scraper.scrape_reviews(
-        max_pages=10,
-        output_file='levis_reviews.csv'
+    reviews = scraper.scrape_all_reviews(
+        max_pages=args.pages,
+        output_file=args.output
     )
 
     if reviews:
         print(f"\n✅ Scraping completed successfully!")
         print(f"📊 Total reviews found: {len(reviews)}")
-        print(f"💾 Data saved to: levis_reviews.csv and levis_reviews.json")
+        print(f"💾 Data saved to: {args.output} and {os.path.splitext(args.output)[0]}.json")
 
         # Show a sample review
         if len(reviews) > 0:
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Run the multi-page Levi's reviews scraper as several sharded processes
+
+The page range is split into contiguous shards; each shard runs in its own
+process with its own scraper instance (and its own Chrome and proxy session),
+writes its reviews to a JSONL shard file, and the shard files are merged into
+the final outputs in page_number order. If any shard fails, every shard file
+and checkpoint is kept and the exit status is 1; rerunning with --resume
+continues the unfinished shards and skips the completed ones. Runs without
+prompts, e.g.:
+
+    python run_sharded_scraper.py --pages 200 --backend requests
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from review_sinks import SINK_FORMATS, create_sinks
+
+
+def shard_ranges(first_page, last_page, shards):
+    """
+    Split first_page..last_page into at most `shards` contiguous (first, last) ranges
+    """
+    total = last_page - first_page + 1
+    shards = max(1, min(shards, total))
+    size, extra = divmod(total, shards)
+    ranges = []
+    start = first_page
+    for index in range(shards):
+        end = start + size - 1 + (1 if index < extra else 0)
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+def shard_path(output_file, shard_index):
+    base = os.path.splitext(output_file)[0]
+    return f"{base}.shard-{shard_index:03d}.jsonl"
+
+
+def shard_checkpoint_path(path):
+    return path + '.checkpoint.json'
+
+
+def run_shard(shard_index, first_page, last_page, options):
+    """
+    Scrape one page range in a worker process
+
+    Returns:
+        dict: Shard summary (reviews written, pages, elapsed time, error)
+    """
+    from crawl_checkpoint import CrawlCheckpoint
+    from http_cache import HttpCache
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+    from proxy_pool import ProxyPool
+
+    # No-op when the worker was forked from an already configured parent
+    logging.basicConfig(level=options['log_level'], format=f"[shard {shard_index}] %(message)s")
+
+    path = shard_path(options['output'], shard_index)
+    checkpoint_file = shard_checkpoint_path(path)
+    state = CrawlCheckpoint(checkpoint_file).load() if options['resume'] else None
+    if state and state.get('completed'):
+        # Finished in an earlier run; its shard file is already complete
+        return {'shard': shard_index, 'pages': (first_page, last_page), 'path': path,
+                'reviews': state['reviews_written'], 'elapsed': 0.0, 'error': None, 'metrics': None}
+
+    proxy_pool = None
+    api_key = os.getenv('BRIGHTDATA_API_KEY')
+    if options['use_brightdata'] and api_key:
+        # A session prefix per shard keeps every process on its own exit IP
+        proxy_pool = ProxyPool.brightdata(
+            api_key,
+            size=max(1, options['concurrency']),
+            session_prefix=f"{int(time.time())}{shard_index:03d}",
+        )
+
+    site = {}
+    if options['start_url']:
+        url = urlsplit(options['start_url'])
+        site = {'base_url': f"{url.scheme}://{url.netloc}", 'start_url': options['start_url']}
+
+    scraper = LevisReviewsScraperMultiPage(
+        fetch_backend=options['backend'],
+        concurrency=options['concurrency'],
+        requests_per_second=options['requests_per_second'],
+        parser_backend=options['parser'],
+        extraction_mode=options['extraction'],
+        output_formats=('jsonl',),
+        proxy_pool=proxy_pool,
+        http_cache=HttpCache(options['http_cache'], ttl=options['cache_ttl']) if options['http_cache'] else None,
+        **site
+    )
+
+    started = time.perf_counter()
+    scraper.scrape_all_reviews(
+        max_pages=last_page,
+        output_file=path,
+        keep_reviews=False,
+        resume=options['resume'],
+        start_page=first_page,
+        checkpoint_file=checkpoint_file,
+    )
+    return {
+        'shard': shard_index,
+        'pages': (first_page, last_page),
+        'path': path,
+        'reviews': scraper.reviews_emitted,
+        'elapsed': time.perf_counter() - started,
+        'error': str(scraper.crawl_error) if scraper.crawl_error else None,
+        'metrics': scraper.metrics.report(),
+    }
+
+
+def iter_shard_reviews(path):
+    if not os.path.exists(path):
+        return
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def merge_shards(shard_paths, output_file, formats):
+    """
+    Merge shard JSONL files into the final outputs in stable page_number order
+
+    Returns:
+        int: Number of reviews written
+    """
+    merged = heapq.merge(*(iter_shard_reviews(path) for path in shard_paths),
+                         key=lambda review: review.get('page_number') or 0)
+    sinks = create_sinks(output_file, formats)
+    written = 0
+    page, page_number = [], None
+    try:
+        for review in merged:
+            if page and review.get('page_number') != page_number:
+                for sink in sinks:
+                    sink.write_page(page)
+                written += len(page)
+                page = []
+            page.append(review)
+            page_number = review.get('page_number')
+        if page:
+            for sink in sinks:
+                sink.write_page(page)
+            written += len(page)
+    finally:
+        for sink in sinks:
+            sink.close()
+    return written
+
+
+def main(argv=None):
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Scrape Levi's reviews with one process per page-range shard")
+    parser.add_argument('--pages', type=int, default=50, help="Last page to scrape (default 50)")
+    parser.add_argument('--start-page', type=int, default=1, help="First page to scrape (default 1)")
+    parser.add_argument('--shards', type=int, default=None,
+                        help="Number of page ranges (default: one per process)")
+    parser.add_argument('--processes', type=int, default=cpu_count,
+                        help=f"Worker processes (default: all {cpu_count} cores)")
+    parser.add_argument('--backend', choices=['selenium', 'requests', 'httpx'], default='selenium')
+    parser.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4')
+    parser.add_argument('--extraction', choices=['html', 'browser'], default='html',
+                        help="Selenium mode: parse page_source in Python or extract reviews inside Chrome")
+    parser.add_argument('--concurrency', type=int, default=1, help="Concurrent fetches within each shard")
+    parser.add_argument('--requests-per-second', type=float, default=None, help="Per-shard rate limit")
+    parser.add_argument('--output', default='levis_reviews_all_pages.csv', help="Base output file")
+    parser.add_argument('--format', dest='formats', action='append', choices=sorted(SINK_FORMATS),
+                        help="Output format (repeatable, default csv and json)")
+    parser.add_argument('--start-url', default=None, help="Override the review start URL")
+    parser.add_argument('--http-cache', default=None, metavar='PATH',
+                        help="SQLite HTTP cache shared by the shards (HTTP backends only)")
+    parser.add_argument('--cache-ttl', type=float, default=0,
+                        help="Seconds cached pages are reused without revalidating (default 0)")
+    parser.add_argument('--no-brightdata', action='store_true', help="Ignore BRIGHTDATA_API_KEY")
+    parser.add_argument('--keep-shards', action='store_true',
+                        help="Keep the per-shard JSONL files (always kept when a shard fails)")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue the shards of a failed run from their checkpoints")
+    parser.add_argument('--metrics', default=None, help="Write every shard's run metrics to this JSON file")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level, format='%(message)s')
+
+    processes = max(1, args.processes)
+    ranges = shard_ranges(args.start_page, args.pages, args.shards or processes)
+    options = {
+        'backend': args.backend,
+        'parser': args.parser,
+        'extraction': args.extraction,
+        'concurrency': args.concurrency,
+        'requests_per_second': args.requests_per_second,
+        'output': args.output,
+        'start_url': args.start_url,
+        'use_brightdata': not args.no_brightdata,
+        'http_cache': args.http_cache,
+        'cache_ttl': args.cache_ttl,
+        'log_level': args.log_level,
+        'resume': args.resume,
+    }
+
+    print("🚀 Levi's Reviews Sharded Scraper")
+    print(f"   • Pages {args.start_page}-{args.pages} in {len(ranges)} shards on {processes} processes")
+    print(f"   • Backend: {args.backend}")
+    print(f"   • BrightData: {'Enabled' if options['use_brightdata'] and os.getenv('BRIGHTDATA_API_KEY') else 'Disabled'}")
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(run_shard, index, first, last, options)
+                   for index, (first, last) in enumerate(ranges)]
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ Shard process failed: {e}")
+                continue
+            results.append(result)
+            first, last = result['pages']
+            status = f"❌ {result['error']}" if result['error'] else "✅"
+            print(f"{status} Shard {result['shard']} (pages {first}-{last}): "
+                  f"{result['reviews']} reviews in {result['elapsed']:.1f}s")
+
+    paths = [shard_path(args.output, index) for index in range(len(ranges))]
+    formats = tuple(args.formats or ('csv', 'json'))
+    total = merge_shards(paths, args.output, formats)
+
+    completed = {result['shard'] for result in results if not result['error']}
+    failed = [index for index in range(len(ranges)) if index not in completed]
+
+    # A failed shard's file and checkpoint are what --resume continues from
+    if not args.keep_shards and not failed:
+        for path in paths:
+            for leftover in (path, shard_checkpoint_path(path)):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+
+    if args.metrics:
+        with open(args.metrics, 'w', encoding='utf-8') as f:
+            json.dump({'shards': sorted(results, key=lambda result: result['shard'])}, f, indent=2)
+
+    elapsed = time.perf_counter() - started
+    if failed:
+        print(f"\n❌ Merged {total} reviews, but shards {failed} did not finish ({elapsed:.1f}s)")
+        print("   Shard files and checkpoints were kept: rerun with the same options and --resume to continue")
+        return 1
+    print(f"\n🎉 Merged {total} reviews from {len(ranges)} shards in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Stages timed for every page, in pipeline order
+STAGES = ('navigation', 'wait', 'page_source', 'browser_extract', 'parse', 'find_reviews', 'parse_review', 'output')
+
+
+class ScrapeMetrics:
+    """
+    Per-stage timings and WebDriver call counts for one scrape run
+
+    Stages are timed with stage() or record(); each timing is aggregated per
+    stage and, when it belongs to a page, also kept in that page's breakdown.
+    report() returns the whole run as a JSON-serialisable dict and
+    prometheus_text() renders the totals in the Prometheus text format.
+
+    Usage:
+        metrics = ScrapeMetrics()
+        with metrics.stage('parse', page_number=3):
+            soup = BeautifulSoup(html, 'html.parser')
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Start a new run, discarding all recorded timings"""
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.elapsed = None
+        self.current_page = None
+        self.stages = {}
+        self.pages = {}
+        self.pages_completed = 0
+        self.reviews = 0
+        self.webdriver_calls = {}
+        self.webdriver_seconds = 0.0
+
+    def _page(self, page_number):
+        return self.pages.setdefault(page_number, {'page_number': page_number, 'reviews': None, 'stages': {}})
+
+    def record(self, stage, seconds, page_number=None):
+        """
+        Add one timing for a stage (attributed to current_page if no page is given)
+        """
+        if page_number is None:
+            page_number = self.current_page
+        with self._lock:
+            stats = self.stages.setdefault(stage, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            stats['count'] += 1
+            stats['total_seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            if page_number is not None:
+                page_stages = self._page(page_number)['stages']
+                page_stages[stage] = page_stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name, page_number=None):
+        """
+        Context manager timing the enclosed block as one call of a stage
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, page_number)
+
+    def page_done(self, page_number, reviews):
+        """
+        Mark a page as fully processed with the number of reviews it produced
+        """
+        with self._lock:
+            self._page(page_number)['reviews'] = reviews
+            self.pages_completed += 1
+            self.reviews += reviews
+
+    def count_webdriver_call(self, command, seconds):
+        with self._lock:
+            self.webdriver_calls[command] = self.webdriver_calls.get(command, 0) + 1
+            self.webdriver_seconds += seconds
+
+    def finish(self):
+        """Freeze the run's elapsed time"""
+        self.elapsed = time.perf_counter() - self._started
+
+    def report(self):
+        """
+        Return the run metrics as a JSON-serialisable dict
+        """
+        elapsed = self.elapsed if self.elapsed is not None else time.perf_counter() - self._started
+        with self._lock:
+            stages = {}
+            for name in sorted(self.stages, key=lambda name: STAGES.index(name) if name in STAGES else len(STAGES)):
+                stats = self.stages[name]
+                stages[name] = {
+                    'count': stats['count'],
+                    'total_seconds': round(stats['total_seconds'], 6),
+                    'mean_seconds': round(stats['total_seconds'] / stats['count'], 6),
+                    'max_seconds': round(stats['max_seconds'], 6),
+                }
+            pages = []
+            for page_number in sorted(self.pages):
+                page = self.pages[page_number]
+                pages.append({
+                    'page_number': page_number,
+                    'reviews': page['reviews'],
+                    'stages': {name: round(seconds, 6) for name, seconds in page['stages'].items()},
+                })
+            return {
+                'started_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.started_at)),
+                'elapsed_seconds': round(elapsed, 6),
+                'pages': self.pages_completed,
+                'reviews': self.reviews,
+                'pages_per_second': round(self.pages_completed / elapsed, 4) if elapsed else None,
+                'reviews_per_second': round(self.reviews / elapsed, 4) if elapsed else None,
+                'stages': stages,
+                'webdriver_calls': {
+                    'total': sum(self.webdriver_calls.values()),
+                    'seconds': round(self.webdriver_seconds, 6),
+                    'by_command': dict(sorted(self.webdriver_calls.items())),
+                },
+                'page_timings': pages,
+            }
+
+    def write_report(self, path):
+        """Write report() to a JSON file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def prometheus_text(self, prefix='levis_scraper'):
+        """
+        Render the run totals in the Prometheus text exposition format
+        """
+        report = self.report()
+        lines = [
+            f"# HELP {prefix}_stage_seconds_total Time spent in each scrape stage",
+            f"# TYPE {prefix}_stage_seconds_total counter",
+        ]
+        lines += [f'{prefix}_stage_seconds_total{{stage="{name}"}} {stats["total_seconds"]}'
+                  for name, stats in report['stages'].items()]
+        lines += [
+            f"# HELP {prefix}_stage_calls_total Number of timed calls of each scrape stage",
+            f"# TYPE {prefix}_stage_calls_total counter",
+        ]
+        lines += [f'{prefix}_stage_calls_total{{stage="{name}"}} {stats["count"]}'
+                  for name, stats in report['stages'].items()]
+        lines += [
+            f"# HELP {prefix}_webdriver_calls_total WebDriver commands sent, by command",
+            f"# TYPE {prefix}_webdriver_calls_total counter",
+        ]
+        lines += [f'{prefix}_webdriver_calls_total{{command="{command}"}} {count}'
+                  for command, count in report['webdriver_calls']['by_command'].items()]
+        lines += [
+            f"# HELP {prefix}_pages_total Pages scraped",
+            f"# TYPE {prefix}_pages_total counter",
+            f"{prefix}_pages_total {report['pages']}",
+            f"# HELP {prefix}_reviews_total Reviews scraped",
+            f"# TYPE {prefix}_reviews_total counter",
+            f"{prefix}_reviews_total {report['reviews']}",
+            f"# HELP {prefix}_run_seconds Wall-clock duration of the run",
+            f"# TYPE {prefix}_run_seconds gauge",
+            f"{prefix}_run_seconds {report['elapsed_seconds']}",
+        ]
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Write prometheus_text() to a file (e.g. for the node_exporter textfile collector)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+
+    def summary_lines(self):
+        """One human-readable line per stage, for the end-of-run log"""
+        report = self.report()
+        lines = [f"{name}: {stats['total_seconds']:.3f}s total over {stats['count']} calls "
+                 f"(mean {stats['mean_seconds'] * 1000:.1f}ms, max {stats['max_seconds'] * 1000:.1f}ms)"
+                 for name, stats in report['stages'].items()]
+        if report['webdriver_calls']['total']:
+            lines.append(f"WebDriver calls: {report['webdriver_calls']['total']} "
+                         f"({report['webdriver_calls']['seconds']:.3f}s)")
+        return lines
+
+
+def instrument_driver(driver, metrics):
+    """
+    Count and time every WebDriver command sent through driver
+
+    Wraps driver.execute, which every driver and WebElement call goes through.
+    Re-instrumenting (e.g. a pooled driver leased by another scraper) replaces
+    the previous wrapper instead of stacking a new one on top.
+    """
+    original = getattr(driver, '_uninstrumented_execute', None) or driver.execute
+    driver._uninstrumented_execute = original
+
+    def execute(driver_command, params=None):
+        started = time.perf_counter()
+        try:
+            return original(driver_command, params)
+        finally:
+            metrics.count_webdriver_call(driver_command, time.perf_counter() - started)
+
+    driver.execute = execute
+    return driver
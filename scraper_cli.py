@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Single non-interactive entry point for crawling, re-parsing, exporting and benchmarking
+
+Only argparse is imported up front; each subcommand imports what it needs
+(Selenium only for the selenium backend, BeautifulSoup only when parsing
+with bs4), so --help and cron/container jobs start in milliseconds and
+nothing ever waits on stdin. Usable as a console script (scraper_cli:main).
+Examples:
+
+    python scraper_cli.py crawl --pages 50 --backend requests --concurrency 8 --format jsonl
+    python scraper_cli.py crawl --pages 200 --resume --fetch-control --http-cache cache.sqlite
+    python scraper_cli.py reparse page_archive/ --parser lxml --format parquet
+    python scraper_cli.py export levis_reviews_all_pages.jsonl --format parquet --format postgres
+    python scraper_cli.py bench --pages 20 --parsers lxml
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
+# Kept in sync with review_sinks.SINK_FORMATS (plus postgres) so building the parser imports nothing
+OUTPUT_FORMATS = ['csv', 'json', 'jsonl', 'parquet', 'postgres']
+
+
+def run_crawl(args):
+    """
+    Crawl one review listing; returns 1 if the crawl stopped early
+    """
+    from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+    use_brightdata = args.brightdata and bool(os.getenv('BRIGHTDATA_API_KEY'))
+    if args.brightdata and not use_brightdata:
+        logger.warning("--brightdata given but BRIGHTDATA_API_KEY is not set; crawling without a proxy")
+
+    http_cache = None
+    if args.http_cache:
+        from http_cache import HttpCache
+        http_cache = HttpCache(args.http_cache, ttl=args.cache_ttl)
+
+    scraper_kwargs = {}
+    if args.base_url:
+        scraper_kwargs['base_url'] = args.base_url
+    scraper = LevisReviewsScraperMultiPage(
+        use_brightdata=use_brightdata,
+        fetch_backend=args.backend,
+        concurrency=args.concurrency,
+        requests_per_second=args.requests_per_second,
+        parser_backend=args.parser,
+        extraction_mode=args.extraction,
+        archive_dir=args.archive_dir,
+        seen_index_path=args.seen_index,
+        output_formats=tuple(args.formats or ('csv', 'json')),
+        start_url=args.start_url,
+        http_cache=http_cache,
+        fetch_controller=args.fetch_control or None,
+        **scraper_kwargs
+    )
+    scraper.scrape_all_reviews(max_pages=args.pages, output_file=args.output, keep_reviews=False,
+                               resume=args.resume, start_page=args.start_page, metrics_file=args.metrics,
+                               prometheus_file=args.prometheus)
+
+    print(f"{'❌' if scraper.crawl_error else '✅'} {scraper.reviews_emitted} reviews from "
+          f"{scraper.metrics.pages_completed} pages")
+    if scraper.crawl_error:
+        print(f"   Stopped early: {scraper.crawl_error} (rerun with --resume to continue)")
+        return 1
+    return 0
+
+
+def run_reparse(args):
+    from reparse import reparse_archive
+
+    reparse_archive(args.archive_dir, args.output, args.workers, args.parser,
+                    latest_only=not args.all_fetches, output_formats=tuple(args.formats or ('csv', 'json')))
+    return 0
+
+
+def run_export(args):
+    from review_sinks import export_reviews
+
+    output = args.output or args.input
+    formats = tuple(args.formats or ('csv', 'json'))
+    if os.path.splitext(output)[0] == os.path.splitext(args.input)[0] and \
+            os.path.splitext(args.input)[1].lstrip('.').lower() in formats:
+        raise SystemExit(f"Refusing to overwrite {args.input}: pass --output or leave its format out")
+    written = export_reviews(args.input, output, formats)
+    print(f"✅ Exported {written} reviews from {args.input} as {', '.join(formats)}")
+    return 0
+
+
+def run_bench(args, bench_args):
+    from benchmark_scraper import main as benchmark_main
+
+    benchmark_main(bench_args, prog='scraper_cli.py bench')
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='scraper_cli.py',
+                                     description="Crawl, re-parse, export and benchmark review scrapes")
+    parser.add_argument('--log-level', default='INFO', choices=LOG_LEVELS)
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    commands.required = True
+
+    crawl = commands.add_parser('crawl', help="Crawl review pages into the output sinks")
+    crawl.add_argument('--pages', type=int, default=5, help="Last page to scrape (default 5)")
+    crawl.add_argument('--start-page', type=int, default=1, help="First page to scrape (default 1)")
+    crawl.add_argument('--backend', choices=['selenium', 'requests', 'httpx'], default='requests',
+                       help="Fetch backend (default requests; Chrome is only started for pages that need JS)")
+    crawl.add_argument('--concurrency', type=int, default=1, help="Pages fetched in parallel by the HTTP backends")
+    crawl.add_argument('--requests-per-second', type=float, default=None, help="Per-host rate limit")
+    crawl.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4')
+    crawl.add_argument('--extraction', choices=['html', 'browser'], default='html',
+                       help="Selenium backend: parse page_source, or extract the reviews in the page")
+    crawl.add_argument('--output', default='levis_reviews_all_pages.csv', help="Base output file")
+    crawl.add_argument('--format', dest='formats', action='append', choices=OUTPUT_FORMATS,
+                       help="Output sink (repeatable, default: csv and json)")
+    crawl.add_argument('--base-url', default=None, help="Override the site root")
+    crawl.add_argument('--start-url', default=None, help="Override the review start URL")
+    crawl.add_argument('--resume', action='store_true', help="Continue an interrupted crawl from its checkpoint")
+    crawl.add_argument('--fetch-control', action='store_true',
+                       help="Retry with backoff, adapt the request rate and pause a failing site")
+    crawl.add_argument('--http-cache', default=None, metavar='PATH', help="SQLite HTTP cache for revalidation")
+    crawl.add_argument('--cache-ttl', type=float, default=0, help="Seconds cached pages are reused unchecked")
+    crawl.add_argument('--archive-dir', default=None, help="Archive every fetched page here for reparse")
+    crawl.add_argument('--seen-index', default=None, metavar='PATH',
+                       help="Crawl incrementally against this SQLite seen-review index")
+    crawl.add_argument('--brightdata', action='store_true', help="Use BRIGHTDATA_API_KEY proxy sessions")
+    crawl.add_argument('--metrics', default=None, help="Write the per-stage timing report to this JSON file")
+    crawl.add_argument('--prometheus', default=None, help="Write the run totals in Prometheus text format")
+
+    reparse = commands.add_parser('reparse', help="Re-parse archived pages offline")
+    reparse.add_argument('archive_dir', help="Page archive directory written by a crawl")
+    reparse.add_argument('--output', default='levis_reviews_reparsed.csv', help="Base output file")
+    reparse.add_argument('--workers', type=int, default=None, help="Parser processes (default: all cores)")
+    reparse.add_argument('--parser', choices=['bs4', 'lxml'], default='bs4')
+    reparse.add_argument('--all-fetches', action='store_true', help="Re-parse every fetch, not just the newest")
+    reparse.add_argument('--format', dest='formats', action='append', choices=OUTPUT_FORMATS,
+                         help="Output sink (repeatable, default: csv and json)")
+
+    export = commands.add_parser('export', help="Write an existing .json/.jsonl/.csv output to other sinks")
+    export.add_argument('input', help="Review file written by a crawl or reparse")
+    export.add_argument('--output', default=None, help="Base output file (default: next to the input)")
+    export.add_argument('--format', dest='formats', action='append', choices=OUTPUT_FORMATS,
+                        help="Output sink (repeatable, default: csv and json)")
+
+    # Options after 'bench' are passed through to benchmark_scraper (see 'bench --help')
+    commands.add_parser('bench', add_help=False, help="Run the offline benchmarks (benchmark_scraper options)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != 'bench':
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    logging.basicConfig(level=args.log_level, format='%(message)s')
+
+    if args.command == 'crawl':
+        return run_crawl(args)
+    if args.command == 'reparse':
+        return run_reparse(args)
+    if args.command == 'export':
+        return run_export(args)
+    return run_bench(args, extra)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
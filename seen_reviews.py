@@ -0,0 +1,86 @@
+import hashlib
+import sqlite3
+
+
+def review_key(review):
+    """
+    Stable content hash identifying a review across crawls
+
+    Built from reviewer_name, review_date and review_text, which together stay
+    the same when a review moves to another page as the listing shifts.
+    """
+    parts = [str(review.get(field, "N/A")) for field in ('reviewer_name', 'review_date', 'review_text')]
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+class SeenReviewIndex:
+    """
+    Persistent SQLite index of reviews that earlier crawls already emitted
+    """
+
+    def __init__(self, db_path='levis_seen_reviews.sqlite'):
+        """
+        Args:
+            db_path (str): SQLite database file holding the seen review hashes
+        """
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_reviews ("
+            " review_key TEXT PRIMARY KEY,"
+            " first_seen TEXT DEFAULT CURRENT_TIMESTAMP,"
+            " source_url TEXT)"
+        )
+        self.connection.commit()
+
+    def _known_keys(self, keys):
+        known = set()
+        keys = list(keys)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT review_key FROM seen_reviews WHERE review_key IN ({placeholders})", chunk
+            )
+            known.update(row[0] for row in rows)
+        return known
+
+    def __contains__(self, review):
+        return bool(self._known_keys([review_key(review)]))
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM seen_reviews").fetchone()[0]
+
+    def all_seen(self, reviews):
+        """
+        Return True if every review in the batch is already in the index
+        """
+        keys = {review_key(review) for review in reviews}
+        return bool(keys) and self._known_keys(keys) == keys
+
+    def filter_new(self, reviews):
+        """
+        Return the reviews not seen before and record them as seen
+
+        Duplicates within the batch are only returned once.
+        """
+        keyed = [(review_key(review), review) for review in reviews]
+        known = self._known_keys(key for key, _ in keyed)
+
+        new_reviews = []
+        for key, review in keyed:
+            if key in known:
+                continue
+            known.add(key)
+            new_reviews.append(review)
+
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO seen_reviews (review_key, source_url) VALUES (?, ?)",
+            [(review_key(review), review.get('source_url')) for review in new_reviews]
+        )
+        self.connection.commit()
+        return new_reviews
+
+    def close(self):
+        self.connection.close()
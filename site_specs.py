@@ -0,0 +1,217 @@
+import json
+import os
+import re
+from urllib.parse import urlsplit
+
+from page_fetchers import PAGE_URL_TEMPLATE
+from review_fields import Locator, build_review_fields
+
+
+SPEC_KEYS = {
+    'name', 'start_url', 'base_url', 'max_pages', 'start_page', 'fetch_backend', 'concurrency',
+    'requests_per_second', 'parser', 'extraction', 'selectors', 'pagination', 'domain', 'output_formats',
+}
+PAGINATION_KEYS = {'page_url_template'}
+
+IP_ADDRESS_PATTERN = re.compile(r'^\d+\.\d+\.\d+\.\d+$')
+
+# Common public suffixes of more than one label, used when tldextract is not installed
+MULTI_LABEL_SUFFIXES = {
+    'co.uk', 'org.uk', 'me.uk', 'ltd.uk', 'plc.uk', 'net.uk', 'ac.uk', 'gov.uk', 'nhs.uk',
+    'com.au', 'net.au', 'org.au', 'edu.au', 'gov.au', 'co.nz', 'net.nz', 'org.nz',
+    'co.jp', 'ne.jp', 'or.jp', 'ac.jp', 'go.jp', 'co.kr', 'or.kr', 'co.in', 'net.in', 'org.in', 'gov.in',
+    'com.cn', 'net.cn', 'org.cn', 'gov.cn', 'com.hk', 'org.hk', 'com.tw', 'org.tw', 'com.sg', 'com.my',
+    'co.id', 'co.th', 'com.ph', 'com.vn', 'co.il', 'com.tr', 'co.za', 'com.eg', 'com.ng', 'co.ke',
+    'com.br', 'net.br', 'org.br', 'gov.br', 'com.ar', 'com.mx', 'com.co', 'com.pe', 'com.uy', 'com.ve',
+    'co.at', 'or.at', 'com.es', 'com.pl', 'com.pt', 'com.ua', 'com.ru', 'com.gr',
+}
+
+_suffix_extractor = None
+
+
+def _tldextract():
+    global _suffix_extractor
+    if _suffix_extractor is None:
+        try:
+            import tldextract
+        except ImportError:
+            _suffix_extractor = False
+        else:
+            # The bundled public suffix list, without fetching a fresh copy
+            _suffix_extractor = tldextract.TLDExtract(suffix_list_urls=())
+    return _suffix_extractor or None
+
+
+def registrable_domain(url):
+    """
+    Politeness key for a URL: its host without subdomains
+
+    'https://levis.pissedconsumer.com/review.html' -> 'pissedconsumer.com' and
+    'https://shop.example.co.uk/' -> 'example.co.uk', so every brand listing
+    on one site shares a queue. Public suffixes come from tldextract when it
+    is installed, otherwise from MULTI_LABEL_SUFFIXES. IP addresses and
+    single-label hosts (localhost) are kept whole, including the port.
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or '').rstrip('.')
+    if IP_ADDRESS_PATTERN.match(host) or '.' not in host:
+        return parts.netloc
+
+    extractor = _tldextract()
+    if extractor is not None:
+        extracted = extractor(host)
+        if extracted.domain and extracted.suffix:
+            return f"{extracted.domain}.{extracted.suffix}"
+        return host
+
+    labels = host.split('.')
+    suffix_labels = 2 if '.'.join(labels[-2:]) in MULTI_LABEL_SUFFIXES else 1
+    if len(labels) <= suffix_labels:
+        # The host is itself a public suffix
+        return host
+    return '.'.join(labels[-suffix_labels - 1:])
+
+
+class SiteSpec:
+    """
+    Declarative description of one review listing to crawl
+
+    Covers what LevisReviewsScraperMultiPage otherwise hard-codes for the
+    Levi's PissedConsumer listing: URLs, the review markup (selectors), the
+    listing page URL pattern and the politeness rate. Specs are normally
+    loaded with load_site_specs from YAML or JSON:
+
+        defaults:
+          fetch_backend: requests
+          requests_per_second: 1
+        sites:
+          - name: levis
+            start_url: https://levis.pissedconsumer.com/review.html
+            max_pages: 50
+          - name: acme
+            start_url: https://reviews.example.com/acme/
+            pagination: {page_url_template: "page/{page}/"}
+            selectors:
+              review_item: div.review
+              review_text: div.review-body
+              reviewer_name: {tag: span, class: author, fallback: null}
+    """
+
+    def __init__(self, name, start_url, base_url=None, max_pages=10, start_page=1, fetch_backend='requests',
+                 concurrency=1, requests_per_second=None, parser='bs4', extraction='html', selectors=None,
+                 pagination=None, domain=None, output_formats=('csv', 'json')):
+        """
+        Args:
+            name (str): Job name, also the output file name
+            start_url (str): First listing page
+            base_url (str): Site root (default: scheme and host of start_url)
+            max_pages (int): Last page to crawl
+            start_page (int): First page to crawl
+            fetch_backend (str): 'selenium', 'requests' or 'httpx'
+            concurrency (int): Pages fetched in parallel within this job
+            requests_per_second (float): Politeness rate for this spec's domain
+            parser (str): 'bs4' or 'lxml' (lxml only with the default selectors)
+            extraction (str): 'html' or 'browser' (Selenium mode)
+            selectors (dict): 'review_item' and/or review field name ->
+                selector overriding the PissedConsumer markup (see
+                review_fields.Locator.from_spec and build_review_fields)
+            pagination (dict): {'page_url_template': 'RT-P.html?page={page}'}
+            domain (str): Politeness queue key (default: registrable domain)
+            output_formats (list): Output sink formats
+        """
+        if not name or not start_url:
+            raise ValueError("A site spec needs a name and a start_url")
+        pagination = pagination or {}
+        unknown = set(pagination) - PAGINATION_KEYS
+        if unknown:
+            raise ValueError(f"Site {name!r}: unknown pagination keys {sorted(unknown)}")
+        page_url_template = pagination.get('page_url_template', PAGE_URL_TEMPLATE)
+        if '{page}' not in page_url_template:
+            raise ValueError(f"Site {name!r}: page_url_template must contain '{{page}}'")
+
+        self.name = name
+        self.start_url = start_url
+        if base_url is None:
+            parts = urlsplit(start_url)
+            base_url = f"{parts.scheme}://{parts.netloc}"
+        self.base_url = base_url
+        self.max_pages = max_pages
+        self.start_page = start_page
+        self.fetch_backend = fetch_backend
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.parser = parser
+        self.extraction = extraction
+        self.page_url_template = page_url_template
+        self.domain = domain or registrable_domain(start_url)
+        self.output_formats = tuple(output_formats)
+
+        selectors = dict(selectors or {})
+        review_item = selectors.pop('review_item', None)
+        self.review_item = Locator.from_spec(review_item) if review_item else None
+        self.review_fields = build_review_fields(selectors) if selectors else None
+        if (self.review_item or self.review_fields) and (parser != 'bs4' or extraction != 'html'):
+            raise ValueError(f"Site {name!r}: custom selectors need parser 'bs4' and extraction 'html'")
+
+    @classmethod
+    def from_dict(cls, data, defaults=None):
+        """
+        Build a spec from a mapping, filling missing keys from defaults
+        """
+        merged = dict(defaults or {})
+        merged.update(data)
+        unknown = set(merged) - SPEC_KEYS
+        if unknown:
+            raise ValueError(f"Site {merged.get('name')!r}: unknown keys {sorted(unknown)}")
+        return cls(**merged)
+
+    def scraper_kwargs(self):
+        """
+        LevisReviewsScraperMultiPage arguments for this site
+        """
+        return {
+            'base_url': self.base_url,
+            'start_url': self.start_url,
+            'fetch_backend': self.fetch_backend,
+            'concurrency': self.concurrency,
+            'parser_backend': self.parser,
+            'extraction_mode': self.extraction,
+            'review_fields': self.review_fields,
+            'review_item': self.review_item,
+            'page_url_template': self.page_url_template,
+            'output_formats': self.output_formats,
+        }
+
+    def __repr__(self):
+        return f"SiteSpec({self.name!r}, {self.start_url!r})"
+
+
+def load_site_specs(path):
+    """
+    Load site specs from a YAML (.yaml/.yml) or JSON file
+
+    The file holds either a list of sites or {'defaults': {...}, 'sites': [...]}.
+
+    Returns:
+        list: SiteSpec objects in file order
+    """
+    with open(path, encoding='utf-8') as f:
+        if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("PyYAML is required for YAML site specs. Please install: pip install pyyaml")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    if isinstance(data, list):
+        data = {'sites': data}
+    defaults = data.get('defaults') or {}
+    specs = [SiteSpec.from_dict(site, defaults) for site in data.get('sites') or []]
+
+    names = [spec.name for spec in specs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate site names: {duplicates}")
+    return specs
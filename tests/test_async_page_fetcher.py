@@ -0,0 +1,40 @@
+import asyncio
+import threading
+
+import pytest
+
+from async_page_fetcher import AsyncPageFetcher, StopCrawl
+from local_review_server import LocalReviewServer
+
+
+def page_urls(server, pages):
+    return [f"{server.base_url}/RT-P.html?page={number}" for number in range(1, pages + 1)]
+
+
+@pytest.mark.parametrize('backend', ['httpx', 'requests'])
+def test_handle_page_runs_off_the_event_loop(backend):
+    handled = []
+
+    def handle_page(index, page):
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        handled.append((index, threading.current_thread().name))
+        return page.status_code
+
+    with LocalReviewServer(total_pages=6, reviews_per_page=2) as server:
+        results = AsyncPageFetcher(backend=backend, concurrency=3).fetch_all(page_urls(server, 6), handle_page)
+
+    assert results == [200] * 6
+    # One handler thread: pages are never handled in parallel
+    assert len({name for _, name in handled}) == 1
+    assert sorted(index for index, _ in handled) == list(range(6))
+
+
+def test_stop_crawl_drops_later_pages():
+    def handle_page(index, page):
+        return StopCrawl(index) if index == 2 else index
+
+    with LocalReviewServer(total_pages=8, reviews_per_page=2) as server:
+        results = AsyncPageFetcher(backend='httpx', concurrency=2).fetch_all(page_urls(server, 8), handle_page)
+
+    assert results == [0, 1, 2, None, None, None, None, None]
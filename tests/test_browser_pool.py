@@ -0,0 +1,112 @@
+import queue
+import threading
+
+import pytest
+
+from browser_pool import BrowserPool
+
+
+class FakeDriver:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError("browser gone")
+        return 1
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def acquire_in_thread(pool, timeout=5):
+    result = {}
+
+    def run():
+        try:
+            result['pooled'] = pool.acquire(timeout=timeout)
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, result
+
+
+def test_waiter_gets_replacement_when_driver_is_recycled():
+    pool = BrowserPool(FakeDriver, size=1, max_pages_per_driver=1, warm=False)
+    first = pool.acquire()
+
+    thread, result = acquire_in_thread(pool)
+    thread.join(0.2)
+    assert thread.is_alive()  # blocked: the only slot is leased
+
+    pool.release(first, pages=1)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert 'error' not in result
+    assert result['pooled'] is not first
+    assert first.driver.quit_called
+    assert pool.stats()['recycled'] == 1
+    assert pool.stats()['created'] == 2
+    pool.close()
+
+
+def test_waiter_gets_replacement_when_idle_driver_is_unhealthy():
+    drivers = [FakeDriver(), FakeDriver()]
+    pool = BrowserPool(lambda: drivers.pop(0), size=1, warm=False)
+    first = pool.acquire()
+
+    thread, result = acquire_in_thread(pool)
+    first.driver.healthy = False
+    pool.release(first)
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert result['pooled'].driver.healthy
+    assert pool.stats()['unhealthy'] == 1
+    pool.close()
+
+
+def test_acquire_times_out_when_every_driver_is_leased():
+    pool = BrowserPool(FakeDriver, size=1, warm=True)
+    leased = pool.acquire()
+    with pytest.raises(queue.Empty):
+        pool.acquire(timeout=0.1)
+    pool.release(leased)
+    assert pool.acquire(timeout=0.1) is leased
+    pool.close()
+
+
+def test_close_wakes_waiters():
+    pool = BrowserPool(FakeDriver, size=1, warm=False)
+    leased = pool.acquire()
+    thread, result = acquire_in_thread(pool, timeout=None)
+    thread.join(0.2)
+
+    pool.close()
+    thread.join(5)
+    assert isinstance(result.get('error'), RuntimeError)
+    pool.release(leased)
+    assert leased.driver.quit_called
+    assert pool.stats()['alive'] == 0
+
+
+def test_driver_context_counts_pages_towards_recycling():
+    pool = BrowserPool(FakeDriver, size=1, max_pages_per_driver=5, warm=False)
+    with pool.driver() as pooled:
+        pooled.note_page(3)
+    assert pooled.pages == 3 and pool.stats()['recycled'] == 0
+
+    with pool.driver() as again:
+        assert again is pooled and again.lease_pages == 0
+        again.note_page()
+        again.note_page()
+    assert pooled.pages == 5
+    assert pooled.driver.quit_called
+    assert pool.stats()['recycled'] == 1
+    pool.close()
@@ -0,0 +1,88 @@
+import json
+import os
+
+from crawl_checkpoint import CrawlCheckpoint
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+from local_review_server import LocalReviewServer
+
+
+def crawl(server, output_file, **kwargs):
+    scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', base_url=server.base_url,
+                                           output_formats=('jsonl',))
+    scraper.scrape_all_reviews(max_pages=10, output_file=output_file, keep_reviews=False, **kwargs)
+    return scraper
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_finished_crawl_leaves_no_checkpoint(tmp_path):
+    output_file = str(tmp_path / 'reviews.csv')
+    with LocalReviewServer(total_pages=3, reviews_per_page=2) as server:
+        scraper = crawl(server, output_file)
+    assert scraper.crawl_error is None
+    assert not os.path.exists(CrawlCheckpoint.path_for(output_file))
+
+
+def test_stopped_crawl_keeps_checkpoint_until_resumed(tmp_path):
+    output_file = str(tmp_path / 'reviews.csv')
+    checkpoint_path = CrawlCheckpoint.path_for(output_file)
+    with LocalReviewServer(total_pages=4, reviews_per_page=2) as server:
+        scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', base_url=server.base_url,
+                                               output_formats=('jsonl',))
+        original_parse = scraper.parse_page
+
+        def fail_after_page_2(page_source, page_number, *args, **kwargs):
+            if page_number == 2:
+                server.error_rate = 1.0
+            return original_parse(page_source, page_number, *args, **kwargs)
+
+        scraper.parse_page = fail_after_page_2
+        scraper.scrape_all_reviews(max_pages=10, output_file=output_file, keep_reviews=False)
+        assert scraper.crawl_error is not None
+        assert CrawlCheckpoint(checkpoint_path).load()['page_number'] == 2
+
+        server.error_rate = 0.0
+        resumed = crawl(server, output_file, resume=True)
+
+    assert resumed.crawl_error is None
+    assert not os.path.exists(checkpoint_path)
+    assert [review['page_number'] for review in read_jsonl(str(tmp_path / 'reviews.jsonl'))] == [1, 1, 2, 2, 3, 3, 4, 4]
+
+
+def test_explicit_checkpoint_file_is_kept_and_marked_completed(tmp_path):
+    checkpoint_file = str(tmp_path / 'crawl.checkpoint.json')
+    with LocalReviewServer(total_pages=2, reviews_per_page=2) as server:
+        crawl(server, str(tmp_path / 'reviews.csv'), checkpoint_file=checkpoint_file)
+    state = CrawlCheckpoint(checkpoint_file).load()
+    assert state['completed'] and state['page_number'] == 2
+
+
+def test_concurrent_crawl_writes_pages_as_they_finish(tmp_path):
+    output_file = str(tmp_path / 'reviews.csv')
+    jsonl_path = str(tmp_path / 'reviews.jsonl')
+    checkpoint_path = CrawlCheckpoint.path_for(output_file)
+    mid_crawl = {}
+    with LocalReviewServer(total_pages=8, reviews_per_page=2) as server:
+        original_page_html = server.page_html
+
+        def snapshot_on_page_6(page_number):
+            if page_number == 6 and not mid_crawl:
+                mid_crawl['reviews'] = read_jsonl(jsonl_path) if os.path.exists(jsonl_path) else []
+                mid_crawl['checkpoint'] = CrawlCheckpoint(checkpoint_path).load()
+            return original_page_html(page_number)
+
+        server.page_html = snapshot_on_page_6
+        scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', concurrency=2, base_url=server.base_url,
+                                               output_formats=('jsonl',))
+        scraper.scrape_all_reviews(max_pages=10, output_file=output_file, keep_reviews=False)
+
+    assert scraper.crawl_error is None
+    written_pages = sorted({review['page_number'] for review in mid_crawl['reviews']})
+    assert written_pages and written_pages == list(range(1, len(written_pages) + 1))
+    # Each page is written before it is checkpointed, so the snapshot may fall in between
+    checkpointed = mid_crawl['checkpoint']['page_number']
+    assert checkpointed >= 1 and written_pages[-1] - 1 <= checkpointed <= written_pages[-1]
+    assert [review['page_number'] for review in read_jsonl(jsonl_path)] == [n for n in range(1, 9) for _ in range(2)]
@@ -0,0 +1,228 @@
+import threading
+import time
+
+import pytest
+
+from fetch_control import (BLOCKED, END_OF_RESULTS, FAILED, FETCH_OK, THROTTLED, AdaptiveRateLimiter,
+                           CircuitBreaker, FetchController, FetchFailed, RetryPolicy, classify_response)
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+from local_review_server import LocalReviewServer
+from page_fetchers import create_fetcher
+from site_specs import registrable_domain
+
+
+class RecordingSleep:
+    def __init__(self):
+        self.delays = []
+
+    def __call__(self, seconds):
+        self.delays.append(seconds)
+
+
+def page_url(server, number):
+    return f"{server.base_url}/RT-P.html?page={number}"
+
+
+def controlled_fetcher(controller):
+    return controller.wrap(create_fetcher('requests', timeout=5))
+
+
+def test_classify_response_against_faulty_server():
+    with LocalReviewServer(total_pages=2, reviews_per_page=2) as server:
+        fetcher = create_fetcher('requests', timeout=5)
+        assert classify_response(fetcher.fetch(server.start_url)) == FETCH_OK
+        assert classify_response(fetcher.fetch(page_url(server, 3))) == END_OF_RESULTS
+        server.error_rate = 1.0
+        assert classify_response(fetcher.fetch(server.start_url)) == FAILED
+        server.error_rate, server.block_rate = 0.0, 1.0
+        assert classify_response(fetcher.fetch(server.start_url)) == BLOCKED
+        server.block_rate, server.rate_limit = 0.0, 1
+        fetcher.fetch(server.start_url)
+        assert classify_response(fetcher.fetch(server.start_url)) == THROTTLED
+        fetcher.close()
+    assert classify_response(None) == FAILED
+
+
+def test_retries_with_exponential_backoff_until_success():
+    sleep = RecordingSleep()
+    controller = FetchController(RetryPolicy(max_attempts=6, base_delay=0.5, max_delay=10, jitter=False),
+                                 AdaptiveRateLimiter(initial_rate=1000, max_rate=1000),
+                                 CircuitBreaker(failure_threshold=100), sleep=sleep)
+    with LocalReviewServer(total_pages=2, reviews_per_page=2, error_rate=1.0) as server:
+        def sleep_then_recover(seconds):
+            sleep(seconds)
+            if len(sleep.delays) == 3:
+                server.error_rate = 0.0
+
+        controller.sleep = sleep_then_recover
+        fetcher = controlled_fetcher(controller)
+        page = fetcher.fetch(server.start_url)
+        fetcher.close()
+
+    assert classify_response(page) == FETCH_OK
+    assert sleep.delays == [0.5, 1.0, 2.0]
+    assert server.faults['error'] == 3
+    assert controller.stats()['retries'] == 3
+    assert controller.stats()['outcomes'] == {FAILED: 3, FETCH_OK: 1}
+
+
+def test_gives_up_with_fetch_failed_instead_of_end_of_results():
+    controller = FetchController(RetryPolicy(max_attempts=3, base_delay=0.01, jitter=False),
+                                 AdaptiveRateLimiter(initial_rate=1000, max_rate=1000),
+                                 CircuitBreaker(failure_threshold=100), sleep=RecordingSleep())
+    with LocalReviewServer(total_pages=2, reviews_per_page=2, block_rate=1.0) as server:
+        fetcher = controlled_fetcher(controller)
+        with pytest.raises(FetchFailed) as failure:
+            fetcher.fetch(server.start_url)
+        fetcher.close()
+    assert failure.value.outcome == BLOCKED
+    assert server.faults['blocked'] == 3
+
+
+def test_retry_after_sets_the_minimum_delay():
+    policy = RetryPolicy(base_delay=0.1, max_delay=5, jitter=False)
+    assert policy.delay(0, retry_after=2) == 2
+    assert policy.delay(0, retry_after=60) == 5
+    assert [policy.delay(attempt) for attempt in range(8)] == [0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 5, 5]
+
+
+def test_aimd_decreases_on_throttle_and_recovers_on_success():
+    limiter = AdaptiveRateLimiter(initial_rate=8, min_rate=0.5, max_rate=10, additive_increase=1,
+                                  multiplicative_decrease=0.5)
+    url = 'http://127.0.0.1/RT-P.html?page=2'
+    limiter.on_throttle(url)
+    assert limiter.rate(url) == 4
+    # A second 429 answering a request sent before the decrease does not compound it
+    limiter.on_throttle(url)
+    assert limiter.rate(url) == 4
+    for _ in range(10):
+        limiter.on_success(url)
+    assert limiter.rate(url) == 10
+
+
+def test_aimd_slows_down_for_a_rate_limited_server():
+    limiter = AdaptiveRateLimiter(initial_rate=50, max_rate=50, additive_increase=0.1)
+    controller = FetchController(RetryPolicy(max_attempts=10, base_delay=0.05, max_delay=1.5),
+                                 limiter, CircuitBreaker(failure_threshold=100))
+    with LocalReviewServer(total_pages=20, reviews_per_page=2, rate_limit=5) as server:
+        fetcher = controlled_fetcher(controller)
+        pages = [fetcher.fetch(page_url(server, number)) for number in range(1, 9)]
+        fetcher.close()
+
+    assert all(classify_response(page) == FETCH_OK for page in pages)
+    assert server.faults['throttled'] > 0
+    assert controller.stats()['outcomes'][THROTTLED] == server.faults['throttled']
+    assert limiter.rate(server.start_url) < 50
+
+
+def test_circuit_opens_then_half_open_trial_closes_or_reopens():
+    sleep = RecordingSleep()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    controller = FetchController(RetryPolicy(max_attempts=1), AdaptiveRateLimiter(initial_rate=1000, max_rate=1000),
+                                 breaker, sleep=sleep)
+    with LocalReviewServer(total_pages=2, reviews_per_page=2, error_rate=1.0) as server:
+        fetcher = controlled_fetcher(controller)
+        url = server.start_url
+        for _ in range(2):
+            with pytest.raises(FetchFailed):
+                fetcher.fetch(url)
+        assert breaker.state(url) == 'open'
+
+        # The next request waits out the pause, then is a half-open trial that fails
+        with pytest.raises(FetchFailed):
+            fetcher.fetch(url)
+        assert len(sleep.delays) == 1 and 29 < sleep.delays[0] <= 30
+        assert breaker.state(url) == 'open'
+
+        server.error_rate = 0.0
+        assert classify_response(fetcher.fetch(url)) == FETCH_OK
+        assert len(sleep.delays) == 2
+        assert breaker.state(url) == 'closed'
+        fetcher.close()
+    assert breaker.stats()[registrable_domain(url)]['opened'] == 2
+
+
+def test_half_open_circuit_lets_one_trial_through_at_a_time():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.2)
+    url = 'http://shop.example.com/review.html'
+    breaker.record_failure(url)
+    passed = []
+
+    def request():
+        breaker.wait(url)
+        passed.append(threading.current_thread().name)
+
+    def wait_for_passed(count):
+        deadline = time.monotonic() + 5
+        while len(passed) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        return len(passed)
+
+    threads = [threading.Thread(target=request) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    assert wait_for_passed(1) == 1
+    assert breaker.state(url) == 'half_open'
+
+    # A failed trial pauses the domain again, then lets one more request through
+    breaker.record_failure(url)
+    assert breaker.state(url) == 'open'
+    assert wait_for_passed(2) == 2
+
+    breaker.record_success(url)
+    for thread in threads:
+        thread.join(timeout=5)
+    assert len(passed) == 5
+    assert breaker.state(url) == 'closed'
+
+
+@pytest.mark.parametrize('fetch_controller', [True, 'controller'])
+def test_fetch_controller_keeps_to_requests_per_second(tmp_path, fetch_controller):
+    if fetch_controller == 'controller':
+        fetch_controller = FetchController()
+    with LocalReviewServer(total_pages=2, reviews_per_page=2) as server:
+        scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', base_url=server.base_url, requests_per_second=1.5,
+                                               fetch_controller=fetch_controller, output_formats=('json',))
+        limiter = scraper.fetch_controller.rate_limiter
+        assert limiter.rate(server.start_url) == 1.5
+        started = time.monotonic()
+        scraper.scrape_all_reviews(max_pages=10, output_file=str(tmp_path / 'reviews.csv'), keep_reviews=False)
+        elapsed = time.monotonic() - started
+    assert scraper.crawl_error is None
+    # Three requests (two pages and the 404 after them) at most 1.5 per second
+    assert elapsed >= 1.3
+    assert limiter.rate(server.start_url) == 1.5
+
+
+@pytest.mark.parametrize('fetch_controller', [None, True])
+def test_crawl_reports_normal_end_of_results(tmp_path, fetch_controller):
+    with LocalReviewServer(total_pages=3, reviews_per_page=4) as server:
+        scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', base_url=server.base_url,
+                                               fetch_controller=fetch_controller, output_formats=('json',))
+        scraper.scrape_all_reviews(max_pages=10, output_file=str(tmp_path / 'reviews.csv'), keep_reviews=False)
+    assert scraper.crawl_error is None
+    assert scraper.reviews_emitted == 12
+
+
+@pytest.mark.parametrize('fetch_controller', [None, 'controller'])
+def test_crawl_reports_failure_separately_from_end_of_results(tmp_path, fetch_controller):
+    if fetch_controller:
+        fetch_controller = FetchController(RetryPolicy(max_attempts=2, base_delay=0.01), sleep=RecordingSleep())
+    with LocalReviewServer(total_pages=5, reviews_per_page=4) as server:
+        scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', base_url=server.base_url,
+                                               fetch_controller=fetch_controller, output_formats=('json',))
+        original_parse = scraper.parse_page
+
+        def fail_after_page_2(page_source, page_number, *args, **kwargs):
+            if page_number == 2:
+                server.error_rate = 1.0
+            return original_parse(page_source, page_number, *args, **kwargs)
+
+        scraper.parse_page = fail_after_page_2
+        scraper.scrape_all_reviews(max_pages=10, output_file=str(tmp_path / 'reviews.csv'), keep_reviews=False)
+
+    assert scraper.crawl_error is not None
+    assert isinstance(scraper.crawl_error, FetchFailed)
+    assert scraper.crawl_error.outcome == FAILED
+    assert scraper.reviews_emitted == 8
@@ -0,0 +1,83 @@
+import os
+import threading
+
+from http_cache import CachingFetcher, HttpCache
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+from page_fetchers import FetchedPage, PageFetcher
+from review_fields import build_review_fields
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'parser_parity', 'edge_cases.html')
+URL = 'https://example.test/review.html'
+
+
+class StaticFetcher(PageFetcher):
+    name = "static"
+
+    def __init__(self, html):
+        self.html = html
+        self.requests = 0
+
+    def fetch(self, url, headers=None, *args):
+        self.requests += 1
+        return FetchedPage(url, self.html)
+
+
+def cached_page(cache):
+    with open(FIXTURE, encoding='utf-8') as f:
+        return CachingFetcher(StaticFetcher(f.read()), cache).fetch(URL)
+
+
+def test_parsed_reviews_are_not_shared_across_selectors(tmp_path):
+    cache = HttpCache(str(tmp_path / 'cache.sqlite'))
+    page = cached_page(cache)
+    default = LevisReviewsScraperMultiPage(http_cache=cache)
+    # Same site, but the reviewer name only comes from the author fallback
+    custom = LevisReviewsScraperMultiPage(http_cache=cache, review_fields=build_review_fields(
+        {'reviewer_name': {'tag': 'span', 'class_contains': 'author', 'fallback': None}}))
+    assert default.parser_key != custom.parser_key
+
+    default_reviews = default.parse_page(page.html, 1, URL, page.body_hash)
+    custom_reviews = custom.parse_page(page.html, 1, URL, page.body_hash)
+    assert cache.parse_hits == 0
+    assert [review['reviewer_name'] for review in default_reviews] == ['Dana\xa0K.', 'Sam R.', 'Anonymous', 'Anonymous']
+    assert [review['reviewer_name'] for review in custom_reviews] == ['Anonymous', 'Sam R.', 'Anonymous', 'Anonymous']
+
+    again = LevisReviewsScraperMultiPage(http_cache=cache).parse_page(page.html, 1, URL, page.body_hash)
+    assert cache.parse_hits == 1
+    assert again == default_reviews
+    cache.close()
+
+
+def test_parsed_reviews_are_dropped_with_their_body(tmp_path):
+    cache = HttpCache(str(tmp_path / 'cache.sqlite'))
+    page = cached_page(cache)
+    cache.store_parsed(page.body_hash, 'bs4:test', [{'review_text': 'x'}])
+    assert cache.parsed_reviews(page.body_hash, 'bs4:test') == [{'review_text': 'x'}]
+    assert cache.parsed_reviews(page.body_hash, 'lxml:test') is None
+
+    cache.store(URL, FetchedPage(URL, '<html>changed</html>'))
+    assert cache.parsed_reviews(page.body_hash, 'bs4:test') is None
+    assert cache.connection.execute("SELECT COUNT(*) FROM parsed").fetchone()[0] == 0
+    cache.close()
+
+
+def test_counters_are_exact_under_concurrent_fetches(tmp_path):
+    cache = HttpCache(str(tmp_path / 'cache.sqlite'), ttl=3600)
+    inner = StaticFetcher('<html><body>cached</body></html>')
+    fetcher = CachingFetcher(inner, cache)
+    fetcher.fetch(URL)
+
+    def fetch_many():
+        for _ in range(200):
+            fetcher.fetch(URL)
+
+    threads = [threading.Thread(target=fetch_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], inner.requests) == (1600, 1, 1)
+    assert stats['bytes_saved'] == 1600 * len('<html><body>cached</body></html>')
+    cache.close()
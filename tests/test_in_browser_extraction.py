@@ -0,0 +1,53 @@
+import os
+import shutil
+
+import pytest
+
+from in_browser_extraction import check_browser_parity, review_from_fields
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'parser_parity')
+FIXTURES = ['edge_cases', 'synthetic_page']
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+
+
+def skip_without_chrome(reason):
+    # CI installs Chrome, so there the parity check must run rather than skip
+    if os.environ.get('CI'):
+        pytest.fail(reason)
+    pytest.skip(reason)
+
+
+def test_review_from_fields_defaults():
+    review = review_from_fields({'review_text': 'Too tight.', 'date_rating': None, 'reviewer_name': None,
+                                 'review_title': None, 'recommendation': 'Verified purchase'})
+    assert review == {'review_text': 'Too tight.', 'review_date': 'N/A', 'rating': 'N/A',
+                      'reviewer_name': 'Anonymous', 'review_title': 'N/A', 'user_recommendation': 'N/A'}
+
+
+def test_review_from_fields_parses_date_rating_and_cuts_title():
+    review = review_from_fields({'review_text': 'Fine.', 'date_rating': 'Feb 02, 2022 4.0Rating Details',
+                                 'reviewer_name': 'Ana', 'review_title': 'x' * 150,
+                                 'recommendation': "User's recommendation: Buy."})
+    assert (review['review_date'], review['rating']) == ('Feb 02, 2022', 4.0)
+    assert review['review_title'] == 'x' * 100
+    assert review['user_recommendation'] == "User's recommendation: Buy."
+
+
+@pytest.fixture(scope='module')
+def chrome_scraper():
+    pytest.importorskip('selenium')
+    if not any(shutil.which(binary) for binary in CHROME_BINARIES):
+        skip_without_chrome("Chrome is not installed")
+    scraper = LevisReviewsScraperMultiPage()
+    scraper.chrome_options.add_argument('--headless=new')
+    if not scraper.setup_driver():
+        skip_without_chrome("Chrome could not be started")
+    yield scraper
+    scraper.release_driver()
+
+
+@pytest.mark.parametrize('name', FIXTURES)
+def test_extract_reviews_script_matches_parse_page_in_chrome(chrome_scraper, name):
+    chrome_scraper.driver.get('file://' + os.path.join(FIXTURES_DIR, f'{name}.html'))
+    assert check_browser_parity(chrome_scraper.driver, chrome_scraper) == []
@@ -0,0 +1,62 @@
+import os
+
+from fetch_control import FAILED, FetchFailed
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+from local_review_server import LocalReviewServer, generate_review_page
+from page_fetchers import SeleniumFetcher
+
+
+class FakeDriver:
+    def __init__(self, html):
+        self.page_source = html
+        self.current_url = None
+
+    def get(self, url):
+        self.current_url = url
+
+    def quit(self):
+        pass
+
+
+class FakeWaiter:
+    def __init__(self, reviews_appear):
+        self.reviews_appear = reviews_appear
+
+    def wait_for_reviews(self, timeout=None):
+        return self.reviews_appear
+
+
+def with_fake_chrome(scraper, html, reviews_appear):
+    scraper.driver = FakeDriver(html)
+    scraper.driver_pages = 0
+    scraper.waiter = FakeWaiter(reviews_appear)
+    return scraper
+
+
+def test_selenium_fetch_fails_when_reviews_never_appear():
+    scraper = with_fake_chrome(LevisReviewsScraperMultiPage(), "<html><body>Loading...</body></html>", False)
+    assert SeleniumFetcher(scraper).fetch('https://example.test/review.html') is None
+
+    scraper.waiter = FakeWaiter(True)
+    page = SeleniumFetcher(scraper).fetch('https://example.test/review.html')
+    assert page.html == "<html><body>Loading...</body></html>"
+
+
+def test_unrendered_javascript_page_stops_the_crawl_with_an_error(tmp_path):
+    fixtures = tmp_path / 'fixtures'
+    fixtures.mkdir()
+    (fixtures / 'page_1.html').write_text(generate_review_page(1, reviews_per_page=3, total_pages=3))
+    # No static review markup: the crawl falls back to Chrome for page 2
+    (fixtures / 'page_2.html').write_text("<html><body><div id='app'></div></body></html>")
+    (fixtures / 'page_3.html').write_text(generate_review_page(3, reviews_per_page=3, total_pages=3))
+
+    with LocalReviewServer(fixtures_dir=str(fixtures)) as server:
+        scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', base_url=server.base_url,
+                                               output_formats=('jsonl',))
+        with_fake_chrome(scraper, "<html><body><div id='app'></div></body></html>", False)
+        scraper.scrape_all_reviews(max_pages=3, output_file=str(tmp_path / 'reviews.csv'), keep_reviews=False)
+
+    assert isinstance(scraper.crawl_error, FetchFailed)
+    assert scraper.crawl_error.outcome == FAILED
+    assert scraper.reviews_emitted == 3
+    assert os.path.exists(tmp_path / 'reviews.checkpoint.json')
@@ -0,0 +1,62 @@
+import glob
+import json
+import os
+
+import pytest
+
+pytest.importorskip('bs4')
+pytest.importorskip('lxml')
+
+from fast_review_parser import FastReviewParser, check_parser_parity
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'parser_parity')
+FIXTURES = sorted(os.path.splitext(os.path.basename(path))[0]
+                  for path in glob.glob(os.path.join(FIXTURES_DIR, '*.html')))
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, f'{name}.html'), encoding='utf-8') as f:
+        page_source = f.read()
+    with open(os.path.join(FIXTURES_DIR, f'{name}.json'), encoding='utf-8') as f:
+        baseline = json.load(f)
+    return page_source, baseline
+
+
+def parse(parser_backend, page_source):
+    scraper = LevisReviewsScraperMultiPage(parser_backend=parser_backend)
+    return scraper.parse_page(page_source, 1, 'https://example.test/review.html')
+
+
+def test_fixtures_present():
+    assert FIXTURES == ['edge_cases', 'synthetic_page']
+
+
+@pytest.mark.parametrize('name', FIXTURES)
+def test_bs4_and_lxml_match_baseline(name):
+    page_source, baseline = load_fixture(name)
+    baseline = [dict(review, page_number=1, source_url='https://example.test/review.html') for review in baseline]
+
+    bs4_reviews = parse('bs4', page_source)
+    lxml_reviews = parse('lxml', page_source)
+
+    assert bs4_reviews == baseline
+    assert lxml_reviews == baseline
+
+
+@pytest.mark.parametrize('name', FIXTURES)
+def test_check_parser_parity_reports_no_mismatches(name):
+    page_source, _ = load_fixture(name)
+    assert check_parser_parity(page_source, LevisReviewsScraperMultiPage(), FastReviewParser()) == []
+
+
+def test_check_parser_parity_reports_differences():
+    page_source, baseline = load_fixture('edge_cases')
+
+    class DroppingParser(FastReviewParser):
+        def parse_html(self, page_source):
+            return super().parse_html(page_source)[1:]
+
+    mismatches = check_parser_parity(page_source, LevisReviewsScraperMultiPage(), DroppingParser())
+    assert mismatches
+    assert mismatches[0][1] == baseline[0]
@@ -0,0 +1,69 @@
+import os
+import uuid
+
+import pytest
+
+pytestmark = pytest.mark.skipif(not os.getenv('DATABASE_URL'), reason="DATABASE_URL is not set")
+
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+from local_review_server import LocalReviewServer
+
+
+@pytest.fixture
+def table():
+    psycopg2 = pytest.importorskip('psycopg2')
+    name = f"reviews_test_{uuid.uuid4().hex[:12]}"
+    yield name
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    with connection, connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS "{name}"')
+    connection.close()
+
+
+def crawl_into(table, server, tmp_path, use_copy):
+    from postgres_sink import PostgresReviewSink
+
+    sink = PostgresReviewSink(table=table, use_copy=use_copy)
+    scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', base_url=server.base_url)
+    scraper.scrape_all_reviews(max_pages=5, output_file=str(tmp_path / 'reviews.csv'), sinks=[sink],
+                               keep_reviews=False)
+    assert scraper.crawl_error is None
+    return scraper.reviews_emitted
+
+
+def query(table, sql, params=None):
+    import psycopg2
+
+    connection = psycopg2.connect(os.environ['DATABASE_URL'])
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql.format(table=f'"{table}"'), params)
+            return cursor.fetchone()
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize('use_copy', [True, False])
+def test_rerun_upserts_without_duplicate_rows(table, tmp_path, use_copy):
+    with LocalReviewServer(total_pages=3, reviews_per_page=4) as server:
+        assert crawl_into(table, server, tmp_path, use_copy) == 12
+        first_seen = query(table, "SELECT max(last_seen_at) FROM {table}")[0]
+        assert crawl_into(table, server, tmp_path, use_copy) == 12
+
+    rows, distinct, updated = query(
+        table, "SELECT count(*), count(DISTINCT content_hash), count(*) FILTER (WHERE last_seen_at > %s) FROM {table}",
+        (first_seen,)
+    )
+    assert (rows, distinct, updated) == (12, 12, 12)
+
+
+def test_duplicate_reviews_within_a_page_are_one_row(table):
+    from postgres_sink import PostgresReviewSink
+
+    review = {'review_text': 'Zipper broke.', 'review_date': 'Mar 04, 2023', 'rating': 1.0,
+              'reviewer_name': 'Dana', 'review_title': 'Zipper', 'user_recommendation': 'N/A',
+              'page_number': 1, 'source_url': 'https://example.test/review.html'}
+    sink = PostgresReviewSink(table=table)
+    sink.write_page([review, dict(review, page_number=2)])
+    sink.close()
+    assert query(table, "SELECT count(*), max(page_number) FROM {table}") == (1, 2)
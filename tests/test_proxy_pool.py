@@ -0,0 +1,75 @@
+import threading
+import time
+
+import proxy_pool
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+from local_review_server import LocalReviewServer
+from mock_proxy import MockProxyServer
+from proxy_pool import ProxiedFetcher, ProxyPool
+
+
+class TrackingFetcher:
+    """Wraps a real fetcher and records whether it was closed mid-request"""
+
+    def __init__(self, fetcher):
+        self.fetcher = fetcher
+        self.in_flight = 0
+        self.closed = False
+        self.closed_in_flight = False
+
+    def fetch(self, url, headers=None):
+        self.in_flight += 1
+        try:
+            return self.fetcher.fetch(url, headers)
+        finally:
+            self.in_flight -= 1
+
+    def close(self):
+        self.closed = True
+        self.closed_in_flight = self.closed_in_flight or self.in_flight > 0
+        self.fetcher.close()
+
+
+def test_rotated_session_client_is_closed_only_after_its_requests_finish(monkeypatch):
+    created = []
+    create_fetcher = proxy_pool.create_fetcher
+
+    def create_tracking_fetcher(*args, **kwargs):
+        created.append(TrackingFetcher(create_fetcher(*args, **kwargs)))
+        return created[-1]
+
+    monkeypatch.setattr(proxy_pool, 'create_fetcher', create_tracking_fetcher)
+
+    with LocalReviewServer(total_pages=2, reviews_per_page=2) as server, MockProxyServer(latency=0.5) as proxy:
+        pool = ProxyPool(proxy.url_template(), size=1)
+        fetcher = ProxiedFetcher(pool, 'requests', timeout=5)
+        first_session = pool.sessions[0]
+        pages = {}
+
+        # Worker 0 is mid-request on the only session when worker 1 gets it blocked
+        slow = threading.Thread(target=lambda: pages.update({0: fetcher.fetch(server.start_url, worker_id=0)}))
+        slow.start()
+        time.sleep(0.2)
+        proxy.block(first_session.session_id)
+        pages[1] = fetcher.fetch(server.start_url, worker_id=1)
+        slow.join()
+
+        assert first_session.retired
+        assert pages[0].status_code == 200 and pages[1].status_code == 200
+        assert created[0].closed
+        assert not created[0].closed_in_flight
+        fetcher.close()
+
+    assert all(tracked.closed for tracked in created)
+
+
+def test_crawl_through_rotating_proxy_sessions(tmp_path):
+    with LocalReviewServer(total_pages=8, reviews_per_page=3) as server, MockProxyServer(block_after=3) as proxy:
+        pool = ProxyPool(proxy.url_template(), size=2)
+        scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', concurrency=4, base_url=server.base_url,
+                                               proxy_pool=pool, output_formats=('json',))
+        scraper.scrape_all_reviews(max_pages=8, output_file=str(tmp_path / 'reviews.csv'), keep_reviews=False)
+
+    assert scraper.crawl_error is None
+    assert scraper.reviews_emitted == 24
+    assert pool.rotations > 0
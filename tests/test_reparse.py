@@ -0,0 +1,56 @@
+import json
+import os
+
+import pytest
+
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+from local_review_server import LocalReviewServer
+from page_archive import PageArchive
+from reparse import iter_reparsed_pages
+from review_fields import build_review_fields
+
+# Same markup as the default schema, but a different fingerprint
+SELECTORS = {'reviewer_name': {'tag': 'span', 'class': 'avatar-name', 'fallback': None}}
+
+
+def crawl_to_archive(tmp_path, **kwargs):
+    archive_dir = str(tmp_path / 'archive')
+    with LocalReviewServer(total_pages=2, reviews_per_page=3) as server:
+        scraper = LevisReviewsScraperMultiPage(fetch_backend='requests', base_url=server.base_url,
+                                               archive_dir=archive_dir, output_formats=('jsonl',), **kwargs)
+        scraper.scrape_all_reviews(max_pages=10, output_file=str(tmp_path / 'reviews.csv'), keep_reviews=False)
+    assert scraper.crawl_error is None
+    return scraper, archive_dir
+
+
+def reparsed_names(archive_dir):
+    return [review['reviewer_name'] for _, page_reviews in iter_reparsed_pages(archive_dir, workers=1)
+            for review in page_reviews]
+
+
+def test_reparse_uses_the_selectors_the_pages_were_crawled_with(tmp_path):
+    scraper, archive_dir = crawl_to_archive(tmp_path, review_fields=build_review_fields(SELECTORS))
+    assert scraper.schema_fingerprint != LevisReviewsScraperMultiPage().schema_fingerprint
+    assert {record['schema'] for record in PageArchive(archive_dir).iter_records()} == {scraper.schema_fingerprint}
+
+    with open(tmp_path / 'reviews.jsonl', encoding='utf-8') as f:
+        crawled = [json.loads(line)['reviewer_name'] for line in f]
+    assert len(crawled) == 6
+    assert reparsed_names(archive_dir) == crawled
+
+
+def test_reparse_refuses_a_schema_it_cannot_rebuild(tmp_path):
+    scraper, archive_dir = crawl_to_archive(tmp_path, review_fields=build_review_fields(SELECTORS))
+    schema_path = os.path.join(archive_dir, 'schemas', f'{scraper.schema_fingerprint}.json')
+    with open(schema_path, encoding='utf-8') as f:
+        selectors = json.load(f)
+    selectors['reviewer_name']['class'] = 'reviewer'
+    with open(schema_path, 'w', encoding='utf-8') as f:
+        json.dump(selectors, f)
+
+    with pytest.raises(ValueError, match='refusing to re-parse'):
+        reparsed_names(archive_dir)
+
+    os.remove(schema_path)
+    with pytest.raises(ValueError, match='refusing to re-parse'):
+        reparsed_names(archive_dir)
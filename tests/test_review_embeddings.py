@@ -0,0 +1,33 @@
+import pytest
+
+from review_embeddings import FaissVectorStore, NumpyVectorStore, dedupe_batch
+
+
+def test_dedupe_batch_keeps_last_copy():
+    ids, vectors, metadata = dedupe_batch(['a', 'b', 'a'], [[1, 0], [0, 1], [2, 0]], [{'n': 1}, {'n': 2}, {'n': 3}])
+    assert ids == ['b', 'a']
+    assert vectors == [[0, 1], [2, 0]]
+    assert metadata == [{'n': 2}, {'n': 3}]
+
+
+def test_numpy_store_upserts_duplicate_ids_in_one_batch(tmp_path):
+    pytest.importorskip('numpy')
+    store = NumpyVectorStore(str(tmp_path / 'vectors.npz'))
+    store.upsert(['a', 'a', 'b'], [[1, 0], [0, 1], [1, 1]], [{'v': 1}, {'v': 2}, {'v': 3}])
+    assert len(store) == 2
+    assert store.query([0, 1], top_k=1)[0][0] == 'a'
+
+    store.upsert(['c', 'c', 'a'], [[1, 0], [0, 1], [1, 0]], [{'v': 4}, {'v': 5}, {'v': 6}])
+    assert len(store) == 3
+    assert store.matrix.shape == (3, 2)
+    best_id, _, meta = store.query([1, 0], top_k=1)[0]
+    assert (best_id, meta) == ('a', {'v': 6})
+    store.close()
+    assert len(NumpyVectorStore(str(tmp_path / 'vectors.npz'))) == 3
+
+
+def test_faiss_store_upserts_duplicate_ids_in_one_batch():
+    pytest.importorskip('faiss')
+    store = FaissVectorStore(2)
+    store.upsert(['a' * 16, 'a' * 16, 'b' * 16], [[1, 0], [0, 1], [1, 1]], [{'v': 1}, {'v': 2}, {'v': 3}])
+    assert store.index.ntotal == 2
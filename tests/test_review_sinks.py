@@ -0,0 +1,40 @@
+import pytest
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+from review_sinks import ParquetSink
+
+
+def page(page_number, reviews=3):
+    return [{'review_title': f'Title {page_number}-{index}', 'review_text': f'Text {page_number}-{index}.',
+             'rating': 'N/A' if index == 0 else float(index), 'reviewer_name': 'Anonymous',
+             'review_date': 'Mar 04, 2023', 'user_recommendation': 'N/A', 'page_number': page_number,
+             'source_url': f'https://example.test/RT-P.html?page={page_number}'} for index in range(reviews)]
+
+
+def test_parquet_writes_a_row_group_every_flush_every_pages(tmp_path):
+    path = str(tmp_path / 'reviews.parquet')
+    sink = ParquetSink(path, flush_every=2)
+    for number in range(1, 6):
+        sink.write_page(page(number))
+        # Nothing is held back beyond the current flush_every window
+        assert len(sink.buffer) == (3 if number % 2 else 0)
+    sink.close()
+
+    parquet = pq.ParquetFile(path)
+    assert [parquet.metadata.row_group(index).num_rows for index in range(parquet.num_row_groups)] == [6, 6, 3]
+    rows = parquet.read().to_pylist()
+    expected = [review for number in range(1, 6) for review in page(number)]
+    for review in expected:
+        review['rating'] = None if review['rating'] == 'N/A' else review['rating']
+    assert [{key: row[key] for key in review} for row, review in zip(rows, expected)] == expected
+
+
+def test_parquet_row_group_size_bounds_the_buffer_between_flushes(tmp_path):
+    path = str(tmp_path / 'reviews.parquet')
+    with ParquetSink(path, row_group_size=5, flush_every=100) as sink:
+        for number in range(1, 5):
+            sink.write_page(page(number))
+
+    parquet = pq.ParquetFile(path)
+    assert [parquet.metadata.row_group(index).num_rows for index in range(parquet.num_row_groups)] == [6, 6]
@@ -0,0 +1,60 @@
+import glob
+import json
+
+from local_review_server import LocalReviewServer
+from run_sharded_scraper import main, shard_ranges
+
+
+def run(server, tmp_path, *extra):
+    return main(['--pages', '4', '--processes', '2', '--backend', 'requests', '--no-brightdata',
+                 '--start-url', server.start_url, '--output', str(tmp_path / 'reviews.csv'),
+                 '--format', 'jsonl', '--log-level', 'ERROR', *extra])
+
+
+def shard_files(tmp_path):
+    return sorted(path.rsplit('/', 1)[1] for path in glob.glob(str(tmp_path / 'reviews.shard-*')))
+
+
+def merged_reviews(tmp_path):
+    with open(tmp_path / 'reviews.jsonl', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_shard_ranges():
+    assert shard_ranges(1, 10, 3) == [(1, 4), (5, 7), (8, 10)]
+    assert shard_ranges(5, 6, 4) == [(5, 5), (6, 6)]
+
+
+def test_successful_run_merges_and_removes_shard_files(tmp_path):
+    with LocalReviewServer(total_pages=4, reviews_per_page=3) as server:
+        assert run(server, tmp_path) == 0
+    assert [review['page_number'] for review in merged_reviews(tmp_path)] == [1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4]
+    assert shard_files(tmp_path) == []
+
+
+def test_failed_shard_keeps_files_exits_non_zero_and_resumes(tmp_path):
+    with LocalReviewServer(total_pages=4, reviews_per_page=3) as server:
+        original_page_html = server.page_html
+        requested = []
+        page_4_down = [True]
+
+        def page_html(page_number):
+            requested.append(page_number)
+            if page_number == 4 and page_4_down[0]:
+                raise ConnectionAbortedError("page 4 is down")
+            return original_page_html(page_number)
+
+        server.page_html = page_html
+        assert run(server, tmp_path) == 1
+        assert shard_files(tmp_path) == ['reviews.shard-000.jsonl', 'reviews.shard-000.jsonl.checkpoint.json',
+                                         'reviews.shard-001.jsonl', 'reviews.shard-001.jsonl.checkpoint.json']
+        assert len(merged_reviews(tmp_path)) == 9
+
+        page_4_down[0] = False
+        requested.clear()
+        assert run(server, tmp_path, '--resume') == 0
+        # Only the failed page is fetched again
+        assert requested == [4]
+
+    assert [review['page_number'] for review in merged_reviews(tmp_path)] == [1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4]
+    assert shard_files(tmp_path) == []
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from local_review_server import LocalReviewServer
+from levis_reviews_scraper_multi_page import LevisReviewsScraperMultiPage
+from page_fetchers import FetchedPage, needs_javascript
+from proxy_pool import looks_blocked
+from review_fields import Locator
+from site_specs import SiteSpec, registrable_domain
+
+
+def custom_page(page_number, reviews=2):
+    items = ''.join(
+        f'<div class="review"><h2 class="title">Title {page_number}-{index}</h2>'
+        f'<div class="meta">Mar {index + 1:02d}, 2024 {index + 3}.0</div>'
+        f'<span class="author">Author {page_number}-{index}</span>'
+        f'<div class="review-body"><p>Body {page_number}-{index}.</p></div>'
+        f'<p class="verdict">User\'s recommendation: buy it.</p></div>'
+        for index in range(reviews)
+    )
+    return f"<html><body><main>{items}</main></body></html>"
+
+
+SELECTORS = {
+    'review_item': 'div.review',
+    'review_text': 'div.review-body',
+    'date_rating': 'div.meta',
+    'reviewer_name': {'tag': 'span', 'class': 'author', 'fallback': None},
+    'review_title': 'h2.title',
+    'user_recommendation': 'p.verdict',
+}
+
+
+@pytest.fixture
+def custom_server(tmp_path):
+    fixtures = tmp_path / 'fixtures'
+    fixtures.mkdir()
+    for page_number in (1, 2, 3):
+        (fixtures / f'page_{page_number}.html').write_text(custom_page(page_number), encoding='utf-8')
+    with LocalReviewServer(str(fixtures)) as server:
+        yield server
+
+
+@pytest.mark.parametrize('url, domain', [
+    ('https://levis.pissedconsumer.com/review.html', 'pissedconsumer.com'),
+    ('https://shop.example.co.uk/reviews', 'example.co.uk'),
+    ('https://www.store.example.com.au/', 'example.com.au'),
+    ('https://example.co.uk/', 'example.co.uk'),
+    ('https://co.uk/', 'co.uk'),
+    ('http://127.0.0.1:8000/review.html', '127.0.0.1:8000'),
+    ('http://localhost:8000/', 'localhost:8000'),
+])
+def test_registrable_domain(url, domain):
+    assert registrable_domain(url) == domain
+
+
+def test_locator_marker_and_css_selector():
+    assert Locator('div', 'review').marker == 'review'
+    assert Locator('div', 'review').css_selector() == 'div.review'
+    assert Locator('div', 'a b').css_selector() == 'div[class="a b"]'
+    assert Locator('span', class_contains='author').css_selector() == 'span[class*="author"]'
+
+
+def test_custom_markup_is_not_mistaken_for_js_or_block_pages():
+    html = custom_page(1)
+    assert needs_javascript(html)
+    assert not needs_javascript(html, 'review')
+    page = FetchedPage('http://example.com/', '<html>captcha ' + html[6:], 200)
+    assert looks_blocked(page)
+    assert not looks_blocked(page, 'review')
+
+
+@pytest.mark.parametrize('concurrency,fetch_controller', [(1, None), (1, True), (2, True)])
+def test_crawl_site_with_custom_markup(custom_server, tmp_path, concurrency, fetch_controller):
+    spec = SiteSpec('acme', custom_server.start_url, max_pages=10, concurrency=concurrency,
+                    selectors=dict(SELECTORS), output_formats=('json',))
+    scraper = LevisReviewsScraperMultiPage(fetch_controller=fetch_controller, **spec.scraper_kwargs())
+    output = tmp_path / 'acme.csv'
+    scraper.scrape_all_reviews(max_pages=spec.max_pages, output_file=str(output))
+
+    assert scraper.crawl_error is None
+    reviews = json.loads((tmp_path / 'acme.json').read_text(encoding='utf-8'))
+    assert len(reviews) == 6
+    assert reviews[0] == {
+        'review_text': 'Body 1-0.',
+        'review_date': 'Mar 01, 2024',
+        'rating': 3.0,
+        'reviewer_name': 'Author 1-0',
+        'review_title': 'Title 1-0',
+        'user_recommendation': "User's recommendation: buy it.",
+        'page_number': 1,
+        'source_url': custom_server.start_url,
+    }
+    assert [review['page_number'] for review in reviews] == [1, 1, 2, 2, 3, 3]